@@ -0,0 +1,204 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Tag dates read from stdin with holidays, see ``python -m holidays --help``."""
+
+import argparse
+import csv
+import io
+import sys
+import warnings
+from functools import lru_cache
+from itertools import chain
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from holidays.holiday_base import HolidayBase
+from holidays.utils import country_holidays, financial_holidays
+
+
+def _get_arg_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m holidays",
+        description=(
+            "Read dates from stdin (one per line, or CSV rows with a date column) and write "
+            "them to stdout as CSV rows tagged with the holiday name, the working day flag "
+            "and optionally the next working day."
+        ),
+    )
+    entity = arg_parser.add_mutually_exclusive_group(required=True)
+    entity.add_argument("-c", "--country", help="ISO 3166-1 alpha-2 country code")
+    entity.add_argument("-m", "--market", help="Financial market code")
+    arg_parser.add_argument("-s", "--subdiv", help="Subdivision code")
+    arg_parser.add_argument("-l", "--language", help="Language of the holiday names")
+    arg_parser.add_argument("--categories", nargs="+", help="Holiday categories (countries only)")
+    arg_parser.add_argument(
+        "--column",
+        help=(
+            "Read CSV rows and take the date from this column, either a 0-based index or "
+            "a name from the header row"
+        ),
+    )
+    arg_parser.add_argument("--delimiter", default=",", help="CSV delimiter (default: ',')")
+    arg_parser.add_argument(
+        "--next-working-day", action="store_true", help="Add the next working day column"
+    )
+    arg_parser.add_argument(
+        "--errors",
+        choices=("strict", "ignore"),
+        default="strict",
+        help="Stop at an invalid date (strict) or leave its tags empty (ignore)",
+    )
+    arg_parser.add_argument(
+        "--chunk-size",
+        default=10000,
+        help="Number of rows written to stdout at once (default: 10000)",
+        type=int,
+    )
+
+    return arg_parser
+
+
+class DateTagger:
+    """Tags dates with holidays of a single entity.
+
+    The holidays object calculates each year once for the whole run and the
+    tags of recently seen date values are cached, so repeated dates (e.g. in
+    logs) are neither parsed nor looked up again.
+    """
+
+    def __init__(
+        self, holidays: HolidayBase, next_working_day: bool = False, ignore_errors: bool = False
+    ) -> None:
+        self.holidays = holidays
+        self.next_working_day = next_working_day
+        self.ignore_errors = ignore_errors
+        self.get_tags = lru_cache(maxsize=65536)(self._get_tags)
+
+    @property
+    def header(self) -> List[str]:
+        """Names of the tag columns."""
+        header = ["holiday", "working_day"]
+        if self.next_working_day:
+            header.append("next_working_day")
+
+        return header
+
+    def _get_tags(self, value: str) -> Tuple[str, ...]:
+        holidays = self.holidays
+        try:
+            dt = holidays.__keytransform__(value.strip())
+            tags = [holidays.get(dt, ""), "1" if holidays.is_working_day(dt) else "0"]
+            if self.next_working_day:
+                tags.append(holidays.get_nth_working_day(dt, 1).isoformat())
+        except (NotImplementedError, ValueError) as e:
+            if self.ignore_errors:
+                return ("",) * len(self.header)
+            # E.g., a year the entity's holidays can't be calculated for.
+            if isinstance(e, NotImplementedError):
+                raise ValueError(f"Cannot calculate holidays for date '{value.strip()}'") from e
+            raise
+
+        return tuple(tags)
+
+    def tag_rows(self, rows: Iterable[List[str]], column: int) -> Iterator[List[str]]:
+        """Append the tags of the `column` date to each row."""
+        get_tags = self.get_tags
+        for row in rows:
+            yield [*row, *get_tags(row[column] if column < len(row) else "")]
+
+
+def _write_rows(
+    rows: Iterable[List[str]], output: IO[str], delimiter: str, chunk_size: int
+) -> None:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter, lineterminator="\n")
+    try:
+        for idx, row in enumerate(rows, 1):
+            writer.writerow(row)
+            if idx % chunk_size == 0:
+                output.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+    finally:  # Keep the rows tagged before an error.
+        output.write(buffer.getvalue())
+        output.flush()
+
+
+def main(
+    argv: Optional[Sequence[str]] = None,
+    stdin: Optional[IO[str]] = None,
+    stdout: Optional[IO[str]] = None,
+) -> int:
+    """Run the command line interface.
+
+    :param argv:
+        The command line arguments, defaults to :data:`sys.argv`.
+
+    :param stdin:
+        The input stream, defaults to :data:`sys.stdin`.
+
+    :param stdout:
+        The output stream, defaults to :data:`sys.stdout`.
+
+    :return:
+        The exit status.
+    """
+    arg_parser = _get_arg_parser()
+    args = arg_parser.parse_args(argv)
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    if args.chunk_size < 1:
+        arg_parser.error("chunk size must be a positive integer")
+
+    try:
+        if args.country:
+            holidays = country_holidays(
+                args.country,
+                subdiv=args.subdiv,
+                language=args.language,
+                categories=args.categories,
+            )
+        else:
+            holidays = financial_holidays(args.market, subdiv=args.subdiv, language=args.language)
+    except (NotImplementedError, ValueError) as e:
+        arg_parser.error(str(e))
+
+    tagger = DateTagger(holidays, args.next_working_day, args.errors == "ignore")
+    header: Optional[List[str]] = None
+    if args.column is None:
+        column = 0
+        rows: Iterator[List[str]] = ([line.rstrip("\r\n")] for line in stdin if line.strip())
+    else:
+        rows = csv.reader(stdin, delimiter=args.delimiter)
+        if args.column.isdigit():
+            column = int(args.column)
+        else:
+            header = next(rows, [])
+            if args.column not in header:
+                arg_parser.error(f"column '{args.column}' not found in the header row")
+            column = header.index(args.column)
+
+    tagged_rows = tagger.tag_rows(rows, column)
+    if header is not None:
+        tagged_rows = chain(([*header, *tagger.header],), tagged_rows)
+
+    try:
+        _write_rows(tagged_rows, stdout, args.delimiter, args.chunk_size)
+    except ValueError as e:
+        arg_parser.exit(1, f"error: {e}\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    sys.exit(main())
@@ -0,0 +1,210 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = ("AsyncHolidays",)
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from holidays.helpers import _normalize_arguments
+from holidays.holiday_base import CategoryArg, DateLike, HolidayBase, YearArg
+from holidays.utils import _entity_holidays
+
+EntityKey = Tuple[str, Optional[str]]
+HolidayQuery = Tuple[str, Optional[str], DateLike]
+
+
+class AsyncHolidays:
+    """
+    An asyncio-friendly facade over :py:func:`holidays.utils.country_holidays`
+    and :py:func:`holidays.utils.financial_holidays`.
+
+    Creating entity objects (which loads translations) and calculating years
+    of holidays is done in an executor, so the event loop is never blocked by
+    a cold lookup. Concurrent requests for the same entity or the same
+    (entity, year) pair are coalesced into a single computation. Lookups for
+    already calculated years are served without leaving the event loop.
+
+    The entity objects are shared between all coroutines, so a process pool
+    executor can't be used.
+
+    Example usage:
+
+    >>> from holidays.aio import AsyncHolidays
+    >>> async_holidays = AsyncHolidays()
+    >>> await async_holidays.get("US", "2024-07-04")
+    'Independence Day'
+    >>> await async_holidays.get_many((("US", "CA", "2024-03-31"), ("NYSE", None, "2024-03-29")))
+    ['Cesar Chavez Day', 'Good Friday']
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        observed: bool = True,
+        language: Optional[str] = None,
+        categories: Optional[CategoryArg] = None,
+    ) -> None:
+        """
+        :param executor:
+            The executor to run computations in. Defaults to the event loop's
+            default executor.
+
+        :param observed:
+            Whether to include the dates of when public holiday are observed.
+
+        :param language:
+            The language which the returned holiday names will be translated
+            into.
+
+        :param categories:
+            Requested holiday categories (ignored for financial markets).
+        """
+        self.executor = executor
+        self.observed = observed
+        self.language = language
+        self.categories = categories
+
+        self._entities: Dict[EntityKey, HolidayBase] = {}
+        self._pending: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    def _create_entity(self, entity_code: str, subdiv: Optional[str]) -> HolidayBase:
+        # The years are calculated explicitly, see `_populate_year()`.
+        return _entity_holidays(
+            entity_code,
+            subdiv=subdiv,
+            expand=False,
+            observed=self.observed,
+            language=self.language,
+            categories=self.categories,
+        )
+
+    async def _run_once(self, key: Hashable, func: Callable[..., Any], *args) -> Any:
+        """Run `func` in the executor unless a computation for the same key
+        is already in progress, in which case wait for its result."""
+        if (future := self._pending.get(key)) is None:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+            self._pending[key] = future
+            future.add_done_callback(lambda _: self._pending.pop(key, None))
+
+        # Cancellation of a single waiter must not cancel the shared computation.
+        return await asyncio.shield(future)
+
+    async def _get_entity(self, entity_code: str, subdiv: Optional[str]) -> HolidayBase:
+        if (entity := self._entities.get((entity_code, subdiv))) is None:
+            entity = await self._run_once(
+                ("entity", entity_code, subdiv), self._create_entity, entity_code, subdiv
+            )
+            self._entities.setdefault((entity_code, subdiv), entity)
+
+        return self._entities[(entity_code, subdiv)]
+
+    async def _populate_year(self, entity: HolidayBase, year: int) -> None:
+        if year not in entity.years:
+            # Aliases share entity codes, the objects are kept in `_entities`
+            # so their ids are stable.
+            await self._run_once(("year", id(entity), year), entity._populate_year, year)
+
+    async def get_holidays(
+        self, entity_code: str, subdiv: Optional[str] = None, years: Optional[YearArg] = None
+    ) -> HolidayBase:
+        """Return the shared holidays object of an entity with the requested
+        years calculated.
+
+        The returned object doesn't calculate years on demand (its `expand`
+        attribute is False), request them using this method instead.
+
+        :param entity_code:
+            An ISO 3166-1 alpha-2 country code or a market code.
+
+        :param subdiv:
+            The subdivision code or its alias.
+
+        :param years:
+            The year(s) to calculate.
+
+        :return:
+            A :py:class:`HolidayBase` object.
+        """
+        entity = await self._get_entity(entity_code, subdiv)
+        missing_years = _normalize_arguments(int, years) - entity.years
+        if missing_years:
+            await asyncio.gather(*(self._populate_year(entity, year) for year in missing_years))
+
+        return entity
+
+    async def get(
+        self, entity_code: str, key: DateLike, subdiv: Optional[str] = None, default: Any = None
+    ) -> Any:
+        """Return the holiday name for a date if the date is a holiday, else
+        **default**.
+
+        :param entity_code:
+            An ISO 3166-1 alpha-2 country code or a market code.
+
+        :param key:
+            The date expressed in one of the types accepted by
+            :py:class:`HolidayBase`.
+
+        :param subdiv:
+            The subdivision code or its alias.
+
+        :param default:
+            The default value to return if the date is not a holiday.
+        """
+        entity = await self._get_entity(entity_code, subdiv)
+        dt = entity.__keytransform__(key)
+        await self._populate_year(entity, dt.year)
+
+        return dict.get(entity, dt, default)
+
+    async def get_many(self, queries: Iterable[HolidayQuery], default: Any = None) -> List[Any]:
+        """Return holiday names for multiple (entity code, subdivision, date)
+        tuples. Cold entities and years required by the queries are
+        calculated concurrently, each of them only once.
+
+        :param queries:
+            An iterable of (entity code, subdivision, date) tuples.
+
+        :param default:
+            The default value to return for dates that are not holidays.
+
+        :return:
+            A list of holiday names (or **default**) in the order of
+            **queries**.
+        """
+        return await asyncio.gather(
+            *(
+                self.get(entity_code, key, subdiv=subdiv, default=default)
+                for entity_code, subdiv, key in queries
+            )
+        )
+
+    def get_nowait(
+        self, entity_code: str, key: DateLike, subdiv: Optional[str] = None, default: Any = None
+    ) -> Any:
+        """Return the holiday name for a date if the date is a holiday, else
+        **default**, without awaiting.
+
+        :raise:
+            LookupError if the entity or the year hasn't been calculated yet
+            (see :py:meth:`get` and :py:meth:`get_holidays`).
+        """
+        if (entity := self._entities.get((entity_code, subdiv))) is None:
+            raise LookupError(f"Entity `{entity_code}` ({subdiv}) is not loaded yet.")
+
+        dt = entity.__keytransform__(key)
+        if dt.year not in entity.years:
+            raise LookupError(f"Year {dt.year} of entity `{entity_code}` is not calculated yet.")
+
+        return dict.get(entity, dt, default)
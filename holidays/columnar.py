@@ -0,0 +1,278 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = ("ColumnarExporter",)
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple, Union
+
+from holidays.helpers import _normalize_arguments
+from holidays.holiday_base import HolidayBase, YearArg
+from holidays.l10n import HolidayName, split_names
+from holidays.registry import EntityLoader
+from holidays.utils import _entity_holidays, _populate_years
+
+COLUMNS = ("date", "entity", "subdiv", "category", "name", "observed")
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+OBSERVED_LABELS = ("observed_label", "observed_label_before", "observed_estimated_label")
+
+# Column name -> values, dates are stored as days since 1970-01-01.
+RecordBatch = Dict[str, Any]
+EntityKey = Tuple[str, Optional[str], str]
+
+
+def _new_batch() -> RecordBatch:
+    return {
+        "date": array("i"),
+        "entity": [],
+        "subdiv": [],
+        "category": [],
+        "name": [],
+        "observed": [],
+    }
+
+
+class ColumnarExporter:
+    """
+    Exports holidays of multiple entities, subdivisions and categories as
+    columnar record batches.
+
+    A record batch is a dict of columns: ``date`` (an ``array('i')`` of days
+    since 1970-01-01, i.e. Arrow's ``date32`` representation), ``entity``,
+    ``subdiv``, ``category``, ``name`` (lists of strings) and ``observed`` (a
+    list of booleans, True for the observed dates of holidays). Each holiday
+    name of a date is a separate row.
+
+    The holidays objects are kept by the exporter, so the years calculated by
+    an export are reused by the following ones. Converting batches to Arrow
+    tables and Parquet files requires `pyarrow` to be installed.
+
+    Example usage:
+
+    >>> from holidays.columnar import ColumnarExporter
+    >>> exporter = ColumnarExporter(("US", "CA", "NYSE"))
+    >>> for batch in exporter.iter_batches(years=range(1950, 2051)):
+    ...     pass
+    >>> exporter.write_parquet("holidays.parquet", years=range(1950, 2051))
+    """
+
+    def __init__(
+        self,
+        entities: Optional[Iterable[str]] = None,
+        subdivisions: bool = True,
+        observed: bool = True,
+        language: Optional[str] = None,
+        batch_size: int = 65536,
+        max_workers: Optional[int] = 1,
+    ) -> None:
+        """
+        :param entities:
+            Country and/or market codes to export. Defaults to all supported
+            countries and markets.
+
+        :param subdivisions:
+            Whether to export each subdivision's holidays in addition to the
+            entity common holidays (exported with an empty ``subdiv``).
+
+        :param observed:
+            Whether to include the dates of when public holiday are observed.
+
+        :param language:
+            The language which the holiday names will be translated into.
+
+        :param batch_size:
+            The maximum number of rows in a record batch.
+
+        :param max_workers:
+            The maximum number of worker processes calculating the missing
+            years before the export starts (see
+            :py:class:`concurrent.futures.ProcessPoolExecutor`). If set to 1,
+            the years are calculated in the current process while exporting.
+        """
+        if entities is None:
+            entities = (
+                *EntityLoader.get_country_codes(include_aliases=False),
+                *EntityLoader.get_financial_codes(include_aliases=False),
+            )
+
+        self.entities = tuple(entities)
+        self.subdivisions = subdivisions
+        self.observed = observed
+        self.language = language
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self._holidays: Dict[EntityKey, HolidayBase] = {}
+
+    def _get_kwargs(self, key: EntityKey) -> Dict[str, Any]:
+        _, subdiv, category = key
+        return {
+            "categories": category,
+            "language": self.language,
+            "observed": self.observed,
+            "subdiv": subdiv,
+        }
+
+    def _get_holidays(self, key: EntityKey) -> HolidayBase:
+        try:
+            return self._holidays[key]
+        except KeyError:
+            holidays = self._holidays[key] = _entity_holidays(key[0], **self._get_kwargs(key))
+            return holidays
+
+    def _iter_entity_keys(self) -> Iterator[EntityKey]:
+        for entity_code in self.entities:
+            entity = _entity_holidays(entity_code)
+            subdivs = (None, *entity.subdivisions) if self.subdivisions else (None,)
+            for subdiv in subdivs:
+                for category in sorted(entity.supported_categories):
+                    yield entity_code, subdiv, category
+
+    def _populate_in_workers(self, keys: Iterable[EntityKey], years: FrozenSet[int]) -> None:
+        tasks = [(key, sorted(years - self._get_holidays(key).years)) for key in keys]
+        tasks = [(key, missing_years) for key, missing_years in tasks if missing_years]
+        if not tasks:
+            return None
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                (
+                    key,
+                    executor.submit(_populate_years, key[0], self._get_kwargs(key), missing_years),
+                )
+                for key, missing_years in tasks
+            ]
+            for key, future in futures:
+                self._get_holidays(key)._load_years(future.result())
+
+    def iter_batches(self, years: YearArg) -> Iterator[RecordBatch]:
+        """Generate the record batches.
+
+        :param years:
+            The years to export.
+
+        :return:
+            A generator of record batches of at most `batch_size` rows.
+        """
+        export_years: FrozenSet[int] = frozenset(_normalize_arguments(int, years))
+        keys = list(self._iter_entity_keys())
+        if self.max_workers != 1:
+            self._populate_in_workers(keys, export_years)
+
+        batch = _new_batch()
+        dates, entities, subdivs, categories, names, observed = batch.values()
+
+        for key in keys:
+            entity_code, subdiv, category = key
+            holidays = self._get_holidays(key)
+            for year in sorted(export_years - holidays.years):
+                holidays._populate_year(year)
+
+            observed_labels = {
+                getattr(holidays, label) for label in OBSERVED_LABELS if hasattr(holidays, label)
+            }
+            for dt in sorted(dt for dt in holidays if dt.year in export_years):
+                for name in split_names(holidays[dt]):
+                    dates.append(dt.toordinal() - EPOCH_ORDINAL)
+                    entities.append(entity_code)
+                    subdivs.append(subdiv)
+                    categories.append(category)
+                    names.append(str(name))
+                    # Observed names are built from the observed label templates.
+                    observed.append(
+                        isinstance(name, HolidayName)
+                        and name.key[0] == "%"
+                        and getattr(name.key[1], "key", None) in observed_labels
+                    )
+
+                    if len(dates) >= self.batch_size:
+                        yield batch
+                        batch = _new_batch()
+                        dates, entities, subdivs, categories, names, observed = batch.values()
+
+        if dates:
+            yield batch
+
+    def iter_arrow_batches(self, years: YearArg) -> Iterator[Any]:
+        """Generate the record batches as :class:`pyarrow.RecordBatch`
+        objects. Requires `pyarrow` to be installed.
+
+        :param years:
+            The years to export.
+
+        :return:
+            A generator of :class:`pyarrow.RecordBatch` objects.
+        """
+        import pyarrow as pa
+
+        schema = self.get_arrow_schema()
+        for batch in self.iter_batches(years):
+            dates = batch["date"]
+            yield pa.RecordBatch.from_arrays(
+                [
+                    # The dates array is used without copying.
+                    pa.Array.from_buffers(pa.date32(), len(dates), [None, pa.py_buffer(dates)]),
+                    *(
+                        pa.array(batch[column], type=schema.field(column).type)
+                        for column in COLUMNS[1:]
+                    ),
+                ],
+                schema=schema,
+            )
+
+    @staticmethod
+    def get_arrow_schema() -> Any:
+        """Return the :class:`pyarrow.Schema` of the exported data. Requires
+        `pyarrow` to be installed."""
+        import pyarrow as pa
+
+        return pa.schema(
+            (
+                pa.field("date", pa.date32(), nullable=False),
+                pa.field("entity", pa.string(), nullable=False),
+                pa.field("subdiv", pa.string()),
+                pa.field("category", pa.string(), nullable=False),
+                pa.field("name", pa.string(), nullable=False),
+                pa.field("observed", pa.bool_(), nullable=False),
+            )
+        )
+
+    def to_arrow(self, years: YearArg) -> Any:
+        """Return the exported data as a :class:`pyarrow.Table`. Requires
+        `pyarrow` to be installed.
+
+        :param years:
+            The years to export.
+        """
+        import pyarrow as pa
+
+        return pa.Table.from_batches(
+            self.iter_arrow_batches(years), schema=self.get_arrow_schema()
+        )
+
+    def write_parquet(self, file_path: Union[str, Path], years: YearArg) -> None:
+        """Write the exported data into a Parquet file batch by batch.
+        Requires `pyarrow` to be installed.
+
+        :param file_path:
+            The Parquet file path.
+
+        :param years:
+            The years to export.
+        """
+        import pyarrow.parquet as pq
+
+        with pq.ParquetWriter(file_path, self.get_arrow_schema()) as writer:
+            for batch in self.iter_arrow_batches(years):
+                writer.write_batch(batch)
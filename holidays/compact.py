@@ -0,0 +1,253 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = ("CompactHolidays",)
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from threading import RLock
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Set, Tuple, Union
+
+from holidays.holiday_base import DateLike, HolidayBase
+from holidays.l10n import join_names, split_names
+
+
+class CompactHolidays(Mapping[date, str]):
+    """
+    A read-only, memory efficient storage of holidays.
+
+    Holidays of all populated years are stored as a single sorted
+    ``array('i')`` of date ordinals and a parallel ``array('I')`` of indices
+    into the table of holiday names, which is several times smaller than a
+    :py:class:`HolidayBase` dictionary.
+    Lookups accept the same key types and slices as :py:class:`HolidayBase`,
+    and missing years are calculated on demand if the source object's
+    `expand` attribute is True.
+
+    Example usage:
+
+    >>> from holidays import country_holidays
+    >>> from holidays.compact import CompactHolidays
+    >>> us_holidays = CompactHolidays(country_holidays("US", years=range(1950, 2051)))
+    >>> us_holidays.get("2024-07-04")
+    'Independence Day'
+    >>> ordinals, name_indices = us_holidays.get_arrays()
+
+    The arrays support the buffer protocol, e.g.
+    ``numpy.frombuffer(ordinals, dtype=numpy.intc)`` is a zero-copy view.
+    """
+
+    expand: bool
+    """Whether to calculate holidays for years that aren't populated yet."""
+    names: List[str]
+    """Unique holiday names referenced by the name indices arrays."""
+
+    def __init__(self, holidays: HolidayBase) -> None:
+        """
+        :param holidays:
+            A populated holidays object. Its holidays are copied, the object
+            itself isn't referenced afterwards.
+        """
+        self.expand = holidays.expand
+        self.names = []
+        self._name_indices: Dict[str, int] = {}
+        self._lock = RLock()
+
+        # An empty copy of the source object used to calculate more years.
+        self._entity = holidays.__class__.__new__(holidays.__class__)
+        self._entity.__dict__.update(holidays.__dict__)
+        self._entity._init_populate_lock()
+        self._entity._cache = None
+        self._entity.expand = False
+        self._entity.weekend_workdays = set()
+        self._entity._changed_dates = set()
+        self._entity.years = set()
+
+        # The date ordinals and name indices arrays are replaced together when
+        # more years are calculated, readers never see a partial update.
+        items = sorted((dt.toordinal(), name) for dt, name in holidays.items())
+        self._arrays: Tuple["array[int]", "array[int]"] = (
+            array("i", (ordinal for ordinal, _ in items)),
+            array("I", (self._get_name_index(name) for _, name in items)),
+        )
+        # Only the calculated years are complete, the years of any other
+        # holidays (e.g. added ones) are calculated on demand all the same.
+        self._years: Set[int] = set(holidays.years)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (date, float, int, str)):
+            raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+
+        return self._find(self.__keytransform__(key)) is not None
+
+    def __getitem__(self, key: Union[DateLike, slice]) -> Any:
+        if isinstance(key, slice):
+            return self._get_slice(key)
+
+        dt = self.__keytransform__(key)
+        name_index = self._find(dt)
+        if name_index is None:
+            raise KeyError(dt)
+
+        return self.names[name_index]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __iter__(self) -> Iterator[date]:
+        for ordinal in self._arrays[0]:
+            yield date.fromordinal(ordinal)
+
+    def __keytransform__(self, key: DateLike) -> date:
+        # The entity doesn't expand, so this is a pure conversion.
+        return self._entity.__keytransform__(key)
+
+    def __len__(self) -> int:
+        return len(self._arrays[0])
+
+    def __repr__(self) -> str:
+        return f"CompactHolidays({self._entity!r})"
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = RLock()
+
+    def _find(self, dt: date) -> Union[int, None]:
+        """Return the name index of a date or None if it's not a holiday."""
+        if self.expand and dt.year not in self._years:
+            self._populate_year(dt.year)
+
+        ordinals, name_ids = self._arrays
+        ordinal = dt.toordinal()
+        idx = bisect_left(ordinals, ordinal)
+        if idx < len(ordinals) and ordinals[idx] == ordinal:
+            return name_ids[idx]
+
+        return None
+
+    def _get_name_index(self, name: str) -> int:
+        try:
+            return self._name_indices[name]
+        except KeyError:
+            self.names.append(name)
+            name_index = self._name_indices[name] = len(self.names) - 1
+            return name_index
+
+    def _get_slice(self, key: slice) -> List[date]:
+        # Same semantics as HolidayBase slices.
+        if not key.start or not key.stop:
+            raise ValueError("Both start and stop must be given.")
+
+        start = self.__keytransform__(key.start)
+        stop = self.__keytransform__(key.stop)
+
+        if key.step is None:
+            step = 1
+        elif isinstance(key.step, timedelta):
+            step = key.step.days
+        elif isinstance(key.step, int):
+            step = key.step
+        else:
+            raise TypeError(f"Cannot convert type '{type(key.step)}' to int.")
+
+        if step == 0:
+            raise ValueError("Step value must not be zero.")
+
+        date_diff = (stop - start).days
+        if date_diff < 0 <= step or date_diff >= 0 > step:
+            step *= -1
+
+        offsets = range(0, date_diff, step)
+        if not offsets:
+            return []
+
+        start_ordinal = start.toordinal()
+        low, high = sorted((start_ordinal + offsets[0], start_ordinal + offsets[-1]))
+        if self.expand:
+            for year in range(date.fromordinal(low).year, date.fromordinal(high).year + 1):
+                self._populate_year(year)
+
+        all_ordinals = self._arrays[0]
+        ordinals = [
+            ordinal
+            for ordinal in all_ordinals[
+                bisect_left(all_ordinals, low) : bisect_right(all_ordinals, high)
+            ]
+            if (ordinal - start_ordinal) % step == 0
+        ]
+
+        return [
+            date.fromordinal(ordinal) for ordinal in (ordinals if step > 0 else ordinals[::-1])
+        ]
+
+    def _populate_year(self, year: int) -> None:
+        with self._lock:
+            if year in self._years:
+                return None
+
+            entity = self._entity
+            entity._load_or_populate(year)
+            items = [(dt.toordinal(), name) for dt, name in entity.items() if dt.year == year]
+            dict.clear(entity)
+            self._store_year(year, items)
+            self._years.add(year)
+
+    def _store_year(self, year: int, items: Iterable[Tuple[int, str]]) -> None:
+        ordinals, name_ids = self._arrays
+        start = bisect_left(ordinals, date(year, 1, 1).toordinal())
+        end = bisect_right(ordinals, date(year, 12, 31).toordinal())
+
+        # Holidays already stored for this year (e.g. added ones) are kept.
+        names = {ordinals[idx]: self.names[name_ids[idx]] for idx in range(start, end)}
+        for ordinal, name in items:
+            names[ordinal] = join_names((names[ordinal], name)) if ordinal in names else name
+
+        # Keep the arrays sorted, years may be calculated in any order.
+        year_ordinals = sorted(names)
+        self._arrays = (
+            ordinals[:start] + array("i", year_ordinals) + ordinals[end:],
+            name_ids[:start]
+            + array("I", (self._get_name_index(names[o]) for o in year_ordinals))
+            + name_ids[end:],
+        )
+
+    @property
+    def years(self) -> Set[int]:
+        """The populated years."""
+        return self._years.copy()
+
+    def get_arrays(self, *years: int) -> Tuple["array[int]", "array[int]"]:
+        """Return the storage arrays of all populated years.
+
+        The arrays are returned without copying and they must not be
+        modified. Calculating more years replaces them with new arrays, the
+        returned ones are left as they are.
+
+        :param years:
+            Years to calculate first if they aren't populated yet.
+
+        :return:
+            A tuple of a sorted ``array('i')`` of date ordinals and an
+            ``array('I')`` of the corresponding indices into :py:attr:`names`.
+        """
+        for year in years:
+            self._populate_year(year)
+
+        return self._arrays
+
+    def get_list(self, key: DateLike) -> List[str]:
+        """Return a list of all holiday names for a date if the date is a
+        holiday, otherwise an empty list."""
+        return split_names(self.get(self.__keytransform__(key), ""))
@@ -33,6 +33,7 @@ from holidays.calendars.gregorian import (
     SUN,
 )
 from holidays.groups import ChineseCalendarHolidays, InternationalHolidays, StaticHolidays
+from holidays.l10n import neutral_sort_key
 from holidays.observed_holiday_base import (
     ObservedHolidayBase,
     ObservedRule,
@@ -87,7 +88,7 @@ class Taiwan(ObservedHolidayBase, ChineseCalendarHolidays, InternationalHolidays
 
         childrens_day = self.tr("兒童節")
         for dt in sorted(dts):
-            names = self.get_list(dt)
+            names = sorted(self.get_list(dt), key=neutral_sort_key)
             for name in names:
                 self._add_observed(
                     dt,
@@ -14,6 +14,7 @@ from datetime import date
 from typing import Optional, Tuple
 
 from holidays.calendars import _BuddhistLunisolar
+from holidays.helpers import _get_shared_instance
 
 
 class BuddhistCalendarHolidays:
@@ -22,7 +23,7 @@ class BuddhistCalendarHolidays:
     """
 
     def __init__(self, cls=None, show_estimated=False) -> None:
-        self._buddhist_calendar = cls() if cls else _BuddhistLunisolar()
+        self._buddhist_calendar = _get_shared_instance(cls or _BuddhistLunisolar)
         self._buddhist_calendar_show_estimated = show_estimated
 
     def _add_buddhist_calendar_holiday(
@@ -15,6 +15,7 @@ from typing import Optional, Tuple
 
 from holidays.calendars import _ChineseLunisolar
 from holidays.calendars.gregorian import APR, _timedelta
+from holidays.helpers import _get_shared_instance
 
 
 class ChineseCalendarHolidays:
@@ -23,7 +24,7 @@ class ChineseCalendarHolidays:
     """
 
     def __init__(self, cls=None, show_estimated=False) -> None:
-        self._chinese_calendar = cls() if cls else _ChineseLunisolar()
+        self._chinese_calendar = _get_shared_instance(cls or _ChineseLunisolar)
         self._chinese_calendar_show_estimated = show_estimated
 
     @property
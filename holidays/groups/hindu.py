@@ -14,6 +14,7 @@ from datetime import date
 from typing import Optional, Tuple
 
 from holidays.calendars import _HinduLunisolar
+from holidays.helpers import _get_shared_instance
 
 
 class HinduCalendarHolidays:
@@ -22,7 +23,7 @@ class HinduCalendarHolidays:
     """
 
     def __init__(self, cls=None, show_estimated=False) -> None:
-        self._hindu_calendar = cls() if cls else _HinduLunisolar()
+        self._hindu_calendar = _get_shared_instance(cls or _HinduLunisolar)
         self._hindu_calendar_show_estimated = show_estimated
 
     def _add_hindu_calendar_holiday(
@@ -15,6 +15,7 @@ from typing import Iterable, Set, Tuple
 
 from holidays.calendars import _IslamicLunar
 from holidays.calendars.gregorian import _timedelta
+from holidays.helpers import _get_shared_instance
 
 
 class IslamicHolidays:
@@ -26,7 +27,7 @@ class IslamicHolidays:
     """
 
     def __init__(self, cls=None) -> None:
-        self._islamic_calendar = cls() if cls else _IslamicLunar()
+        self._islamic_calendar = _get_shared_instance(cls or _IslamicLunar)
 
     def _add_ali_al_rida_death_day(self, name) -> Set[date]:
         """
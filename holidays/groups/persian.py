@@ -15,6 +15,7 @@ from typing import Optional
 
 from holidays.calendars.gregorian import _timedelta
 from holidays.calendars.persian import _Persian
+from holidays.helpers import _get_shared_instance
 
 
 class PersianCalendarHolidays:
@@ -23,7 +24,7 @@ class PersianCalendarHolidays:
     """
 
     def __init__(self) -> None:
-        self._persian_calendar = _Persian()
+        self._persian_calendar = _get_shared_instance(_Persian)
 
     def _add_death_of_khomeini_day(self, name: str) -> Optional[date]:
         """
@@ -14,6 +14,7 @@ from datetime import date
 from typing import Optional
 
 from holidays.calendars.thai import THAI_CALENDAR, _ThaiLunisolar
+from holidays.helpers import _get_shared_instance
 
 
 class ThaiCalendarHolidays:
@@ -26,7 +27,7 @@ class ThaiCalendarHolidays:
 
     def __init__(self, calendar=THAI_CALENDAR) -> None:
         self.__calendar = calendar
-        self._thai_calendar = _ThaiLunisolar(calendar)
+        self._thai_calendar = _get_shared_instance(_ThaiLunisolar, calendar)
 
     def _add_asarnha_bucha(self, name) -> Optional[date]:
         """
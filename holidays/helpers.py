@@ -11,6 +11,25 @@
 #  License: MIT (see LICENSE file)
 
 
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _get_shared_instance(cls, *args):
+    """Get a shared instance of a stateless helper class.
+
+    :param cls:
+        The helper class, e.g., a lunisolar calendar.
+
+    :param args:
+        The constructor arguments.
+
+    :return:
+        The same `cls` instance for all calls with the same arguments.
+    """
+    return cls(*args)
+
+
 def _normalize_arguments(cls, value):
     """Normalize arguments.
 
@@ -47,3 +66,23 @@ def _normalize_tuple(value):
         An object put into a tuple otherwise, e.g., ((JAN, 10),).
     """
     return value if not value or isinstance(value[0], tuple) else (value,)
+
+
+def _years_to_ranges(years):
+    """Convert years to ranges.
+
+    :param years:
+        An iterable of years.
+
+    :return:
+        A tuple of (start, stop) tuples of consecutive years ranges, e.g.,
+        ((1950, 2051),) for years 1950-2050.
+    """
+    ranges = []
+    for year in sorted(years):
+        if ranges and ranges[-1][1] == year:
+            ranges[-1][1] = year + 1
+        else:
+            ranges.append([year, year + 1])
+
+    return tuple((start, stop) for start, stop in ranges)
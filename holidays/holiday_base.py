@@ -14,12 +14,27 @@ __all__ = ("DateLike", "HolidayBase", "HolidaySum")
 
 import copy
 import warnings
+from array import array
+from bisect import bisect_left, bisect_right
 from calendar import isleap
-from datetime import date, datetime, timedelta, timezone
-from functools import cached_property
-from gettext import gettext, translation
-from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
+from datetime import MAXYEAR, MINYEAR, date, datetime, timedelta, timezone
+from functools import cached_property, partial
+from itertools import chain
+from threading import RLock
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from dateutil.parser import parse
 
@@ -39,7 +54,15 @@ from holidays.calendars.gregorian import (
     WEEKDAYS,
 )
 from holidays.constants import HOLIDAY_NAME_DELIMITER, PUBLIC
-from holidays.helpers import _normalize_arguments, _normalize_tuple
+from holidays.helpers import _normalize_arguments, _normalize_tuple, _years_to_ranges
+from holidays.l10n import (
+    DEFAULT_TRANSLATOR,
+    Translator,
+    format_date,
+    get_translator,
+    join_names,
+    split_names,
+)
 
 CategoryArg = Union[str, Iterable[str]]
 DateArg = Union[date, Tuple[int, int]]
@@ -50,6 +73,23 @@ SubstitutedHoliday = Union[
     Tuple[Union[Tuple[int, int, int, int], Tuple[int, int, int, int, int]], ...],
 ]
 YearArg = Union[int, Iterable[int]]
+YearsPayload = Tuple[
+    Tuple[int, ...],  # Years.
+    "array[int]",  # Holiday dates as ordinals.
+    Tuple[str, ...],  # Holiday names.
+    "array[int]",  # Weekend working days as ordinals.
+    Tuple[int, ...],  # Weekend days.
+]
+
+# Attributes whose change requires re-populating or re-translating holidays.
+CONFIGURATION_ATTRIBUTES = frozenset(("categories", "language", "observed", "subdiv"))
+
+# The number of years after (before) a date's year calculated at most when
+# looking for the next (previous) holiday.
+HOLIDAY_SEARCH_YEARS = 10
+
+# Requested categories shared by all instances.
+_categories: Dict[FrozenSet[str], FrozenSet[str]] = {}
 
 
 class HolidayBase(Dict[date, str]):
@@ -238,12 +278,35 @@ class HolidayBase(Dict[date, str]):
     """The entity category used by default."""
     default_language: Optional[str] = None
     """The entity language used by default."""
-    categories: Set[str] = set()
+    categories: AbstractSet[str] = frozenset()
     """Requested holiday categories."""
     supported_categories: Tuple[str, ...] = (PUBLIC,)
     """All holiday categories supported by this entity."""
     supported_languages: Tuple[str, ...] = ()
     """All languages supported by this entity."""
+    precomputed: bool = False
+    """Whether to load the years covered by the precomputed holidays bundle
+    from it instead of calculating them."""
+    pickle_populated_years: bool = False
+    """Whether to include the calculated years' holidays into the pickled
+    data instead of calculating them again when unpickling."""
+    _populating_years: Tuple[int, ...] = ()
+    """The years being populated by the thread holding the populate lock."""
+    _populating: bool = False
+    """Whether holidays are being populated, the dates changed meanwhile are
+    not recorded in :attr:`_changed_dates`."""
+    _cache: Optional[Dict[Tuple[Any, ...], Any]] = None
+    """Data derived from the holidays (e.g., business day calendars). It is
+    reset every time the object is modified."""
+
+    def __new__(cls, /, *args, **kwargs):
+        instance = super().__new__(cls)
+        # Keep the constructor arguments for lightweight pickling.
+        if args or kwargs:
+            instance._init_args = (args, kwargs)
+        instance._init_populate_lock()
+
+        return instance
 
     def __init__(
         self,
@@ -255,6 +318,7 @@ class HolidayBase(Dict[date, str]):
         state: Optional[str] = None,  # Deprecated.
         language: Optional[str] = None,
         categories: Optional[CategoryArg] = None,
+        precomputed: bool = False,
     ) -> None:
         """
         :param years:
@@ -288,6 +352,12 @@ class HolidayBase(Dict[date, str]):
         :param categories:
             Requested holiday categories.
 
+        :param precomputed:
+            Whether to load the holidays of the years covered by the
+            precomputed holidays bundle from it instead of calculating them
+            (see :py:mod:`holidays.precomputed`). Other years are calculated
+            as usual.
+
         :return:
             A :class:`HolidayBase` object matching the **country**.
         """
@@ -350,31 +420,37 @@ class HolidayBase(Dict[date, str]):
                 "and `substituted_date_format` attributes set."
             )
 
-        self.categories = categories
+        # The same categories object is shared by all instances.
+        categories = frozenset(categories)
+        self.categories = _categories.setdefault(categories, categories)
         self.expand = expand
         self.has_special_holidays = getattr(self, "has_special_holidays", False)
         self.has_substituted_holidays = has_substituted_holidays
         self.language = language.lower() if language else None
         self.observed = observed
+        self.precomputed = precomputed
         self.subdiv = subdiv
         self.weekend_workdays = set()
+        # Dates added or removed after the population, see `__reduce__()`.
+        self._changed_dates: Set[date] = set()
 
-        supported_languages = set(self.supported_languages)
-        self.tr = (
-            translation(
-                self._entity_code,
-                fallback=language not in supported_languages,
-                languages=[language] if language in supported_languages else None,
-                localedir=str(Path(__file__).with_name("locale")),
-            ).gettext
-            if self._entity_code is not None
-            else gettext
-        )
+        self.tr = self._get_translator(language)
         self.years = _normalize_arguments(int, years)
 
+        # The calculated years are pickled separately.
+        if years is not None and (init_args := getattr(self, "_init_args", None)):
+            args, kwargs = init_args
+            if kwargs.get("years") is years:
+                kwargs["years"] = None
+            else:
+                self._init_args = (
+                    tuple(None if arg is years else arg for arg in args),
+                    kwargs,
+                )
+
         # Populate holidays.
         for year in self.years:
-            self._populate(year)
+            self._load_or_populate(year)
 
     def __add__(self, other: Union[int, "HolidayBase", "HolidaySum"]) -> "HolidayBase":
         """Add another dictionary of public holidays creating a
@@ -400,6 +476,17 @@ class HolidayBase(Dict[date, str]):
     def __bool__(self) -> bool:
         return len(self) > 0
 
+    def __copy__(self):
+        instance = self.__class__.__new__(self.__class__)
+        dict.update(instance, self)
+        instance.__dict__.update(self.__dict__)
+        instance._init_populate_lock()
+        instance._reset_cache()
+        instance.__dict__.pop("_populations", None)
+        instance._changed_dates = set(self._changed_dates)
+
+        return instance
+
     def __contains__(self, key: object) -> bool:
         """Return true if date is in self, false otherwise. Accepts a date in
         the following types:
@@ -416,6 +503,23 @@ class HolidayBase(Dict[date, str]):
 
         return dict.__contains__(cast("Dict[Any, Any]", self), self.__keytransform__(key))
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "HolidayBase":
+        # Holidays are copied instead of calculated again as when unpickling,
+        # the translator is shared.
+        instance = self.__copy__()
+        memo[id(self)] = instance
+        for attribute_name, value in self.__dict__.items():
+            if attribute_name not in {"_populate_lock", "_populations", "categories", "tr"}:
+                dict.__setattr__(instance, attribute_name, copy.deepcopy(value, memo))
+        instance._reset_cache()
+
+        return instance
+
+    def __delitem__(self, key: date) -> None:
+        dict.__delitem__(self, key)
+        self._add_changed_dates((key,))
+        self._reset_cache()
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, HolidayBase):
             return False
@@ -612,8 +716,7 @@ class HolidayBase(Dict[date, str]):
 
         # Automatically expand for `expand=True` cases.
         if self.expand and dt.year not in self.years:
-            self.years.add(dt.year)
-            self._populate(dt.year)
+            self._populate_year(dt.year)
 
         return dt
 
@@ -631,7 +734,53 @@ class HolidayBase(Dict[date, str]):
         return self.__add__(other)
 
     def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
-        return super().__reduce__()
+        """Return the constructor arguments and a compact object state instead
+        of the holidays themselves, see :meth:`__setstate__`."""
+        args, kwargs = getattr(self, "_init_args", ((), {}))
+        factory = partial(self.__class__, **kwargs)
+        config = {
+            attribute_name: getattr(self, attribute_name)
+            for attribute_name in ("categories", "expand", "language", "observed", "subdiv")
+        }
+        year_ranges = _years_to_ranges(self.years)
+
+        # Only the dates changed after the population are pickled, the current
+        # names of the added ones override the calculated names.
+        changed_dates = self._changed_dates
+        added = sorted(
+            (dt, dict.__getitem__(self, dt)) for dt in changed_dates if dict.__contains__(self, dt)
+        )
+        removed = sorted(dt for dt in changed_dates if not dict.__contains__(self, dt))
+
+        if self.pickle_populated_years:
+            payload: Optional[YearsPayload] = self._dump_years(self.years)
+            # Holidays of other years, e.g. observed across the year boundary.
+            added = sorted(
+                {
+                    **dict(added),
+                    **{dt: name for dt, name in self.items() if dt.year not in self.years},
+                }.items()
+            )
+            weekend = weekend_workdays = None
+        else:
+            payload = None
+            # Both may have been changed in place.
+            weekend = tuple(sorted(self.weekend))
+            weekend_workdays = array("i", sorted(dt.toordinal() for dt in self.weekend_workdays))
+
+        changes = (
+            (
+                array("i", (dt.toordinal() for dt, _ in added)),
+                tuple(name for _, name in added),
+                array("i", (dt.toordinal() for dt in removed)),
+                weekend,
+                weekend_workdays,
+            )
+            if added or removed or weekend or weekend_workdays is not None
+            else None
+        )
+
+        return factory, args, (config, year_ranges, payload, changes)
 
     def __repr__(self) -> str:
         if self:
@@ -651,23 +800,85 @@ class HolidayBase(Dict[date, str]):
 
         return "".join(parts)
 
+    def __setstate__(self, state: Any) -> None:
+        """Restore the object state created by :meth:`__reduce__`: the
+        attributes changed after the object creation, the calculated years
+        (either as data created by :meth:`_dump_years` or calculated again)
+        and the holidays added or removed afterwards."""
+        # Objects pickled by the previous versions.
+        if isinstance(state, dict):
+            self.__dict__.update(state)
+            self._init_populate_lock()
+            # Unknown changes, the holidays are pickled as added.
+            self._changed_dates = set(dict.keys(self))
+            return None
+
+        config, year_ranges, payload, changes = state
+        for attribute_name, value in config.items():
+            if getattr(self, attribute_name, None) != value:
+                setattr(self, attribute_name, value)
+
+        if payload is not None:
+            self._load_years(payload)
+
+        for start, stop in year_ranges:
+            for year in range(start, stop):
+                self._populate_year(year)
+
+        if changes is not None:
+            added, names, removed, weekend, weekend_workdays = changes
+            for ordinal in removed:
+                dt = date.fromordinal(ordinal)
+                dict.pop(self, dt, None)
+                self._changed_dates.add(dt)
+            for ordinal, name in zip(added, names):
+                dt = date.fromordinal(ordinal)
+                dict.__setitem__(self, dt, name)
+                self._changed_dates.add(dt)
+            if weekend is not None:
+                self.weekend = set(weekend)
+            if weekend_workdays is not None:
+                self.weekend_workdays = {date.fromordinal(ordinal) for ordinal in weekend_workdays}
+
+        self._reset_cache()
+
     def __setattr__(self, key: str, value: Any) -> None:
+        if key not in CONFIGURATION_ATTRIBUTES:
+            dict.__setattr__(self, key, value)
+            return None
+
+        if key == "language" and "tr" in self.__dict__:
+            # Translate the populated holidays instead of re-populating them.
+            with self._populate_lock:
+                self.tr = self._get_translator(value)
+                for dt, name in dict.items(self):
+                    dict.__setitem__(self, dt, self.tr.translate(name))
+                self._reset_cache()
+            value = value.lower() if value else None
+
+        population_key = (
+            self._get_population_key() if self and key in {"categories", "observed"} else None
+        )
         dict.__setattr__(self, key, value)
 
-        if self and key in {"categories", "observed"}:
-            self.clear()
-            for year in self.years:  # Re-populate holidays for each year.
-                self._populate(year)
+        if key != "language":
+            # Resolved again on the next population.
+            self.__dict__.pop("_normalized_subdiv", None)
+            self.__dict__.pop("_populate_plan", None)
+
+        if population_key is not None:
+            self._repopulate(population_key)
 
     def __setitem__(self, key: DateLike, value: str) -> None:
         if key in self:
             # If there are multiple holidays on the same date
             # order their names alphabetically.
-            holiday_names = set(self[key].split(HOLIDAY_NAME_DELIMITER))
-            holiday_names.update(value.split(HOLIDAY_NAME_DELIMITER))
-            value = HOLIDAY_NAME_DELIMITER.join(sorted(holiday_names))
+            value = join_names((self[key], value))
 
-        dict.__setitem__(self, self.__keytransform__(key), value)
+        dt = self.__keytransform__(key)
+        dict.__setitem__(self, dt, value)
+        self._add_changed_dates((dt,))
+        self._reset_cache()
 
     def __str__(self) -> str:
         if self:
@@ -728,6 +939,135 @@ class HolidayBase(Dict[date, str]):
 
         return subdivision_aliases
 
+    def _dump_years(self, years: Iterable[int]) -> YearsPayload:
+        """Return a compact picklable representation of the calculated years'
+        holidays. See :meth:`_load_years`.
+
+        :param years:
+            The years to dump.
+        """
+        years = set(years)
+        items = sorted((dt, name) for dt, name in self.items() if dt.year in years)
+
+        return (
+            tuple(sorted(years)),
+            array("i", (dt.toordinal() for dt, _ in items)),
+            tuple(name for _, name in items),
+            array("i", sorted(dt.toordinal() for dt in self.weekend_workdays)),
+            tuple(sorted(self.weekend)),
+        )
+
+    def _load_years(self, payload: YearsPayload) -> None:
+        """Add holidays from a representation created by :meth:`_dump_years`
+        and mark its years as calculated. Existing holidays for the same dates
+        are overwritten.
+
+        :param payload:
+            The years representation.
+        """
+        years, ordinals, names, weekend_workdays, weekend = payload
+        for ordinal, name in zip(ordinals, names):
+            dict.__setitem__(self, date.fromordinal(ordinal), name)
+
+        self._reset_cache()
+        self.weekend = set(weekend)
+        self.weekend_workdays.update(date.fromordinal(ordinal) for ordinal in weekend_workdays)
+        self.years.update(years)
+
+    def _get_cached(self, key: Tuple[Any, ...], factory) -> Any:
+        """Return the cached value for `key`, compute it using `factory` if
+        there is none.
+
+        The value is computed under the populate lock, so it's never built
+        from (or stored after) a partially populated year."""
+        cache = self._cache
+        if cache is not None and key in cache:
+            return cache[key]
+
+        with self._populate_lock:
+            if (cache := self._cache) is None:
+                cache = self._cache = {}
+            if key not in cache:
+                cache[key] = factory()
+
+            return cache[key]
+
+    def _get_name_index(self, split_multiple_names: bool) -> "_NameIndex":
+        """Return the holiday names index used by :meth:`get_named`, the index
+        is kept until the holidays are modified."""
+        return self._get_cached(
+            ("name_index", split_multiple_names),
+            lambda: _NameIndex(self.items(), split_multiple_names),
+        )
+
+    def _get_sorted_dates(self) -> List[date]:
+        """Return the holiday dates in ascending order, the list is kept until
+        the holidays are modified."""
+        return self._get_cached(("sorted_dates",), lambda: sorted(dict.keys(self)))
+
+    def _get_translator(self, language: Optional[str]) -> Translator:
+        # No translations for holiday sums of multiple entities.
+        if not isinstance(self._entity_code, str):
+            return DEFAULT_TRANSLATOR
+
+        supported_languages = set(self.supported_languages)
+        return get_translator(
+            self._entity_code,
+            [language] if language in supported_languages else None,
+            fallback=language not in supported_languages,
+        )
+
+    def _get_population_key(self) -> Tuple[Any, ...]:
+        """Return the key of the current configuration's holidays, see
+        :py:meth:`_repopulate`."""
+        return (frozenset(self.categories), self.observed, self.subdiv, self.language)
+
+    def _repopulate(self, previous_key: Tuple[Any, ...]) -> None:
+        """Re-populate holidays for each calculated year after a configuration
+        change.
+
+        The holidays are kept per configuration, so switching back to a
+        configuration used before restores them (along with the changes made
+        to them) instead of calculating them again. Only the years calculated
+        since then are populated.
+
+        :param previous_key:
+            The key of the configuration the current holidays belong to.
+        """
+        with self._populate_lock:
+            populations = self.__dict__.setdefault("_populations", {})
+            key = self._get_population_key()
+            years = frozenset(self.years)
+            populations[previous_key] = (years, dict(self), set(self._changed_dates))
+
+            dict.clear(self)
+            self._changed_dates = set()
+            self._reset_cache()
+            populated_years, holidays, changed_dates = populations.get(
+                key, (frozenset(), {}, set())
+            )
+            if populated_years <= years:
+                dict.update(self, holidays)
+                self._changed_dates = set(changed_dates)
+            else:  # Holidays of other years may spill over into these ones.
+                populated_years = frozenset()
+
+            if missing_years := years - populated_years:
+                for year in self.years:
+                    if year in missing_years:
+                        self._load_or_populate(year)
+                populations[key] = (years, dict(self), set(self._changed_dates))
+
+    def _add_changed_dates(self, dates: Iterable[date]) -> None:
+        """Record dates added or removed after the population."""
+        if not self._populating:
+            self._changed_dates.update(dates)
+
+    def _reset_cache(self) -> None:
+        """Drop the data derived from the holidays."""
+        if self._cache is not None:
+            self._cache = None
+
     def _is_leap_year(self) -> bool:
         """
         Returns True if the year is leap. Returns False otherwise.
@@ -748,10 +1088,10 @@ class HolidayBase(Dict[date, str]):
         self[dt] = self.tr(name)
         return dt
 
-    def _add_special_holidays(self, mapping_names, observed=False):
+    def _add_special_holidays(self, mappings, observed=False):
         """Add special holidays."""
-        for mapping_name in mapping_names:
-            for data in _normalize_tuple(getattr(self, mapping_name, {}).get(self._year, ())):
+        for mapping in mappings:
+            for data in _normalize_tuple(mapping.get(self._year, ())):
                 if len(data) == 3:  # Special holidays.
                     month, day, name = data
                     self._add_holiday(
@@ -764,9 +1104,9 @@ class HolidayBase(Dict[date, str]):
                 else:  # Substituted holidays.
                     to_month, to_day, from_month, from_day, *optional = data
                     from_date = date(optional[0] if optional else self._year, from_month, from_day)
+                    date_format = self.tr(self.substituted_date_format)
                     self._add_holiday(
-                        self.tr(self.substituted_label)
-                        % from_date.strftime(self.tr(self.substituted_date_format)),
+                        self.tr(self.substituted_label) % format_date(from_date, date_format),
                         to_month,
                         to_day,
                     )
@@ -811,6 +1151,69 @@ class HolidayBase(Dict[date, str]):
         dt = dt if isinstance(dt, date) else date(self._year, *dt)
         return dt.weekday() in self.weekend
 
+    def _get_busday_years(self, years: Optional[YearArg]) -> Tuple[int, ...]:
+        """Return sorted years for business day calendars, calculate missing
+        ones."""
+        if years is None:
+            return tuple(sorted(self.years))
+
+        requested_years: Set[int] = _normalize_arguments(int, years)
+        for year in sorted(requested_years - self.years):
+            self._populate_year(year)
+
+        return tuple(sorted(requested_years))
+
+    def _init_populate_lock(self) -> None:
+        """Set up the lock used for calculating years on demand."""
+        self._populate_lock = RLock()
+        # Copies of an object being populated by another thread.
+        self.__dict__.pop("_populating_years", None)
+
+    def _populate_year(self, year: int) -> None:
+        """Populate holidays for a year unless it's already calculated.
+
+        The year is populated exactly once even if requested from multiple
+        threads at the same time. It's added to :attr:`years` only after all
+        its holidays have been added, so the lookups checking :attr:`years`
+        don't need to acquire the lock. Nested lookups made while the year is
+        being populated (by the same thread) don't trigger its population.
+
+        :param year:
+            The year to populate with holidays.
+        """
+        with self._populate_lock:
+            if year in self.years or year in self._populating_years:
+                return None
+
+            populating_years = self._populating_years
+            self._populating_years = (*populating_years, year)
+            try:
+                self._load_or_populate(year)
+            finally:
+                self._populating_years = populating_years
+            self.years.add(year)
+
+    def _load_or_populate(self, year: int) -> None:
+        """Load holidays for a year from the precomputed holidays bundle if
+        enabled and the year is there, populate them otherwise.
+
+        :param year:
+            The year to load or populate with holidays.
+        """
+        populating = self._populating
+        self._populating = True
+        try:
+            if self.precomputed:
+                # The bundle module is only imported when the bundle is used.
+                from holidays.precomputed import PRECOMPUTED
+
+                if PRECOMPUTED.load_year(self, year):
+                    return None
+
+            self._populate(year)
+        finally:
+            self._populating = populating
+
     def _populate(self, year: int) -> None:
         """This is a private class that populates (generates and adds) holidays
         for a given year. To keep things fast, it assumes that no holidays for
@@ -834,42 +1237,194 @@ class HolidayBase(Dict[date, str]):
 
     def _populate_common_holidays(self):
         """Populate entity common holidays."""
-        for category in self._sorted_categories:
-            if pch_method := getattr(self, f"_populate_{category.lower()}_holidays", None):
-                pch_method()
+        plan = self._populate_plan
+        for pch_method in plan["common_methods"]:
+            pch_method(self)
 
-        if self.has_special_holidays:
-            self._add_special_holidays(
-                f"special_{category}_holidays" for category in self._sorted_categories
-            )
+        self._add_special_holidays(plan["common_special_holidays"])
 
     def _populate_subdiv_holidays(self):
         """Populate entity subdivision holidays."""
         if self.subdiv is None:
             return None
 
-        for category in self._sorted_categories:
-            if asch_method := getattr(
-                self,
-                f"_populate_subdiv_{self._normalized_subdiv}_{category.lower()}_holidays",
-                None,
-            ):
-                asch_method()
+        plan = self._populate_plan
+        for asch_method in plan["subdiv_methods"]:
+            asch_method(self)
+
+        self._add_special_holidays(plan["subdiv_special_holidays"])
 
-        if self.has_special_holidays:
-            self._add_special_holidays(
-                f"special_{self._normalized_subdiv}_{category.lower()}_holidays"
-                for category in self._sorted_categories
+    def _get_populate_plan(self) -> Dict[str, Tuple[Any, ...]]:
+        """Resolve the populate methods and special holidays of the current
+        categories and subdivision.
+
+        :return:
+            A dict of the populate functions (to be called with the instance)
+            and the special holidays mappings per populate step.
+        """
+        categories = [category.lower() for category in self._sorted_categories]
+        plan: Dict[str, Tuple[Any, ...]] = {
+            "common_methods": self._get_populate_methods(
+                f"_populate_{category}_holidays" for category in categories
+            ),
+            "common_special_holidays": self._get_special_holidays_mappings(
+                f"special_{category}_holidays" for category in categories
+            ),
+            "subdiv_methods": (),
+            "subdiv_special_holidays": (),
+        }
+        if self.subdiv is not None:
+            subdiv = self._normalized_subdiv
+            plan["subdiv_methods"] = self._get_populate_methods(
+                f"_populate_subdiv_{subdiv}_{category}_holidays" for category in categories
             )
+            plan["subdiv_special_holidays"] = self._get_special_holidays_mappings(
+                f"special_{subdiv}_{category}_holidays" for category in categories
+            )
+
+        return plan
+
+    def _get_populate_methods(self, method_names: Iterable[str]) -> Tuple[Callable, ...]:
+        cls = self.__class__
+        return tuple(
+            method for method_name in method_names if (method := getattr(cls, method_name, None))
+        )
+
+    def _get_special_holidays_mappings(self, mapping_names: Iterable[str]) -> Tuple[Dict, ...]:
+        if not self.has_special_holidays:
+            return ()
+
+        return tuple(
+            mapping
+            for mapping_name in mapping_names
+            if (mapping := getattr(self, mapping_name, None))
+        )
+
+    @cached_property
+    def _populate_plan(self) -> Dict[str, Tuple[Any, ...]]:
+        """The populate steps of the current configuration, see
+        :meth:`_get_populate_plan`. Dropped when the categories, the
+        subdivision or the observed flag change."""
+        return self._get_populate_plan()
 
     def append(self, *args: Union[Dict[DateLike, str], List[DateLike], DateLike]) -> None:
         """Alias for :meth:`update` to mimic list type."""
         return self.update(*args)
 
+    def clear(self) -> None:
+        self._add_changed_dates(dict.keys(self))
+        dict.clear(self)
+        self._reset_cache()
+
     def copy(self):
         """Return a copy of the object."""
         return copy.copy(self)
 
+    def get_busdaycalendar(self, years: Optional[YearArg] = None) -> Any:
+        """Return a :class:`numpy.busdaycalendar` object for the requested
+        years. Requires `numpy` to be installed.
+
+        The week mask is built from :attr:`weekend` and the holidays array
+        contains the holiday dates of the requested years. If any working days
+        moved to weekends (see :attr:`weekend_workdays`) fall within the
+        requested years, an all-days week mask is used and the non-working
+        weekend days are added to the holidays array instead. Weekend working
+        days are working days even if they are holidays as well, the same as
+        in :meth:`is_working_day`.
+
+        The calendar is only valid within the requested years. It is cached
+        until the object is modified.
+
+        :param years:
+            The year(s) to build the calendar for. Defaults to the calculated
+            years.
+
+        :return:
+            A :class:`numpy.busdaycalendar` object.
+        """
+        import numpy as np
+
+        busday_years = self._get_busday_years(years)
+        weekend = frozenset(self.weekend)
+        weekend_workdays = frozenset(dt for dt in self.weekend_workdays if dt.year in busday_years)
+
+        def build_busdaycalendar():
+            holidays = {
+                dt
+                for dt in self
+                if dt.year in busday_years
+                and not (dt.weekday() in weekend and dt in weekend_workdays)
+            }
+            if weekend_workdays:
+                weekmask = "1111111"
+                for year in busday_years:
+                    dt = date(year, 1, 1)
+                    while dt.year == year:
+                        if dt.weekday() in weekend and dt not in weekend_workdays:
+                            holidays.add(dt)
+                        dt = _timedelta(dt, +1)
+            else:
+                weekmask = "".join("0" if day in weekend else "1" for day in range(7))
+
+            return np.busdaycalendar(
+                weekmask=weekmask,
+                holidays=np.array(sorted(holidays), dtype="datetime64[D]"),
+            )
+
+        return self._get_cached(
+            ("busdaycalendar", busday_years, weekend, weekend_workdays), build_busdaycalendar
+        )
+
+    def get_custom_business_day(self, years: Optional[YearArg] = None) -> Any:
+        """Return a :class:`pandas.tseries.offsets.CustomBusinessDay` object
+        for the requested years. Requires `pandas` to be installed.
+
+        See :meth:`get_busdaycalendar` for details.
+
+        :param years:
+            The year(s) to build the offset for. Defaults to the calculated
+            years.
+
+        :return:
+            A :class:`pandas.tseries.offsets.CustomBusinessDay` object.
+        """
+        from pandas.tseries.offsets import CustomBusinessDay
+
+        busdaycalendar = self.get_busdaycalendar(years)
+
+        return self._get_cached(
+            ("custom_business_day", busdaycalendar),
+            lambda: CustomBusinessDay(calendar=busdaycalendar),
+        )
+
+    def get_holiday_calendar(self, years: Optional[YearArg] = None) -> Any:
+        """Return a :class:`pandas.tseries.holiday.AbstractHolidayCalendar`
+        object containing the holidays of the requested years. Requires
+        `pandas` to be installed.
+
+        :param years:
+            The year(s) to build the calendar for. Defaults to the calculated
+            years.
+
+        :return:
+            A :class:`pandas.tseries.holiday.AbstractHolidayCalendar` object.
+        """
+        from pandas.tseries.holiday import AbstractHolidayCalendar, Holiday
+
+        busday_years = self._get_busday_years(years)
+
+        def build_holiday_calendar():
+            return AbstractHolidayCalendar(
+                name=str(self._entity_code or self.__class__.__name__),
+                rules=[
+                    Holiday(name, year=dt.year, month=dt.month, day=dt.day)
+                    for dt, name in sorted(self.items())
+                    if dt.year in busday_years
+                ],
+            )
+
+        return self._get_cached(("holiday_calendar", busday_years), build_holiday_calendar)
+
     def get(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
         """Return the holiday name for a date if date is a holiday, else
         default. If default is not given, it defaults to None, so that this
@@ -905,7 +1460,7 @@ class HolidayBase(Dict[date, str]):
             * or a :class:`float` or :class:`int` representing a POSIX
               timestamp.
         """
-        return [name for name in self.get(key, "").split(HOLIDAY_NAME_DELIMITER) if name]
+        return split_names(self.get(key, ""))
 
     def get_named(
         self, holiday_name: str, lookup="icontains", split_multiple_names=True
@@ -931,35 +1486,50 @@ class HolidayBase(Dict[date, str]):
         :return:
             A list of all holiday dates matching the provided holiday name.
         """
-        holiday_name_dates = (
-            ((k, name) for k, v in self.items() for name in v.split(HOLIDAY_NAME_DELIMITER))
-            if split_multiple_names
-            else ((k, v) for k, v in self.items())
-        )
-
+        index = self._get_name_index(split_multiple_names)
+        names: Iterable[str]
         if lookup == "icontains":
             holiday_name_lower = holiday_name.lower()
-            return [dt for dt, name in holiday_name_dates if holiday_name_lower in name.lower()]
+            names = (
+                name
+                for name_lower, lower_names in index.lower_names.items()
+                if holiday_name_lower in name_lower
+                for name in lower_names
+            )
         elif lookup == "exact":
-            return [dt for dt, name in holiday_name_dates if holiday_name == name]
+            # Nothing matches names of other types (which may be unhashable).
+            names = (holiday_name,) if isinstance(holiday_name, str) else ()
         elif lookup == "contains":
-            return [dt for dt, name in holiday_name_dates if holiday_name in name]
+            names = (name for name in index.positions if holiday_name in name)
         elif lookup == "startswith":
-            return [
-                dt for dt, name in holiday_name_dates if holiday_name == name[: len(holiday_name)]
-            ]
+            names = index.get_prefixed(index.sorted_names, holiday_name)
         elif lookup == "iexact":
-            holiday_name_lower = holiday_name.lower()
-            return [dt for dt, name in holiday_name_dates if holiday_name_lower == name.lower()]
+            names = index.lower_names.get(holiday_name.lower(), ())
         elif lookup == "istartswith":
             holiday_name_lower = holiday_name.lower()
-            return [
-                dt
-                for dt, name in holiday_name_dates
-                if holiday_name_lower == name[: len(holiday_name)].lower()
-            ]
+            prefix_length = len(holiday_name)
+
+            def is_prefixed(name: str) -> bool:
+                return name[:prefix_length].lower() == holiday_name_lower
 
-        raise AttributeError(f"Unknown lookup type: {lookup}")
+            if len(holiday_name_lower) != prefix_length:
+                names = (name for name in index.positions if is_prefixed(name))
+            else:
+                names = chain(
+                    (
+                        name
+                        for name_lower in index.get_prefixed(
+                            index.sorted_lower_names, holiday_name_lower
+                        )
+                        for name in index.lower_names[name_lower]
+                        if name not in index.unaligned_names
+                    ),
+                    (name for name in index.unaligned_names if is_prefixed(name)),
+                )
+        else:
+            raise AttributeError(f"Unknown lookup type: {lookup}")
+
+        return index.get_dates(names)
 
     def get_nth_working_day(self, key: DateLike, n: int) -> date:
         """Return n-th working day from provided date (if n is positive)
@@ -992,11 +1562,86 @@ class HolidayBase(Dict[date, str]):
         days = (dt2 - dt1).days + 1
         return sum(self.is_working_day(_timedelta(dt1, n)) for n in range(days))
 
+    def holidays_between(self, start: DateLike, end: DateLike) -> List[Tuple[date, str]]:
+        """Return the holidays between two dates sorted by date.
+
+        The date range works in a closed interval fashion [start, end] so both
+        endpoints are included. The years of the range are calculated if
+        `expand` is True.
+
+        :param start:
+            The range start date.
+
+        :param end:
+            The range end date.
+
+        :return:
+            A list of (date, name) tuples.
+        """
+        dt1 = self.__keytransform__(start)
+        dt2 = self.__keytransform__(end)
+        if dt1 > dt2:
+            dt1, dt2 = dt2, dt1
+        if self.expand:
+            for year in range(dt1.year, dt2.year + 1):
+                if year not in self.years:
+                    self._populate_year(year)
+
+        dates = self._get_sorted_dates()
+        return [
+            (dt, dict.__getitem__(self, dt))
+            for dt in dates[bisect_left(dates, dt1) : bisect_right(dates, dt2)]
+        ]
+
     def is_working_day(self, key: DateLike) -> bool:
         """Return True if date is a working day (not a holiday or a weekend)."""
         dt = self.__keytransform__(key)
         return dt in self.weekend_workdays if self._is_weekend(dt) else dt not in self
 
+    def next_holiday(self, key: DateLike) -> Optional[Tuple[date, str]]:
+        """Return the first holiday on or after a date.
+
+        If `expand` is True, the following years are calculated one by one
+        until a holiday is found, up to 10 years after the date's year.
+
+        :param key:
+            The date expressed in one of the following types:
+
+            * :class:`datetime.date`,
+            * :class:`datetime.datetime`,
+            * a :class:`str` of any format recognized by
+              :func:`dateutil.parser.parse`,
+            * or a :class:`float` or :class:`int` representing a POSIX
+              timestamp.
+
+        :return:
+            A (date, name) tuple or None if there are no holidays after the
+            date (within the searched years if `expand` is True).
+        """
+        dt = self.__keytransform__(key)
+        year = dt.year
+        last_search_year = min(year + HOLIDAY_SEARCH_YEARS, MAXYEAR)
+        while True:
+            dates = self._get_sorted_dates()
+            idx = bisect_left(dates, dt)
+            found = dates[idx] if idx < len(dates) else None
+            if not self.expand:
+                break
+
+            # The years before the found holiday may be not calculated yet.
+            last_year = found.year if found else MAXYEAR
+            while year <= last_year and year in self.years:
+                year += 1
+            if year > last_year:
+                break
+            if year > last_search_year:
+                # An earlier holiday may be in the years not calculated.
+                found = None
+                break
+            self._populate_year(year)
+
+        return (found, dict.__getitem__(self, found)) if found else None
+
     def pop(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
         """If date is a holiday, remove it and return its date, else return
         default.
@@ -1020,10 +1665,15 @@ class HolidayBase(Dict[date, str]):
         :raise:
             KeyError if date is not a holiday and default is not given.
         """
+        dt = self.__keytransform__(key)
         if default is None:
-            return dict.pop(self, self.__keytransform__(key))
+            value = dict.pop(self, dt)
+        else:
+            value = dict.pop(self, dt, default)
+        self._add_changed_dates((dt,))
+        self._reset_cache()
 
-        return dict.pop(self, self.__keytransform__(key), default)
+        return value
 
     def pop_named(self, name: str) -> List[date]:
         """Remove (no longer treat at as holiday) all dates matching the
@@ -1040,19 +1690,20 @@ class HolidayBase(Dict[date, str]):
             KeyError if date is not a holiday and default is not given.
         """
         use_exact_name = HOLIDAY_NAME_DELIMITER in name
-        dts = self.get_named(name, split_multiple_names=not use_exact_name)
+        # A date is listed once per its matching name.
+        dts = list(dict.fromkeys(self.get_named(name, split_multiple_names=not use_exact_name)))
         if len(dts) == 0:
             raise KeyError(name)
 
+        name_lower = name.lower()
         popped = []
         for dt in dts:
-            holiday_names = self[dt].split(HOLIDAY_NAME_DELIMITER)
+            holiday_names = split_names(self[dt])
             self.pop(dt)
             popped.append(dt)
 
             # Keep the rest of holidays falling on the same date.
             if not use_exact_name:
-                name_lower = name.lower()
                 holiday_names = [
                     holiday_name
                     for holiday_name in holiday_names
@@ -1060,10 +1711,68 @@ class HolidayBase(Dict[date, str]):
                 ]
 
                 if len(holiday_names) > 0:
-                    self[dt] = HOLIDAY_NAME_DELIMITER.join(holiday_names)
+                    self[dt] = join_names(holiday_names, keep_order=True)
 
         return popped
 
+    def popitem(self) -> Tuple[date, str]:
+        item = dict.popitem(self)
+        self._add_changed_dates((item[0],))
+        self._reset_cache()
+
+        return item
+
+    def previous_holiday(self, key: DateLike) -> Optional[Tuple[date, str]]:
+        """Return the last holiday before a date.
+
+        If `expand` is True, the preceding years are calculated one by one
+        until a holiday is found, up to 10 years before the date's year.
+
+        :param key:
+            The date expressed in one of the following types:
+
+            * :class:`datetime.date`,
+            * :class:`datetime.datetime`,
+            * a :class:`str` of any format recognized by
+              :func:`dateutil.parser.parse`,
+            * or a :class:`float` or :class:`int` representing a POSIX
+              timestamp.
+
+        :return:
+            A (date, name) tuple or None if there are no holidays before the
+            date (within the searched years if `expand` is True).
+        """
+        dt = self.__keytransform__(key)
+        year = dt.year
+        first_search_year = max(year - HOLIDAY_SEARCH_YEARS, MINYEAR)
+        while True:
+            dates = self._get_sorted_dates()
+            idx = bisect_left(dates, dt) - 1
+            found = dates[idx] if idx >= 0 else None
+            if not self.expand:
+                break
+
+            # The years after the found holiday may be not calculated yet.
+            first_year = found.year if found else MINYEAR
+            while year >= first_year and year in self.years:
+                year -= 1
+            if year < first_year:
+                break
+            if year < first_search_year:
+                # A later holiday may be in the years not calculated.
+                found = None
+                break
+            self._populate_year(year)
+
+        return (found, dict.__getitem__(self, found)) if found else None
+
+    def setdefault(self, key: date, default: str) -> str:  # type: ignore[override]
+        value = dict.setdefault(self, key, default)
+        self._add_changed_dates((key,))
+        self._reset_cache()
+
+        return value
+
     def update(  # type: ignore[override]
         self, *args: Union[Dict[DateLike, str], List[DateLike], DateLike]
     ) -> None:
@@ -1083,16 +1792,102 @@ class HolidayBase(Dict[date, str]):
               :func:`dateutil.parser.parse`,
             * or a :class:`float` or :class:`int` representing a POSIX
               timestamp.
+
+            Each date is converted once and the names of a date are merged in
+            a single pass, the result is the same as setting the dates one by
+            one.
         """
+        items: List[Tuple[DateLike, str]] = []
         for arg in args:
             if isinstance(arg, dict):
-                for key, value in arg.items():
-                    self[key] = value
+                items.extend(arg.items())
             elif isinstance(arg, list):
-                for item in arg:
-                    self[item] = "Holiday"
+                items.extend((item, "Holiday") for item in arg)
             else:
-                self[arg] = "Holiday"
+                items.append((arg, "Holiday"))
+
+        # Subclasses overriding `__setitem__` get each date set separately.
+        if type(self).__setitem__ is not HolidayBase.__setitem__:
+            for key, value in items:
+                self[key] = value
+            return None
+
+        # Names to merge into the date's current name after all dates are set.
+        new_names: Dict[date, List[str]] = {}
+        for key, value in items:
+            dt = self.__keytransform__(key)
+            names = new_names.get(dt)
+            if names is not None:
+                names.append(value)
+            elif dict.__contains__(self, dt):
+                new_names[dt] = [value]
+            else:
+                # Keep the dates order the same as when set one by one.
+                dict.__setitem__(self, dt, value)
+                new_names[dt] = []
+        if not new_names:
+            return None
+
+        for dt, names in new_names.items():
+            if names:
+                dict.__setitem__(self, dt, join_names((dict.__getitem__(self, dt), *names)))
+        self._add_changed_dates(new_names)
+        self._reset_cache()
+
+
+class _NameIndex:
+    """Holiday names of a holidays object and their positions in it, see
+    :meth:`HolidayBase.get_named`."""
+
+    __slots__ = (
+        "dates",
+        "lower_names",
+        "positions",
+        "sorted_lower_names",
+        "sorted_names",
+        "unaligned_names",
+    )
+
+    def __init__(self, items: Iterable[Tuple[date, str]], split_multiple_names: bool) -> None:
+        self.dates: List[date] = []
+        # Name -> (date index, name index) positions in the holidays order.
+        self.positions: Dict[str, List[Tuple[int, int]]] = {}
+        for dt_idx, (dt, value) in enumerate(items):
+            self.dates.append(dt)
+            names = value.split(HOLIDAY_NAME_DELIMITER) if split_multiple_names else (value,)
+            for name_idx, name in enumerate(names):
+                self.positions.setdefault(name, []).append((dt_idx, name_idx))
+
+        # Lower-cased name -> names.
+        self.lower_names: Dict[str, List[str]] = {}
+        # Names changing their length when lower-cased (e.g., containing "İ"),
+        # their lower-cased prefixes don't match the prefixes lower-cased.
+        self.unaligned_names: Set[str] = set()
+        for name in self.positions:
+            name_lower = name.lower()
+            self.lower_names.setdefault(name_lower, []).append(name)
+            if len(name_lower) != len(name):
+                self.unaligned_names.add(name)
+        self.sorted_names = sorted(self.positions)
+        self.sorted_lower_names = sorted(self.lower_names)
+
+    @staticmethod
+    def get_prefixed(sorted_names: List[str], prefix: str) -> List[str]:
+        """Return the names starting with `prefix` from a sorted list."""
+        start = end = bisect_left(sorted_names, prefix)
+        while end < len(sorted_names) and sorted_names[end].startswith(prefix):
+            end += 1
+
+        return sorted_names[start:end]
+
+    def get_dates(self, names: Iterable[str]) -> List[date]:
+        """Return the dates of the names in the holidays order, a date is
+        listed once per each of its names."""
+        positions = [self.positions[name] for name in names if name in self.positions]
+        if len(positions) == 1:
+            return [self.dates[dt_idx] for dt_idx, _ in positions[0]]
+
+        return [self.dates[dt_idx] for dt_idx, _ in sorted(chain.from_iterable(positions))]
 
 
 class HolidaySum(HolidayBase):
@@ -1195,5 +1990,5 @@ country_holidays('CA') + country_holidays('MX')
 
     def _populate(self, year):
         for operand in self.holidays:
-            operand._populate(year)
+            operand._load_or_populate(year)
             self.update(cast("Dict[DateLike, str]", operand))
@@ -0,0 +1,229 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = ("ICalExporter",)
+
+import uuid
+from bisect import bisect_left
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+from holidays import __version__
+from holidays.helpers import _normalize_arguments
+from holidays.holiday_base import HolidayBase, HolidaySum, YearArg
+from holidays.l10n import neutral_sort_key
+
+CONTENT_LINE_LENGTH = 75  # Octets, excluding the line break.
+LINE_BREAK = "\r\n"
+
+
+def _escape_text(value: str) -> str:
+    """Escape an RFC 5545 TEXT value."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold_line(line: str) -> str:
+    """Return an RFC 5545 content line folded into lines of at most 75 octets,
+    multi-octet UTF-8 characters are never split."""
+    encoded = line.encode()
+    if len(encoded) <= CONTENT_LINE_LENGTH:
+        return f"{line}{LINE_BREAK}"
+
+    parts = []
+    start = 0
+    limit = CONTENT_LINE_LENGTH
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Move back to the first byte of a UTF-8 sequence.
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        start = end
+        limit = CONTENT_LINE_LENGTH - 1  # The continuation lines start with a space.
+
+    return f"{f'{LINE_BREAK} '.join(parts)}{LINE_BREAK}"
+
+
+def _get_scratch_copy(holidays: HolidayBase) -> HolidayBase:
+    """Return an empty copy of a holidays object for calculating holidays
+    without modifying the object."""
+    scratch = holidays.__class__.__new__(holidays.__class__)
+    scratch.__dict__.update(holidays.__dict__)
+    scratch.__dict__.pop("_populations", None)
+    scratch._init_populate_lock()
+    scratch._reset_cache()
+    scratch.expand = False
+    scratch.weekend_workdays = set()
+    scratch._changed_dates = set()
+    scratch.years = set()
+    if isinstance(holidays, HolidaySum):
+        scratch.holidays = [_get_scratch_copy(operand) for operand in holidays.holidays]
+
+    return scratch
+
+
+def _drop_years(holidays: HolidayBase, last_year: int) -> None:
+    """Remove holidays up to the end of `last_year` from a scratch copy."""
+    for dt in [dt for dt in holidays if dt.year <= last_year]:
+        dict.__delitem__(holidays, dt)
+    holidays.weekend_workdays = set()
+    if isinstance(holidays, HolidaySum):
+        for operand in holidays.holidays:
+            _drop_years(operand, last_year)
+
+
+class ICalExporter:
+    """
+    Exports holidays as an iCalendar (:rfc:`5545`) calendar.
+
+    The calendar is generated as a stream of content lines, one year at a
+    time: years already calculated by the holidays object are read from it,
+    other years are calculated in a copy of the object which only keeps the
+    holidays of the year being exported (and of the following one if it's
+    exported too, so its holidays observed in the exported year are not
+    lost, the same as for the calculated years). The holidays
+    object itself is never modified, so the memory usage doesn't depend on the
+    number of exported years.
+
+    Each holiday name is exported as an all-day VEVENT, names of holidays
+    sharing a date are exported as separate events.
+
+    Example usage:
+
+    >>> from holidays import country_holidays
+    >>> from holidays.ical import ICalExporter
+    >>> exporter = ICalExporter(country_holidays("US", subdiv="CA"))
+    >>> exporter.save_ics("us_ca.ics", years=range(1950, 2051))
+    >>> for line in exporter.generate(years=2024):
+    ...     pass  # E.g., write the line to an HTTP response.
+    """
+
+    def __init__(self, holidays: HolidayBase, timestamp: Optional[datetime] = None) -> None:
+        """
+        :param holidays:
+            A :py:class:`HolidayBase` or :py:class:`HolidaySum` object.
+
+        :param timestamp:
+            The events DTSTAMP value. Defaults to the current UTC time.
+        """
+        self.holidays = holidays
+        self.timestamp = (timestamp or datetime.now(timezone.utc)).astimezone(timezone.utc)
+
+    @property
+    def language(self) -> Optional[str]:
+        """The language tag of the holiday names, if known."""
+        holidays = self.holidays
+        language = holidays.language
+        if language is not None:
+            language = {lang.lower(): lang for lang in holidays.supported_languages}.get(language)
+
+        language = language or holidays.default_language
+        return language.replace("_", "-") if language else None
+
+    def _get_event_lines(self, dt: date, name: str) -> Iterator[str]:
+        holidays = self.holidays
+        uid_seed = "|".join(
+            str(value)
+            for value in (holidays._entity_code, holidays.subdiv, dt, neutral_sort_key(name))
+        )
+        language = self.language
+        summary = f"SUMMARY;LANGUAGE={language}" if language else "SUMMARY"
+
+        yield "BEGIN:VEVENT"
+        yield f"UID:{uuid.uuid5(uuid.NAMESPACE_OID, uid_seed)}"
+        yield f"DTSTAMP:{self.timestamp:%Y%m%dT%H%M%SZ}"
+        yield f"{summary}:{_escape_text(name)}"
+        yield f"DTSTART;VALUE=DATE:{dt:%Y%m%d}"
+        yield "DURATION:P1D"
+        yield "END:VEVENT"
+
+    def _get_year_holidays(
+        self, year: int, years: List[int], scratch: HolidayBase
+    ) -> List[Tuple[date, str]]:
+        """Return (date, name) pairs of a year's holidays sorted by date."""
+        holidays = self.holidays
+        if year in holidays.years:
+            # The sorted dates are searched instead of slicing the object, as
+            # slicing would calculate the years of the slice ends.
+            dates = holidays._get_sorted_dates()
+            return [
+                (dt, name)
+                for dt in dates[
+                    bisect_left(dates, date(year, 1, 1)) : bisect_left(dates, date(year + 1, 1, 1))
+                ]
+                for name in holidays.get_list(dt)
+            ]
+
+        # The next year is calculated as well if it's exported, so its holidays
+        # observed in this year are included.
+        for populated_year in (year, year + 1):
+            if (
+                populated_year in years
+                and populated_year not in holidays.years
+                and populated_year not in scratch.years
+            ):
+                scratch._populate_year(populated_year)
+        items = [
+            (dt, name)
+            for dt in sorted(dt for dt in scratch if dt.year == year)
+            for name in scratch.get_list(dt)
+        ]
+        _drop_years(scratch, year)
+
+        return items
+
+    def generate(self, years: YearArg) -> Iterator[str]:
+        """Generate the calendar content lines.
+
+        :param years:
+            The years to export.
+
+        :return:
+            A generator of folded content lines, each line including its
+            trailing CRLF.
+        """
+        scratch = _get_scratch_copy(self.holidays)
+        sorted_years = sorted(_normalize_arguments(int, years))
+
+        for line in (
+            "BEGIN:VCALENDAR",
+            f"PRODID:-//Vacanza//Open World Holidays Framework v{__version__}//EN",
+            "VERSION:2.0",
+            "CALSCALE:GREGORIAN",
+        ):
+            yield _fold_line(line)
+
+        for year in sorted_years:
+            for dt, name in self._get_year_holidays(year, sorted_years, scratch):
+                for line in self._get_event_lines(dt, name):
+                    yield _fold_line(line)
+
+        yield _fold_line("END:VCALENDAR")
+
+    def save_ics(self, file_path: Union[str, Path], years: YearArg) -> None:
+        """Write the calendar into a file.
+
+        :param file_path:
+            The .ics file path.
+
+        :param years:
+            The years to export.
+        """
+        with open(file_path, "w", encoding="utf-8", newline="") as file:
+            file.writelines(self.generate(years))
@@ -0,0 +1,354 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import json
+import os
+import struct
+from copy import copy
+from datetime import date
+from errno import ENOENT
+from functools import lru_cache
+from gettext import GNUTranslations, NullTranslations, gettext
+from gettext import _expand_lang  # type: ignore[attr-defined]
+from io import BytesIO
+from pathlib import Path
+from threading import Lock
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from holidays.constants import HOLIDAY_NAME_DELIMITER
+
+# A holiday name key is either a message id or a (operation, *operands) tuple.
+NameKey = Union[str, Tuple[Any, ...]]
+
+
+class HolidayName(str):
+    """A translated holiday name which remembers its language-neutral key.
+
+    The key is either the message id the name was translated from or a
+    description of how the name was built from other holiday names (label
+    formatting, date formatting or merging names of the same date). It allows
+    translating already populated holidays into another language without
+    re-populating them, see :py:meth:`Translator.translate`.
+    """
+
+    key: NameKey
+
+    def __new__(cls, value: str, key: NameKey) -> "HolidayName":
+        name = str.__new__(cls, value)
+        name.key = key
+        return name
+
+    def __mod__(self, args: Any) -> str:
+        if isinstance(args, dict):
+            return str.__mod__(self, args)
+
+        args = args if isinstance(args, tuple) else (args,)
+        cache_key = ("%", id(self), *map(_get_name_id, args))
+        try:
+            return _composite_names[cache_key]
+        except TypeError:  # Unhashable arguments.
+            return HolidayName(str.__mod__(self, args), ("%", self, args))
+        except KeyError:
+            name = _composite_names[cache_key] = HolidayName(
+                str.__mod__(self, args), ("%", self, args)
+            )
+            return name
+
+    def __reduce__(self):
+        return _restore_name, (str(self), self.key)
+
+
+# Translated message ids, shared by all entities and languages using them.
+_names: Dict[Tuple[str, str], HolidayName] = {}
+
+# Holiday names built from other names, shared by all holidays using them. The
+# keys are identities of the source holiday names (kept alive by the cached
+# names' keys) and values of any other operands, so the table size is bounded
+# by the number of distinct names rather than by the number of instances. Names
+# merged with user-added names aren't cached, see :py:func:`join_names`.
+_composite_names: Dict[Tuple[Any, ...], HolidayName] = {}
+
+
+def _get_name_id(value: Any) -> Any:
+    return id(value) if isinstance(value, HolidayName) else value
+
+
+def intern_name(value: str, message: str) -> HolidayName:
+    """Return the shared holiday name object for a translated message id."""
+    try:
+        return _names[(value, message)]
+    except KeyError:
+        name = _names[(value, message)] = HolidayName(value, message)
+        return name
+
+
+def _restore_name(value: str, key: NameKey) -> str:
+    """Unpickle a holiday name re-using the shared name objects."""
+    if isinstance(key, str):
+        return intern_name(value, key)
+
+    if key[0] == "%":
+        name = key[1] % key[2]
+    elif key[0] == "join":
+        name = join_names(key[1])
+    elif key[0] == "strftime":
+        name = format_date(*key[1:])
+    else:
+        name = HolidayName(value, key)
+
+    return name if name == value else HolidayName(value, key)
+
+
+def join_names(names: Iterable[str], keep_order: bool = False) -> str:
+    """Merge holiday names of the same date, ordered alphabetically unless
+    `keep_order` is True."""
+    unique_names: Dict[str, str] = {}
+    for name in names:
+        for part in split_names(name):
+            unique_names.setdefault(part, part)
+
+    parts = tuple(unique_names.values() if keep_order else sorted(unique_names.values()))
+    if not any(isinstance(part, HolidayName) for part in parts):
+        return HOLIDAY_NAME_DELIMITER.join(parts)
+
+    # Names added by users are neither shared nor bounded in number, so only
+    # names made of holiday names alone go to the composite names table.
+    if not all(isinstance(part, HolidayName) for part in parts):
+        return HolidayName(HOLIDAY_NAME_DELIMITER.join(parts), ("join", parts))
+
+    cache_key = ("join", *map(id, parts))
+    try:
+        return _composite_names[cache_key]
+    except KeyError:
+        name = _composite_names[cache_key] = HolidayName(
+            HOLIDAY_NAME_DELIMITER.join(parts), ("join", parts)
+        )
+        return name
+
+
+def format_date(dt: date, date_format: str) -> str:
+    """Format a date used as (a part of) a holiday name."""
+    cache_key = ("strftime", dt, _get_name_id(date_format))
+    try:
+        return _composite_names[cache_key]
+    except KeyError:
+        name = _composite_names[cache_key] = HolidayName(
+            dt.strftime(date_format), ("strftime", dt, date_format)
+        )
+        return name
+
+
+def split_names(name: str) -> List[str]:
+    """Split merged holiday names keeping their keys."""
+    if isinstance(name, HolidayName):
+        return list(name.key[1]) if name.key[0] == "join" else [name]
+
+    return [part for part in name.split(HOLIDAY_NAME_DELIMITER) if part]
+
+
+def neutral_sort_key(name: str) -> str:
+    """Sort holiday names the same way regardless of their language."""
+    if isinstance(name, HolidayName) and isinstance(name.key, str):
+        return name.key
+
+    return name
+
+
+class Translator(Dict[str, HolidayName]):
+    """Translates message ids into :py:class:`HolidayName` objects.
+
+    Each message id is translated only once per translations (an entity and a
+    language), the resulting name object is shared between all holidays,
+    years and entities having the same name.
+    """
+
+    # Translate with a plain dict lookup, see `__missing__()`.
+    __call__ = dict.__getitem__
+
+    def __init__(self, gettext: Callable[[str], str]) -> None:
+        super().__init__()
+        self.gettext = gettext
+
+    def __missing__(self, message: str) -> str:
+        # Already translated names built from other names.
+        if isinstance(message, HolidayName):
+            return message
+
+        name = self[message] = intern_name(self.gettext(message), message)
+        return name
+
+    def translate(self, name: str) -> str:
+        """Translate a holiday name built by another translator."""
+        if not isinstance(name, HolidayName):
+            return name
+
+        key = name.key
+        if isinstance(key, str):
+            return self(key)
+
+        operation, *operands = key
+        if operation == "%":
+            template, args = operands
+            return self.translate(template) % tuple(self.translate(arg) for arg in args)
+        if operation == "join":
+            return join_names(self.translate(part) for part in operands[0])
+        if operation == "strftime":
+            dt, date_format = operands
+            return format_date(dt, self.translate(date_format))
+
+        return name
+
+
+DEFAULT_TRANSLATOR = Translator(gettext)
+
+# Compiled translations of all entities and languages are bundled into a single
+# resource: a header, a JSON index of {domain: {language: (offset, size)}} and
+# the .mo catalogs data. See scripts/l10n/generate_mo_files.py.
+CATALOGS_FILE = "catalogs.bin"
+CATALOGS_HEADER = struct.Struct("<4sI")  # Magic, index size.
+CATALOGS_MAGIC = b"HLC1"
+
+CatalogsIndex = Dict[str, Dict[str, Tuple[int, int]]]
+
+
+@lru_cache(maxsize=None)
+def _expand_language(language: str) -> List[str]:
+    # E.g. "de_DE.UTF-8" -> ["de_DE.UTF-8", "de_DE", "de.UTF-8", "de"].
+    return _expand_lang(language)
+
+
+def _open_catalogs() -> IO[bytes]:
+    try:
+        from importlib.resources import files
+    except ImportError:  # Python 3.8.
+        return open(Path(__file__).with_name("locale") / CATALOGS_FILE, "rb")
+
+    return (files("holidays") / "locale" / CATALOGS_FILE).open("rb")
+
+
+class Catalogs:
+    """The bundled translations, loaded lazily.
+
+    Only the index is read on the first use, each catalog is then read with a
+    single seek when a translation into its language is requested for the
+    first time. The bundle is read through :py:mod:`importlib.resources`, so
+    zipped and frozen packages are supported.
+    """
+
+    def __init__(self, open_catalogs: Callable[[], IO[bytes]] = _open_catalogs) -> None:
+        self._open_catalogs = open_catalogs
+        self._index: Optional[CatalogsIndex] = None
+        self._data_offset = 0
+        self._translations: Dict[Tuple[str, str], GNUTranslations] = {}
+        self._lock = Lock()
+
+    @property
+    def index(self) -> CatalogsIndex:
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._load_index()
+
+        return self._index
+
+    def _load_index(self) -> CatalogsIndex:
+        try:
+            with self._open_catalogs() as file:
+                magic, index_size = CATALOGS_HEADER.unpack(file.read(CATALOGS_HEADER.size))
+                if magic != CATALOGS_MAGIC:
+                    raise ValueError("Invalid translations bundle.")
+                index = json.loads(file.read(index_size))
+        except FileNotFoundError:  # Translations are not compiled.
+            return {}
+
+        self._data_offset = CATALOGS_HEADER.size + index_size
+        return {
+            domain: {language: tuple(entry) for language, entry in languages.items()}
+            for domain, languages in index.items()
+        }
+
+    def find(self, domain: str, languages: Optional[List[str]] = None) -> List[str]:
+        """Return languages of the `domain` catalogs to use, the same way as
+        :py:func:`gettext.find` with `all=True` does for .mo files.
+
+        If `languages` is None, the LANGUAGE, LC_ALL, LC_MESSAGES and LANG
+        environment variables are used.
+        """
+        if languages is None:
+            languages = []
+            for env_var in ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG"):
+                if value := os.environ.get(env_var):
+                    languages = value.split(":")
+                    break
+            if "C" not in languages:
+                languages.append("C")
+
+        domain_catalogs = self.index.get(domain, {})
+        found: List[str] = []
+        for language in languages:
+            for expanded_language in _expand_language(language):
+                if expanded_language == "C":
+                    return found
+                if expanded_language in domain_catalogs and expanded_language not in found:
+                    found.append(expanded_language)
+
+        return found
+
+    def load(self, domain: str, language: str) -> GNUTranslations:
+        """Return the parsed `domain` catalog of a language."""
+        key = (domain, language)
+        try:
+            return self._translations[key]
+        except KeyError:
+            pass
+
+        offset, size = self.index[domain][language]
+        with self._open_catalogs() as file:
+            file.seek(self._data_offset + offset)
+            translations = GNUTranslations(BytesIO(file.read(size)))
+
+        return self._translations.setdefault(key, translations)
+
+
+CATALOGS = Catalogs()
+
+_translators: Dict[Tuple[str, Tuple[str, ...]], Translator] = {}
+
+
+def get_translator(domain: str, languages: Optional[List[str]], fallback: bool) -> Translator:
+    """Return a translator for the `domain` translations.
+
+    The arguments are the same as for :py:func:`gettext.translation` except
+    that the translations are read from the bundled catalogs. The translator
+    is shared by all entities resolving to the same catalogs.
+    """
+    found = tuple(CATALOGS.find(domain, languages))
+    if not found and not fallback:
+        raise FileNotFoundError(ENOENT, "No translation file found for domain", domain)
+
+    key = (domain, found)
+    try:
+        return _translators[key]
+    except KeyError:
+        pass
+
+    translations: Optional[NullTranslations] = None
+    # Chain copies of the catalogs the same way as gettext.translation() does.
+    for language in reversed(found):
+        catalog = copy(CATALOGS.load(domain, language))
+        if translations is not None:
+            catalog.add_fallback(translations)
+        translations = catalog
+    if translations is None:
+        translations = NullTranslations()
+
+    return _translators.setdefault(key, Translator(translations.gettext))
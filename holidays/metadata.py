@@ -0,0 +1,2143 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+# This file is generated by scripts/generate_metadata.py, do not edit it manually.
+
+from typing import Dict
+
+from holidays.registry import EntityMetadata
+
+COUNTRIES_METADATA: Dict[str, EntityMetadata] = {
+    "AD": {
+        "codes": ("Andorra", "AD", "AND"),
+        "default_language": None,
+        "subdivisions": ("02", "03", "04", "05", "06", "07", "08"),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "AE": {
+        "codes": ("UnitedArabEmirates", "AE", "ARE"),
+        "default_language": "ar",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("ar", "en_US"),
+        "weekend": (4, 5),
+    },
+    "AL": {
+        "codes": ("Albania", "AL", "ALB"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "AM": {
+        "codes": ("Armenia", "AM", "ARM"),
+        "default_language": "hy",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "hy"),
+        "weekend": (5, 6),
+    },
+    "AO": {
+        "codes": ("Angola", "AO", "AGO"),
+        "default_language": "pt_AO",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "pt_AO", "uk"),
+        "weekend": (5, 6),
+    },
+    "AR": {
+        "codes": ("Argentina", "AR", "ARG"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "AS": {
+        "codes": ("AmericanSamoa", "AS", "ASM", "HolidaysAS"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "unofficial"),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "AT": {
+        "codes": ("Austria", "AT", "AUT"),
+        "default_language": "de",
+        "subdivisions": ("1", "2", "3", "4", "5", "6", "7", "8", "9"),
+        "subdivisions_aliases": {
+            "B": "1",
+            "Bgld": "1",
+            "Burgenland": "1",
+            "K": "2",
+            "Ktn": "2",
+            "Kärnten": "2",
+            "N": "3",
+            "Niederösterreich": "3",
+            "NÖ": "3",
+            "O": "4",
+            "Oberösterreich": "4",
+            "OÖ": "4",
+            "S": "5",
+            "Salzburg": "5",
+            "Sbg": "5",
+            "St": "6",
+            "Steiermark": "6",
+            "Stmk": "6",
+            "T": "7",
+            "Tirol": "7",
+            "V": "8",
+            "Vbg": "8",
+            "Vorarlberg": "8",
+            "W": "9",
+            "Wien": "9",
+        },
+        "supported_categories": ("bank", "public"),
+        "supported_languages": ("de", "en_US", "uk"),
+        "weekend": (5, 6),
+    },
+    "AU": {
+        "codes": ("Australia", "AU", "AUS"),
+        "default_language": "en_AU",
+        "subdivisions": ("ACT", "NSW", "NT", "QLD", "SA", "TAS", "VIC", "WA"),
+        "subdivisions_aliases": {
+            "Australian Capital Territory": "ACT",
+            "New South Wales": "NSW",
+            "Northern Territory": "NT",
+            "Queensland": "QLD",
+            "South Australia": "SA",
+            "Tasmania": "TAS",
+            "Victoria": "VIC",
+            "Western Australia": "WA",
+        },
+        "supported_categories": ("bank", "half_day", "public"),
+        "supported_languages": ("en_AU", "en_US", "th"),
+        "weekend": (5, 6),
+    },
+    "AW": {
+        "codes": ("Aruba", "AW", "ABW"),
+        "default_language": "pap_AW",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "nl", "pap_AW", "uk"),
+        "weekend": (5, 6),
+    },
+    "AZ": {
+        "codes": ("Azerbaijan", "AZ", "AZE"),
+        "default_language": "az",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "workday"),
+        "supported_languages": ("az", "en_US", "uk"),
+        "weekend": (5, 6),
+    },
+    "BA": {
+        "codes": ("BosniaAndHerzegovina", "BA", "BIH"),
+        "default_language": "bs",
+        "subdivisions": ("BIH", "BRC", "SRP"),
+        "subdivisions_aliases": {
+            "BD": "BRC",
+            "Brčko distrikt": "BRC",
+            "FBiH": "BIH",
+            "Federacija Bosne i Hercegovine": "BIH",
+            "RS": "SRP",
+            "Republika Srpska": "SRP",
+        },
+        "supported_categories": ("public",),
+        "supported_languages": ("bs", "en_US", "sr", "uk"),
+        "weekend": (5, 6),
+    },
+    "BB": {
+        "codes": ("Barbados", "BB", "BRB"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "BD": {
+        "codes": ("Bangladesh", "BD", "BGD"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (4, 5),
+    },
+    "BE": {
+        "codes": ("Belgium", "BE", "BEL"),
+        "default_language": "nl",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("bank", "public"),
+        "supported_languages": ("de", "en_US", "fr", "nl", "uk"),
+        "weekend": (5, 6),
+    },
+    "BF": {
+        "codes": ("BurkinaFaso", "BF", "BFA"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "BG": {
+        "codes": ("Bulgaria", "BG", "BLG"),
+        "default_language": "bg",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "school"),
+        "supported_languages": ("bg", "en_US", "uk"),
+        "weekend": (5, 6),
+    },
+    "BH": {
+        "codes": ("Bahrain", "BH", "BAH"),
+        "default_language": "ar",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("ar", "en_US"),
+        "weekend": (4, 5),
+    },
+    "BI": {
+        "codes": ("Burundi", "BI", "BDI"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "BN": {
+        "codes": ("Brunei", "BN", "BRN"),
+        "default_language": "ms",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "ms", "th"),
+        "weekend": (4, 6),
+    },
+    "BO": {
+        "codes": ("Bolivia", "BO", "BOL"),
+        "default_language": "es",
+        "subdivisions": ("B", "C", "H", "L", "N", "O", "P", "S", "T"),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "BR": {
+        "codes": ("Brazil", "BR", "BRA"),
+        "default_language": None,
+        "subdivisions": (
+            "AC",
+            "AL",
+            "AM",
+            "AP",
+            "BA",
+            "CE",
+            "DF",
+            "ES",
+            "GO",
+            "MA",
+            "MG",
+            "MS",
+            "MT",
+            "PA",
+            "PB",
+            "PE",
+            "PI",
+            "PR",
+            "RJ",
+            "RN",
+            "RO",
+            "RR",
+            "RS",
+            "SC",
+            "SE",
+            "SP",
+            "TO",
+        ),
+        "subdivisions_aliases": {},
+        "supported_categories": ("optional", "public"),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "BS": {
+        "codes": ("Bahamas", "BS", "BHS"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "BW": {
+        "codes": ("Botswana", "BW", "BWA"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "BY": {
+        "codes": ("Belarus", "BY", "BLR"),
+        "default_language": "be",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("be", "en_US"),
+        "weekend": (5, 6),
+    },
+    "BZ": {
+        "codes": ("Belize", "BZ", "BLZ"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "CA": {
+        "codes": ("Canada", "CA", "CAN"),
+        "default_language": "en_CA",
+        "subdivisions": (
+            "AB",
+            "BC",
+            "MB",
+            "NB",
+            "NL",
+            "NS",
+            "NT",
+            "NU",
+            "ON",
+            "PE",
+            "QC",
+            "SK",
+            "YT",
+        ),
+        "subdivisions_aliases": {},
+        "supported_categories": ("government", "optional", "public"),
+        "supported_languages": ("ar", "en_CA", "en_US", "fr", "th"),
+        "weekend": (5, 6),
+    },
+    "CG": {
+        "codes": ("Congo", "CG", "COG"),
+        "default_language": "fr",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "fr"),
+        "weekend": (5, 6),
+    },
+    "CH": {
+        "codes": ("Switzerland", "CH", "CHE"),
+        "default_language": "de",
+        "subdivisions": (
+            "AG",
+            "AI",
+            "AR",
+            "BL",
+            "BS",
+            "BE",
+            "FR",
+            "GE",
+            "GL",
+            "GR",
+            "JU",
+            "LU",
+            "NE",
+            "NW",
+            "OW",
+            "SG",
+            "SH",
+            "SZ",
+            "SO",
+            "TG",
+            "TI",
+            "UR",
+            "VD",
+            "VS",
+            "ZG",
+            "ZH",
+        ),
+        "subdivisions_aliases": {},
+        "supported_categories": ("half_day", "optional", "public"),
+        "supported_languages": ("de", "en_US", "fr", "it", "uk"),
+        "weekend": (5, 6),
+    },
+    "CL": {
+        "codes": ("Chile", "CL", "CHL"),
+        "default_language": "es",
+        "subdivisions": (
+            "AI",
+            "AN",
+            "AP",
+            "AR",
+            "AT",
+            "BI",
+            "CO",
+            "LI",
+            "LL",
+            "LR",
+            "MA",
+            "ML",
+            "NB",
+            "RM",
+            "TA",
+            "VS",
+        ),
+        "subdivisions_aliases": {},
+        "supported_categories": ("bank", "public"),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "CM": {
+        "codes": ("Cameroon", "CM", "CMR"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "CN": {
+        "codes": ("China", "CN", "CHN"),
+        "default_language": "zh_CN",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "half_day"),
+        "supported_languages": ("en_US", "th", "zh_CN", "zh_TW"),
+        "weekend": (5, 6),
+    },
+    "CO": {
+        "codes": ("Colombia", "CO", "COL"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "CR": {
+        "codes": ("CostaRica", "CR", "CRI"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("optional", "public"),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "CU": {
+        "codes": ("Cuba", "CU", "CUB"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "CW": {
+        "codes": ("Curacao", "CW", "CUW"),
+        "default_language": "pap_CW",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("half_day", "public"),
+        "supported_languages": ("en_US", "nl", "pap_CW", "uk"),
+        "weekend": (5, 6),
+    },
+    "CY": {
+        "codes": ("Cyprus", "CY", "CYP"),
+        "default_language": "el",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("bank", "optional", "public"),
+        "supported_languages": ("el", "en_CY", "en_US", "uk"),
+        "weekend": (5, 6),
+    },
+    "CZ": {
+        "codes": ("Czechia", "CZ", "CZE"),
+        "default_language": "cs",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("cs", "en_US", "sk", "uk"),
+        "weekend": (5, 6),
+    },
+    "DE": {
+        "codes": ("Germany", "DE", "DEU"),
+        "default_language": "de",
+        "subdivisions": (
+            "BB",
+            "BE",
+            "BW",
+            "BY",
+            "HB",
+            "HE",
+            "HH",
+            "MV",
+            "NI",
+            "NW",
+            "RP",
+            "SH",
+            "SL",
+            "SN",
+            "ST",
+            "TH",
+        ),
+        "subdivisions_aliases": {
+            "Baden-Württemberg": "BW",
+            "Bayern": "BY",
+            "Berlin": "BE",
+            "Brandenburg": "BB",
+            "Bremen": "HB",
+            "Hamburg": "HH",
+            "Hessen": "HE",
+            "Mecklenburg-Vorpommern": "MV",
+            "Niedersachsen": "NI",
+            "Nordrhein-Westfalen": "NW",
+            "Rheinland-Pfalz": "RP",
+            "Saarland": "SL",
+            "Sachsen": "SN",
+            "Sachsen-Anhalt": "ST",
+            "Schleswig-Holstein": "SH",
+            "Thüringen": "TH",
+        },
+        "supported_categories": ("catholic", "public"),
+        "supported_languages": ("de", "en_US", "th", "uk"),
+        "weekend": (5, 6),
+    },
+    "DJ": {
+        "codes": ("Djibouti", "DJ", "DJI"),
+        "default_language": "fr",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("ar", "en_US", "fr"),
+        "weekend": (4, 5),
+    },
+    "DK": {
+        "codes": ("Denmark", "DK", "DNK"),
+        "default_language": "da",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("optional", "public"),
+        "supported_languages": ("da", "en_US", "uk"),
+        "weekend": (5, 6),
+    },
+    "DM": {
+        "codes": ("Dominica", "DM", "DMA"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "DO": {
+        "codes": ("DominicanRepublic", "DO", "DOM"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "DZ": {
+        "codes": ("Algeria", "DZ", "DZA"),
+        "default_language": "ar",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("ar", "en_US", "fr"),
+        "weekend": (5, 6),
+    },
+    "EC": {
+        "codes": ("Ecuador", "EC", "ECU"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "EE": {
+        "codes": ("Estonia", "EE", "EST"),
+        "default_language": "et",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "et", "uk"),
+        "weekend": (5, 6),
+    },
+    "EG": {
+        "codes": ("Egypt", "EG", "EGY"),
+        "default_language": "ar",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("ar", "en_US"),
+        "weekend": (4, 5),
+    },
+    "ES": {
+        "codes": ("Spain", "ES", "ESP"),
+        "default_language": "es",
+        "subdivisions": (
+            "AN",
+            "AR",
+            "AS",
+            "CB",
+            "CE",
+            "CL",
+            "CM",
+            "CN",
+            "CT",
+            "EX",
+            "GA",
+            "IB",
+            "MC",
+            "MD",
+            "ML",
+            "NC",
+            "PV",
+            "RI",
+            "VC",
+        ),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "ET": {
+        "codes": ("Ethiopia", "ET", "ETH"),
+        "default_language": "am",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("am", "ar", "en_US"),
+        "weekend": (5, 6),
+    },
+    "FI": {
+        "codes": ("Finland", "FI", "FIN"),
+        "default_language": "fi",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "unofficial"),
+        "supported_languages": ("en_US", "fi", "sv_FI", "uk"),
+        "weekend": (5, 6),
+    },
+    "FR": {
+        "codes": ("France", "FR", "FRA"),
+        "default_language": "fr",
+        "subdivisions": ("BL", "GES", "GP", "GY", "MF", "MQ", "NC", "PF", "RE", "WF", "YT"),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "fr", "uk"),
+        "weekend": (5, 6),
+    },
+    "GA": {
+        "codes": ("Gabon", "GA", "GAB"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "GB": {
+        "codes": ("UnitedKingdom", "GB", "GBR", "UK"),
+        "default_language": None,
+        "subdivisions": ("ENG", "NIR", "SCT", "WLS"),
+        "subdivisions_aliases": {
+            "England": "ENG",
+            "Northern Ireland": "NIR",
+            "Scotland": "SCT",
+            "Wales": "WLS",
+        },
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "GE": {
+        "codes": ("Georgia", "GE", "GEO"),
+        "default_language": "ka",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("government", "public"),
+        "supported_languages": ("en_US", "ka", "uk"),
+        "weekend": (5, 6),
+    },
+    "GH": {
+        "codes": ("Ghana", "GH", "GHA"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "GL": {
+        "codes": ("Greenland", "GL", "GRL"),
+        "default_language": "kl",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("optional", "public"),
+        "supported_languages": ("da", "en_US", "kl"),
+        "weekend": (5, 6),
+    },
+    "GR": {
+        "codes": ("Greece", "GR", "GRC"),
+        "default_language": "el",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("half_day", "public"),
+        "supported_languages": ("el", "en_US", "uk"),
+        "weekend": (5, 6),
+    },
+    "GT": {
+        "codes": ("Guatemala", "GT", "GUA"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es"),
+        "weekend": (5, 6),
+    },
+    "GU": {
+        "codes": ("Guam", "GU", "GUM", "HolidaysGU"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "unofficial"),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "HK": {
+        "codes": ("HongKong", "HK", "HKG"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("optional", "public"),
+        "supported_languages": (),
+        "weekend": (6,),
+    },
+    "HN": {
+        "codes": ("Honduras", "HN", "HND"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "HR": {
+        "codes": ("Croatia", "HR", "HRV"),
+        "default_language": "hr",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "hr", "uk"),
+        "weekend": (5, 6),
+    },
+    "HT": {
+        "codes": ("Haiti", "HT", "HTI"),
+        "default_language": "fr_HT",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("optional", "public"),
+        "supported_languages": ("en_US", "es", "fr_HT", "ht"),
+        "weekend": (5, 6),
+    },
+    "HU": {
+        "codes": ("Hungary", "HU", "HUN"),
+        "default_language": "hu",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "hu", "uk"),
+        "weekend": (5, 6),
+    },
+    "ID": {
+        "codes": ("Indonesia", "ID", "IDN"),
+        "default_language": "id",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("government", "public"),
+        "supported_languages": ("en_US", "id", "uk"),
+        "weekend": (5, 6),
+    },
+    "IE": {
+        "codes": ("Ireland", "IE", "IRL"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "IL": {
+        "codes": ("Israel", "IL", "ISR"),
+        "default_language": "he",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("optional", "public", "school"),
+        "supported_languages": ("en_US", "he", "uk"),
+        "weekend": (4, 5),
+    },
+    "IM": {
+        "codes": ("IsleOfMan", "IM", "IMN"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "IN": {
+        "codes": ("India", "IN", "IND"),
+        "default_language": None,
+        "subdivisions": (
+            "AN",
+            "AP",
+            "AR",
+            "AS",
+            "BR",
+            "CG",
+            "CH",
+            "DH",
+            "DL",
+            "GA",
+            "GJ",
+            "HP",
+            "HR",
+            "JH",
+            "JK",
+            "KA",
+            "KL",
+            "LA",
+            "LD",
+            "MH",
+            "ML",
+            "MN",
+            "MP",
+            "MZ",
+            "NL",
+            "OD",
+            "PB",
+            "PY",
+            "RJ",
+            "SK",
+            "TN",
+            "TR",
+            "TS",
+            "UK",
+            "UP",
+            "WB",
+        ),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "IR": {
+        "codes": ("Iran", "IR", "IRN"),
+        "default_language": "fa",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "fa"),
+        "weekend": (5, 6),
+    },
+    "IS": {
+        "codes": ("Iceland", "IS", "ISL"),
+        "default_language": "is",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "is", "uk"),
+        "weekend": (5, 6),
+    },
+    "IT": {
+        "codes": ("Italy", "IT", "ITA"),
+        "default_language": None,
+        "subdivisions": (
+            "AG",
+            "AL",
+            "AN",
+            "AO",
+            "AP",
+            "AQ",
+            "AR",
+            "AT",
+            "AV",
+            "BA",
+            "BG",
+            "BI",
+            "BL",
+            "BN",
+            "BO",
+            "BR",
+            "BS",
+            "BT",
+            "BZ",
+            "CA",
+            "CB",
+            "CE",
+            "CH",
+            "CL",
+            "CN",
+            "CO",
+            "CR",
+            "CS",
+            "CT",
+            "CZ",
+            "EN",
+            "FC",
+            "FE",
+            "FG",
+            "FI",
+            "FM",
+            "FR",
+            "GE",
+            "GO",
+            "GR",
+            "IM",
+            "IS",
+            "KR",
+            "LC",
+            "LE",
+            "LI",
+            "LO",
+            "LT",
+            "LU",
+            "MB",
+            "MC",
+            "ME",
+            "MI",
+            "MN",
+            "MO",
+            "MS",
+            "MT",
+            "NA",
+            "NO",
+            "NU",
+            "OR",
+            "PA",
+            "PC",
+            "PD",
+            "PE",
+            "PG",
+            "PI",
+            "PN",
+            "PO",
+            "PR",
+            "PT",
+            "PU",
+            "PV",
+            "PZ",
+            "RA",
+            "RC",
+            "RE",
+            "RG",
+            "RI",
+            "RM",
+            "RN",
+            "RO",
+            "SA",
+            "SI",
+            "SO",
+            "SP",
+            "SR",
+            "SS",
+            "SU",
+            "SV",
+            "TA",
+            "TE",
+            "TN",
+            "TO",
+            "TP",
+            "TR",
+            "TS",
+            "TV",
+            "UD",
+            "VA",
+            "VB",
+            "VC",
+            "VE",
+            "VI",
+            "VR",
+            "VT",
+            "VV",
+            "Andria",
+            "Barletta",
+            "Cesena",
+            "Forli",
+            "Pesaro",
+            "Trani",
+            "Urbino",
+        ),
+        "subdivisions_aliases": {
+            "Agrigento": "AG",
+            "Alessandria": "AL",
+            "Ancona": "AN",
+            "Aosta": "AO",
+            "Arezzo": "AR",
+            "Ascoli Piceno": "AP",
+            "Asti": "AT",
+            "Avellino": "AV",
+            "Bari": "BA",
+            "Barletta-Andria-Trani": "BT",
+            "Belluno": "BL",
+            "Benevento": "BN",
+            "Bergamo": "BG",
+            "Biella": "BI",
+            "Bologna": "BO",
+            "Bolzano": "BZ",
+            "Brescia": "BS",
+            "Brindisi": "BR",
+            "Cagliari": "CA",
+            "Caltanissetta": "CL",
+            "Campobasso": "CB",
+            "Caserta": "CE",
+            "Catania": "CT",
+            "Catanzaro": "CZ",
+            "Chieti": "CH",
+            "Como": "CO",
+            "Cosenza": "CS",
+            "Cremona": "CR",
+            "Crotone": "KR",
+            "Cuneo": "CN",
+            "Enna": "EN",
+            "Fermo": "FM",
+            "Ferrara": "FE",
+            "Firenze": "FI",
+            "Foggia": "FG",
+            "Forli-Cesena": "FC",
+            "Forlì": "Forli",
+            "Forlì-Cesena": "FC",
+            "Frosinone": "FR",
+            "Genova": "GE",
+            "Gorizia": "GO",
+            "Grosseto": "GR",
+            "Imperia": "IM",
+            "Isernia": "IS",
+            "L'Aquila": "AQ",
+            "La Spezia": "SP",
+            "Latina": "LT",
+            "Lecce": "LE",
+            "Lecco": "LC",
+            "Livorno": "LI",
+            "Lodi": "LO",
+            "Lucca": "LU",
+            "Macerata": "MC",
+            "Mantova": "MN",
+            "Massa-Carrara": "MS",
+            "Matera": "MT",
+            "Messina": "ME",
+            "Milano": "MI",
+            "Modena": "MO",
+            "Monza e Brianza": "MB",
+            "Napoli": "NA",
+            "Novara": "NO",
+            "Nuoro": "NU",
+            "Oristano": "OR",
+            "Padova": "PD",
+            "Palermo": "PA",
+            "Parma": "PR",
+            "Pavia": "PV",
+            "Perugia": "PG",
+            "Pesaro e Urbino": "PU",
+            "Pescara": "PE",
+            "Piacenza": "PC",
+            "Pisa": "PI",
+            "Pistoia": "PT",
+            "Pordenone": "PN",
+            "Potenza": "PZ",
+            "Prato": "PO",
+            "Ragusa": "RG",
+            "Ravenna": "RA",
+            "Reggio Calabria": "RC",
+            "Reggio Emilia": "RE",
+            "Rieti": "RI",
+            "Rimini": "RN",
+            "Roma": "RM",
+            "Rovigo": "RO",
+            "Salerno": "SA",
+            "Sassari": "SS",
+            "Savona": "SV",
+            "Siena": "SI",
+            "Siracusa": "SR",
+            "Sondrio": "SO",
+            "Sud Sardegna": "SU",
+            "Taranto": "TA",
+            "Teramo": "TE",
+            "Terni": "TR",
+            "Torino": "TO",
+            "Trapani": "TP",
+            "Trento": "TN",
+            "Treviso": "TV",
+            "Trieste": "TS",
+            "Udine": "UD",
+            "Varese": "VA",
+            "Venezia": "VE",
+            "Verbano-Cusio-Ossola": "VB",
+            "Vercelli": "VC",
+            "Verona": "VR",
+            "Vibo Valentia": "VV",
+            "Vicenza": "VI",
+            "Viterbo": "VT",
+        },
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "JE": {
+        "codes": ("Jersey", "JE", "JEY"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "JM": {
+        "codes": ("Jamaica", "JM", "JAM"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "JO": {
+        "codes": ("Jordan", "JO", "JOR"),
+        "default_language": "ar",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("ar", "en_US"),
+        "weekend": (5, 6),
+    },
+    "JP": {
+        "codes": ("Japan", "JP", "JPN"),
+        "default_language": "ja",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("bank", "public"),
+        "supported_languages": ("en_US", "ja", "th"),
+        "weekend": (5, 6),
+    },
+    "KE": {
+        "codes": ("Kenya", "KE", "KEN"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "KG": {
+        "codes": ("Kyrgyzstan", "KG", "KGZ"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "KH": {
+        "codes": ("Cambodia", "KH", "KHM"),
+        "default_language": "km",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "km", "th"),
+        "weekend": (5, 6),
+    },
+    "KN": {
+        "codes": ("SaintKittsAndNevis", "KN", "KNA"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("half_day", "public", "workday"),
+        "supported_languages": (),
+        "weekend": (6,),
+    },
+    "KR": {
+        "codes": ("SouthKorea", "KR", "KOR", "Korea"),
+        "default_language": "ko",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("bank", "public"),
+        "supported_languages": ("en_US", "ko", "th"),
+        "weekend": (5, 6),
+    },
+    "KW": {
+        "codes": ("Kuwait", "KW", "KWT"),
+        "default_language": "ar",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("ar", "en_US"),
+        "weekend": (5, 6),
+    },
+    "KZ": {
+        "codes": ("Kazakhstan", "KZ", "KAZ"),
+        "default_language": "kk",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "kk", "uk"),
+        "weekend": (5, 6),
+    },
+    "LA": {
+        "codes": ("Laos", "LA", "LAO"),
+        "default_language": "lo",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("bank", "public", "school", "workday"),
+        "supported_languages": ("en_US", "lo", "th"),
+        "weekend": (5, 6),
+    },
+    "LI": {
+        "codes": ("Liechtenstein", "LI", "LIE"),
+        "default_language": "de",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("bank", "public"),
+        "supported_languages": ("de", "en_US", "uk"),
+        "weekend": (5, 6),
+    },
+    "LS": {
+        "codes": ("Lesotho", "LS", "LSO"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "LT": {
+        "codes": ("Lithuania", "LT", "LTU"),
+        "default_language": "lt",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "lt", "uk"),
+        "weekend": (5, 6),
+    },
+    "LU": {
+        "codes": ("Luxembourg", "LU", "LUX"),
+        "default_language": "lb",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("de", "en_US", "fr", "lb", "uk"),
+        "weekend": (5, 6),
+    },
+    "LV": {
+        "codes": ("Latvia", "LV", "LVA"),
+        "default_language": "lv",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "lv", "uk"),
+        "weekend": (5, 6),
+    },
+    "MA": {
+        "codes": ("Morocco", "MA", "MOR"),
+        "default_language": "ar",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("ar", "en_US", "fr"),
+        "weekend": (5, 6),
+    },
+    "MC": {
+        "codes": ("Monaco", "MC", "MCO"),
+        "default_language": "fr",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "fr", "uk"),
+        "weekend": (5, 6),
+    },
+    "MD": {
+        "codes": ("Moldova", "MD", "MDA"),
+        "default_language": "ro",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "ro", "uk"),
+        "weekend": (5, 6),
+    },
+    "ME": {
+        "codes": ("Montenegro", "ME", "MNE"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "MG": {
+        "codes": ("Madagascar", "MG", "MDG"),
+        "default_language": "mg",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "mg", "uk"),
+        "weekend": (5, 6),
+    },
+    "MH": {
+        "codes": ("MarshallIslands", "MH", "MHL", "HolidaysMH"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "MK": {
+        "codes": ("NorthMacedonia", "MK", "MKD"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "MP": {
+        "codes": ("NorthernMarianaIslands", "MP", "MNP", "HolidaysMP"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "unofficial"),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "MR": {
+        "codes": ("Mauritania", "MR", "MRT"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (4, 5),
+    },
+    "MT": {
+        "codes": ("Malta", "MT", "MLT"),
+        "default_language": "mt",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "mt"),
+        "weekend": (5, 6),
+    },
+    "MV": {
+        "codes": ("Maldives", "MV", "MDV"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (4, 5),
+    },
+    "MW": {
+        "codes": ("Malawi", "MW", "MWI"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "MX": {
+        "codes": ("Mexico", "MX", "MEX"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "MY": {
+        "codes": ("Malaysia", "MY", "MYS"),
+        "default_language": "ms_MY",
+        "subdivisions": (
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "06",
+            "07",
+            "08",
+            "09",
+            "10",
+            "11",
+            "12",
+            "13",
+            "14",
+            "15",
+            "16",
+        ),
+        "subdivisions_aliases": {
+            "JHR": "01",
+            "Johor": "01",
+            "KDH": "02",
+            "KTN": "03",
+            "KUL": "14",
+            "Kedah": "02",
+            "Kelantan": "03",
+            "LBN": "15",
+            "MLK": "04",
+            "Melaka": "04",
+            "NSN": "05",
+            "Negeri Sembilan": "05",
+            "PHG": "06",
+            "PJY": "16",
+            "PLS": "09",
+            "PNG": "07",
+            "PRK": "08",
+            "Pahang": "06",
+            "Perak": "08",
+            "Perlis": "09",
+            "Pulau Pinang": "07",
+            "SBH": "12",
+            "SGR": "10",
+            "SWK": "13",
+            "Sabah": "12",
+            "Sarawak": "13",
+            "Selangor": "10",
+            "TRG": "11",
+            "Terengganu": "11",
+            "WP Kuala Lumpur": "14",
+            "WP Labuan": "15",
+            "WP Putrajaya": "16",
+        },
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "ms_MY", "th"),
+        "weekend": (5, 6),
+    },
+    "MZ": {
+        "codes": ("Mozambique", "MZ", "MOZ"),
+        "default_language": "pt_MZ",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "pt_MZ", "uk"),
+        "weekend": (5, 6),
+    },
+    "NA": {
+        "codes": ("Namibia", "NA", "NAM"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "NG": {
+        "codes": ("Nigeria", "NG", "NGA"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "NI": {
+        "codes": ("Nicaragua", "NI", "NIC"),
+        "default_language": "es",
+        "subdivisions": (
+            "AN",
+            "AS",
+            "BO",
+            "CA",
+            "CI",
+            "CO",
+            "ES",
+            "GR",
+            "JI",
+            "LE",
+            "MD",
+            "MN",
+            "MS",
+            "MT",
+            "NS",
+            "RI",
+            "SJ",
+        ),
+        "subdivisions_aliases": {
+            "Boaco": "BO",
+            "Carazo": "CA",
+            "Chinandega": "CI",
+            "Chontales": "CO",
+            "Costa Caribe Norte": "AN",
+            "Costa Caribe Sur": "AS",
+            "Estelí": "ES",
+            "Granada": "GR",
+            "Jinotega": "JI",
+            "León": "LE",
+            "Madriz": "MD",
+            "Managua": "MN",
+            "Masaya": "MS",
+            "Matagalpa": "MT",
+            "Nueva Segovia": "NS",
+            "Rivas": "RI",
+            "Río San Juan": "SJ",
+        },
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "NL": {
+        "codes": ("Netherlands", "NL", "NLD"),
+        "default_language": "nl",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("optional", "public"),
+        "supported_languages": ("en_US", "nl", "uk"),
+        "weekend": (5, 6),
+    },
+    "NO": {
+        "codes": ("Norway", "NO", "NOR"),
+        "default_language": "no",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "no", "uk"),
+        "weekend": (5, 6),
+    },
+    "NZ": {
+        "codes": ("NewZealand", "NZ", "NZL"),
+        "default_language": None,
+        "subdivisions": (
+            "AUK",
+            "BOP",
+            "CAN",
+            "CIT",
+            "GIS",
+            "HKB",
+            "MBH",
+            "MWT",
+            "NSN",
+            "NTL",
+            "OTA",
+            "STL",
+            "TAS",
+            "TKI",
+            "WGN",
+            "WKO",
+            "WTC",
+            "South Canterbury",
+        ),
+        "subdivisions_aliases": {
+            "AU": "AUK",
+            "Auckland": "AUK",
+            "BP": "BOP",
+            "Bay of Plenty": "BOP",
+            "CA": "CAN",
+            "CI": "CIT",
+            "Canterbury": "CAN",
+            "Chatham Islands": "CIT",
+            "Chatham Islands Territory": "CIT",
+            "GI": "GIS",
+            "Gisborne": "GIS",
+            "Greater Wellington": "WGN",
+            "HB": "HKB",
+            "Hawke's Bay": "HKB",
+            "MA": "MBH",
+            "MW": "MWT",
+            "Manawatū Whanganui": "MWT",
+            "Manawatū-Whanganui": "MWT",
+            "Marlborough": "MBH",
+            "NE": "NSN",
+            "NO": "NTL",
+            "Nelson": "NSN",
+            "Northland": "NTL",
+            "OT": "OTA",
+            "Otago": "OTA",
+            "SO": "STL",
+            "Southland": "STL",
+            "TK": "TKI",
+            "TS": "TAS",
+            "Taranaki": "TKI",
+            "Tasman": "TAS",
+            "Te Matau-a-Māui": "HKB",
+            "Te Pane Matua Taiao": "WGN",
+            "Te Tai o Poutini": "WTC",
+            "Te Taiao Tonga": "STL",
+            "Te Tairāwhiti": "GIS",
+            "Te Taitokerau": "NTL",
+            "Te Whanganui-a-Tara": "WGN",
+            "Te tai o Aorere": "TAS",
+            "Toi Moana": "BOP",
+            "Tāmaki-Makaurau": "AUK",
+            "WC": "WTC",
+            "WG": "WGN",
+            "WK": "WKO",
+            "Waikato": "WKO",
+            "Waitaha": "CAN",
+            "Wellington": "WGN",
+            "West Coast": "WTC",
+            "Whakatū": "NSN",
+            "Wharekauri": "CIT",
+            "Ō Tākou": "OTA",
+        },
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "PA": {
+        "codes": ("Panama", "PA", "PAN"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "PE": {
+        "codes": ("Peru", "PE", "PER"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "PG": {
+        "codes": ("PapuaNewGuinea", "PG", "PNG"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "PH": {
+        "codes": ("Philippines", "PH", "PHL"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "PK": {
+        "codes": ("Pakistan", "PK", "PAK"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "PL": {
+        "codes": ("Poland", "PL", "POL"),
+        "default_language": "pl",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "pl", "uk"),
+        "weekend": (5, 6),
+    },
+    "PR": {
+        "codes": ("PuertoRico", "PR", "PRI", "HolidaysPR"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "unofficial"),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "PT": {
+        "codes": ("Portugal", "PT", "PRT"),
+        "default_language": "pt_PT",
+        "subdivisions": (
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "06",
+            "07",
+            "08",
+            "09",
+            "10",
+            "11",
+            "12",
+            "13",
+            "14",
+            "15",
+            "16",
+            "17",
+            "18",
+            "20",
+            "30",
+        ),
+        "subdivisions_aliases": {},
+        "supported_categories": ("optional", "public"),
+        "supported_languages": ("en_US", "pt_PT", "uk"),
+        "weekend": (5, 6),
+    },
+    "PW": {
+        "codes": ("Palau", "PW", "PLW"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("armed_forces", "half_day", "public"),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "PY": {
+        "codes": ("Paraguay", "PY", "PRY"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("government", "public"),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "RO": {
+        "codes": ("Romania", "RO", "ROU"),
+        "default_language": "ro",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "ro", "uk"),
+        "weekend": (5, 6),
+    },
+    "RS": {
+        "codes": ("Serbia", "RS", "SRB"),
+        "default_language": "sr",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "sr"),
+        "weekend": (5, 6),
+    },
+    "RU": {
+        "codes": ("Russia", "RU", "RUS"),
+        "default_language": "ru",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "ru"),
+        "weekend": (5, 6),
+    },
+    "SA": {
+        "codes": ("SaudiArabia", "SA", "SAU"),
+        "default_language": "ar",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("ar", "en_US"),
+        "weekend": (5, 6),
+    },
+    "SC": {
+        "codes": ("Seychelles", "SC", "SYC"),
+        "default_language": "en_SC",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_SC", "en_US"),
+        "weekend": (5, 6),
+    },
+    "SE": {
+        "codes": ("Sweden", "SE", "SWE"),
+        "default_language": "sv",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "sv", "th", "uk"),
+        "weekend": (5, 6),
+    },
+    "SG": {
+        "codes": ("Singapore", "SG", "SGP"),
+        "default_language": "en_SG",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_SG", "en_US", "th"),
+        "weekend": (5, 6),
+    },
+    "SI": {
+        "codes": ("Slovenia", "SI", "SVN"),
+        "default_language": "sl",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "sl", "uk"),
+        "weekend": (5, 6),
+    },
+    "SK": {
+        "codes": ("Slovakia", "SK", "SVK"),
+        "default_language": "sk",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "workday"),
+        "supported_languages": ("en_US", "sk", "uk"),
+        "weekend": (5, 6),
+    },
+    "SM": {
+        "codes": ("SanMarino", "SM", "SMR"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "SV": {
+        "codes": ("ElSalvador", "SV", "SLV"),
+        "default_language": None,
+        "subdivisions": (
+            "AH",
+            "CA",
+            "CH",
+            "CU",
+            "LI",
+            "MO",
+            "PA",
+            "SA",
+            "SM",
+            "SO",
+            "SS",
+            "SV",
+            "UN",
+            "US",
+        ),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "SZ": {
+        "codes": ("Eswatini", "SZ", "SZW", "Swaziland"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "TD": {
+        "codes": ("Chad", "TD", "TCD"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "TH": {
+        "codes": ("Thailand", "TH", "THA"),
+        "default_language": "th",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": (
+            "armed_forces",
+            "bank",
+            "government",
+            "public",
+            "school",
+            "workday",
+        ),
+        "supported_languages": ("en_US", "th"),
+        "weekend": (5, 6),
+    },
+    "TL": {
+        "codes": ("TimorLeste", "TL", "TLS"),
+        "default_language": "pt_TL",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("government", "public", "workday"),
+        "supported_languages": ("en_US", "pt_TL", "tet"),
+        "weekend": (5, 6),
+    },
+    "TN": {
+        "codes": ("Tunisia", "TN", "TUN"),
+        "default_language": "ar",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("ar", "en_US"),
+        "weekend": (5, 6),
+    },
+    "TO": {
+        "codes": ("Tonga", "TO", "TON"),
+        "default_language": "to",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "to"),
+        "weekend": (5, 6),
+    },
+    "TR": {
+        "codes": ("Turkey", "TR", "TUR"),
+        "default_language": "tr",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("half_day", "public"),
+        "supported_languages": ("en_US", "tr", "uk"),
+        "weekend": (5, 6),
+    },
+    "TW": {
+        "codes": ("Taiwan", "TW", "TWN"),
+        "default_language": "zh_TW",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "th", "zh_CN", "zh_TW"),
+        "weekend": (5, 6),
+    },
+    "TZ": {
+        "codes": ("Tanzania", "TZ", "TZA"),
+        "default_language": "sw",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("bank", "public"),
+        "supported_languages": ("en_US", "sw"),
+        "weekend": (5, 6),
+    },
+    "UA": {
+        "codes": ("Ukraine", "UA", "UKR"),
+        "default_language": "uk",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "workday"),
+        "supported_languages": ("ar", "en_US", "uk"),
+        "weekend": (5, 6),
+    },
+    "UM": {
+        "codes": ("UnitedStatesMinorOutlyingIslands", "UM", "UMI", "HolidaysUM"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "unofficial"),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "US": {
+        "codes": ("UnitedStates", "US", "USA"),
+        "default_language": None,
+        "subdivisions": (
+            "AK",
+            "AL",
+            "AR",
+            "AS",
+            "AZ",
+            "CA",
+            "CO",
+            "CT",
+            "DC",
+            "DE",
+            "FL",
+            "GA",
+            "GU",
+            "HI",
+            "IA",
+            "ID",
+            "IL",
+            "IN",
+            "KS",
+            "KY",
+            "LA",
+            "MA",
+            "MD",
+            "ME",
+            "MI",
+            "MN",
+            "MO",
+            "MP",
+            "MS",
+            "MT",
+            "NC",
+            "ND",
+            "NE",
+            "NH",
+            "NJ",
+            "NM",
+            "NV",
+            "NY",
+            "OH",
+            "OK",
+            "OR",
+            "PA",
+            "PR",
+            "RI",
+            "SC",
+            "SD",
+            "TN",
+            "TX",
+            "UM",
+            "UT",
+            "VA",
+            "VI",
+            "VT",
+            "WA",
+            "WI",
+            "WV",
+            "WY",
+        ),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "unofficial"),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "UY": {
+        "codes": ("Uruguay", "UY", "URY"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("bank", "public"),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "UZ": {
+        "codes": ("Uzbekistan", "UZ", "UZB"),
+        "default_language": "uz",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "uk", "uz"),
+        "weekend": (5, 6),
+    },
+    "VA": {
+        "codes": ("VaticanCity", "VA", "VAT"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "VE": {
+        "codes": ("Venezuela", "VE", "VEN"),
+        "default_language": "es",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "es", "uk"),
+        "weekend": (5, 6),
+    },
+    "VI": {
+        "codes": ("UnitedStatesVirginIslands", "VI", "VIR", "HolidaysVI"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public", "unofficial"),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "VN": {
+        "codes": ("Vietnam", "VN", "VNM"),
+        "default_language": "vi",
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": ("en_US", "vi"),
+        "weekend": (5, 6),
+    },
+    "VU": {
+        "codes": ("Vanuatu", "VU", "VTU"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "WS": {
+        "codes": ("Samoa", "WS", "WSM"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "ZA": {
+        "codes": ("SouthAfrica", "ZA", "ZAF"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "ZM": {
+        "codes": ("Zambia", "ZM", "ZMB"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "ZW": {
+        "codes": ("Zimbabwe", "ZW", "ZWE"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+}
+
+FINANCIAL_METADATA: Dict[str, EntityMetadata] = {
+    "ECB": {
+        "codes": ("EuropeanCentralBank", "ECB", "TAR"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "IFEU": {
+        "codes": ("ICEFuturesEurope", "IFEU"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+    "NYSE": {
+        "codes": ("NewYorkStockExchange", "NYSE", "XNYS"),
+        "default_language": None,
+        "subdivisions": (),
+        "subdivisions_aliases": {},
+        "supported_categories": ("public",),
+        "supported_languages": (),
+        "weekend": (5, 6),
+    },
+}
@@ -11,17 +11,27 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
-from typing import Dict, Optional, Tuple, Set
+from typing import Any, Dict, Optional, Tuple, Set
 
 from holidays.calendars.gregorian import MON, TUE, WED, THU, FRI, SAT, SUN, _timedelta
 from holidays.holiday_base import DateArg, HolidayBase
+from holidays.l10n import HolidayName, neutral_sort_key
 
 
 class ObservedRule(Dict[int, Optional[int]]):
     __slots__ = ()
 
     def __add__(self, other):
-        return ObservedRule({**self, **other})
+        # The combined rules are shared, e.g., by all instances of an entity.
+        key = (tuple(self.items()), tuple(other.items()))
+        try:
+            return _combined_rules[key]
+        except KeyError:
+            rule = _combined_rules[key] = ObservedRule({**self, **other})
+            return rule
+
+
+_combined_rules: Dict[Tuple[Tuple[Tuple[int, Optional[int]], ...], ...], ObservedRule] = {}
 
 
 # Observance calculation rules: +7 - next workday, -7 - previous workday.
@@ -169,10 +179,16 @@ class ObservedHolidayBase(HolidayBase):
             estimated_label_text = estimated_label.strip("%s ()")
             # Use observed_estimated_label instead of observed_label for estimated dates.
             for name in (name,) if name else self.get_list(dt):
-                holiday_name = self.tr(name)
+                holiday_name: str = self.tr(name)
                 observed_estimated_label = None
                 if len(estimated_label_text) > 0 and estimated_label_text in holiday_name:
-                    holiday_name = holiday_name.replace(f"({estimated_label_text})", "").strip()
+                    holiday_name = (
+                        # Keep the estimated holiday name translatable.
+                        holiday_name.key[2][0]
+                        if isinstance(holiday_name, HolidayName)
+                        and holiday_name.key[:2] == ("%", estimated_label)
+                        else holiday_name.replace(f"({estimated_label_text})", "").strip()
+                    )
                     observed_estimated_label = self.tr(getattr(self, "observed_estimated_label"))
 
                 super()._add_holiday(
@@ -202,34 +218,43 @@ class ObservedHolidayBase(HolidayBase):
             if not self._is_observed(dt):
                 continue
             if multiple:
-                for name in self.get_list(dt):
+                # Observed dates must not depend on the holiday names language.
+                for name in sorted(self.get_list(dt), key=neutral_sort_key):
                     self._add_observed(dt, name)
             else:
                 self._add_observed(dt)
 
+    def _get_populate_plan(self) -> Dict[str, Tuple[Any, ...]]:
+        plan = super()._get_populate_plan()
+        categories = [category.lower() for category in self._sorted_categories]
+        plan["common_observed_special_holidays"] = plan["subdiv_observed_special_holidays"] = ()
+        if self.observed:
+            plan["common_observed_special_holidays"] = self._get_special_holidays_mappings(
+                f"special_{category}_holidays_observed" for category in categories
+            )
+            if self.subdiv is not None:
+                plan["subdiv_observed_special_holidays"] = self._get_special_holidays_mappings(
+                    f"special_{self._normalized_subdiv}_{category}_holidays_observed"
+                    for category in categories
+                )
+
+        return plan
+
     def _populate_common_holidays(self):
         """Populate entity common holidays."""
         super()._populate_common_holidays()
 
-        if not self.observed or not self.has_special_holidays:
-            return None
-
         self._add_special_holidays(
-            (f"special_{category}_holidays_observed" for category in self._sorted_categories),
-            observed=True,
+            self._populate_plan["common_observed_special_holidays"], observed=True
         )
 
     def _populate_subdiv_holidays(self):
         """Populate entity subdivision holidays."""
         super()._populate_subdiv_holidays()
 
-        if not self.subdiv or not self.observed or not self.has_special_holidays:
+        if not self.subdiv:
             return None
 
         self._add_special_holidays(
-            (
-                f"special_{self._normalized_subdiv}_{category}_holidays_observed"
-                for category in self._sorted_categories
-            ),
-            observed=True,
+            self._populate_plan["subdiv_observed_special_holidays"], observed=True
         )
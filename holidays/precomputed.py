@@ -0,0 +1,443 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from datetime import date
+from pathlib import Path
+from threading import Lock
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from holidays.l10n import HolidayName, Translator, format_date, join_names
+
+# Holidays of all entities, subdivisions, categories and observed settings for
+# a range of years, calculated in advance, with the holiday names stored in a
+# language-neutral form. The bundle consists of a header, a JSON index (see
+# `PrecomputedIndex`) and zlib-compressed data blocks. It's built by
+# scripts/generate_precomputed.py.
+PRECOMPUTED_FILE = "precomputed.bin"
+PRECOMPUTED_HEADER = struct.Struct("<4sI")  # Magic, index size.
+PRECOMPUTED_MAGIC = b"HLP1"
+
+# Data block header: number of years, holidays and weekend working days.
+BLOCK_HEADER = struct.Struct("<III")
+# The constructor arguments the bundle covers, entities created with any other
+# arguments (e.g. a different observed rule) are always calculated.
+SUPPORTED_ARGUMENTS = frozenset(
+    (
+        "categories",
+        "expand",
+        "language",
+        "observed",
+        "precomputed",
+        "prov",
+        "state",
+        "subdiv",
+        "years",
+    )
+)
+
+# {"years": [first, last], "entities": {class path: {
+#     "names": [offset, size],
+#     "blocks": {"subdiv|category|observed": [offset, size]},
+#     "neutral": whether all names can be translated}}}
+PrecomputedIndex = Dict[str, Any]
+# Per year offsets into the holidays arrays, the holidays as day offsets from
+# Jan 1 of the populated year and name indices, per year weekends as bitmasks,
+# per year offsets into the weekend working days array and the working days.
+BlockData = Tuple["array[int]", "array[int]", "array[int]", bytes, "array[int]", "array[int]"]
+
+
+def get_entity_path(cls: type) -> str:
+    """Return the bundle index key of an entity class."""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def get_block_key(subdiv: Optional[str], category: str, observed: bool) -> str:
+    """Return the bundle index key of a data block."""
+    return f"{subdiv or ''}|{category}|{int(observed)}"
+
+
+def dump_name(name: Any) -> Any:
+    """Return a JSON serializable language-neutral representation of a
+    holiday name (or a holiday name template argument)."""
+    if isinstance(name, HolidayName):
+        key = name.key
+        if isinstance(key, str):
+            return key
+
+        operation, *operands = key
+        if operation == "%":
+            template, args = operands
+            return ["%", dump_name(template), [dump_name(arg) for arg in args]]
+        if operation == "join":
+            return ["join", [dump_name(part) for part in operands[0]]]
+        if operation == "strftime":
+            dt, date_format = operands
+            return ["strftime", dt.toordinal(), dump_name(date_format)]
+
+        raise TypeError(f"Unsupported holiday name key: {key!r}.")
+
+    if isinstance(name, str):  # Not translatable.
+        return ["str", name]
+    if isinstance(name, (float, int)) and not isinstance(name, bool):
+        return name
+
+    raise TypeError(f"Unsupported holiday name part: {name!r}.")
+
+
+def load_name(value: Any, tr: Translator) -> Any:
+    """Build a holiday name from its :py:func:`dump_name` representation."""
+    if isinstance(value, str):
+        return tr(value)
+    if not isinstance(value, list):
+        return value
+
+    operation = value[0]
+    if operation == "%":
+        return load_name(value[1], tr) % tuple(load_name(arg, tr) for arg in value[2])
+    if operation == "join":
+        return join_names(load_name(part, tr) for part in value[1])
+    if operation == "strftime":
+        return format_date(date.fromordinal(value[1]), load_name(value[2], tr))
+
+    return value[1]
+
+
+def _to_bytes(values: "array[int]") -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, data: bytes) -> "array[int]":
+    values = array(typecode, data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def encode_block(years: Iterable[Tuple[Iterable[Tuple[int, int]], int, Iterable[int]]]) -> bytes:
+    """Encode the holidays of consecutive years.
+
+    :param years:
+        For each year: (day offset, name index) pairs of its holidays, its
+        weekend as a bitmask of weekdays and day offsets of its weekend
+        working days. Offsets are relative to Jan 1 of the year.
+    """
+    offsets = array("I", [0])
+    days = array("h")
+    name_ids = array("H")
+    weekends = bytearray()
+    workday_offsets = array("I", [0])
+    workdays = array("h")
+    for items, weekend, year_workdays in years:
+        for day, name_id in items:
+            days.append(day)
+            name_ids.append(name_id)
+        offsets.append(len(days))
+        weekends.append(weekend)
+        workdays.extend(year_workdays)
+        workday_offsets.append(len(workdays))
+
+    return zlib.compress(
+        BLOCK_HEADER.pack(len(weekends), len(days), len(workdays))
+        + b"".join(
+            _to_bytes(values) for values in (offsets, days, name_ids, workday_offsets, workdays)
+        )
+        + bytes(weekends),
+        9,
+    )
+
+
+def decode_block(data: bytes) -> BlockData:
+    """Decode a data block created by :py:func:`encode_block`."""
+    data = zlib.decompress(data)
+    n_years, n_days, n_workdays = BLOCK_HEADER.unpack_from(data)
+    result = []
+    position = BLOCK_HEADER.size
+    for typecode, length in (
+        ("I", n_years + 1),
+        ("h", n_days),
+        ("H", n_days),
+        ("I", n_years + 1),
+        ("h", n_workdays),
+    ):
+        size = array(typecode).itemsize * length
+        result.append(_from_bytes(typecode, data[position : position + size]))
+        position += size
+
+    offsets, days, name_ids, workday_offsets, workdays = result
+    return offsets, days, name_ids, data[position:], workday_offsets, workdays
+
+
+def _open_precomputed() -> IO[bytes]:
+    try:
+        from importlib.resources import files
+    except ImportError:  # Python 3.8.
+        return open(Path(__file__).with_name(PRECOMPUTED_FILE), "rb")
+
+    return (files("holidays") / PRECOMPUTED_FILE).open("rb")
+
+
+class Precomputed:
+    """The bundled precomputed holidays, loaded lazily.
+
+    Only the index is read on the first use, the names table of an entity and
+    each of its data blocks are read with a single seek when they are needed
+    for the first time.
+    """
+
+    def __init__(self, open_precomputed: Callable[[], IO[bytes]] = _open_precomputed) -> None:
+        self._open_precomputed = open_precomputed
+        self._index: Optional[PrecomputedIndex] = None
+        self._data_offset = 0
+        self._blocks: Dict[Tuple[str, str], Optional[BlockData]] = {}
+        self._names: Dict[str, List[Any]] = {}
+        self._translated_names: Dict[Tuple[str, int], Tuple[Translator, List[Any]]] = {}
+        self._lock = Lock()
+
+    @property
+    def index(self) -> PrecomputedIndex:
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._load_index()
+
+        return self._index
+
+    def _load_index(self) -> PrecomputedIndex:
+        try:
+            with self._open_precomputed() as file:
+                magic, index_size = PRECOMPUTED_HEADER.unpack(file.read(PRECOMPUTED_HEADER.size))
+                if magic != PRECOMPUTED_MAGIC:
+                    raise ValueError("Invalid precomputed holidays bundle.")
+                index = json.loads(file.read(index_size))
+        except FileNotFoundError:  # Not built.
+            return {"years": (0, -1), "entities": {}}
+
+        self._data_offset = PRECOMPUTED_HEADER.size + index_size
+        return index
+
+    def _read(self, offset: int, size: int) -> bytes:
+        with self._open_precomputed() as file:
+            file.seek(self._data_offset + offset)
+            return file.read(size)
+
+    def _get_block(self, entity_path: str, block_key: str) -> Optional[BlockData]:
+        key = (entity_path, block_key)
+        try:
+            return self._blocks[key]
+        except KeyError:
+            pass
+
+        location = self.index["entities"][entity_path]["blocks"].get(block_key)
+        block = decode_block(self._read(*location)) if location else None
+        return self._blocks.setdefault(key, block)
+
+    def _get_names(self, entity_path: str, tr: Translator) -> List[Any]:
+        # The translators are shared, so are the names built by them.
+        key = (entity_path, id(tr))
+        try:
+            return self._translated_names[key][1]
+        except KeyError:
+            pass
+
+        if entity_path not in self._names:
+            names = json.loads(
+                zlib.decompress(self._read(*self.index["entities"][entity_path]["names"]))
+            )
+            self._names.setdefault(entity_path, names)
+
+        names = [load_name(name, tr) for name in self._names[entity_path]]
+        # Keep the translator alive as long as its names are cached.
+        return self._translated_names.setdefault(key, (tr, names))[1]
+
+    def load_year(self, holidays: Any, year: int) -> bool:
+        """Add the precomputed holidays of a year to a holidays object.
+
+        :param holidays:
+            A :py:class:`holidays.holiday_base.HolidayBase` object of a
+            bundled entity class with a single category.
+
+        :param year:
+            The year to add.
+
+        :return:
+            False if the year can't be served from the bundle and needs to
+            be calculated.
+        """
+        index = self.index
+        first_year, last_year = index["years"]
+        if not first_year <= year <= last_year or len(holidays.categories) != 1:
+            return False
+
+        _, kwargs = getattr(holidays, "_init_args", ((), {}))
+        if not SUPPORTED_ARGUMENTS.issuperset(kwargs):
+            return False
+
+        entity_path = get_entity_path(holidays.__class__)
+        entity = index["entities"].get(entity_path)
+        if entity is None:
+            return False
+
+        # Names which are not translatable are only valid in the language the
+        # bundle was built with.
+        tr = holidays.tr
+        if not entity["neutral"] and tr is not holidays._get_translator(holidays.default_language):
+            return False
+
+        (category,) = holidays.categories
+        block = self._get_block(
+            entity_path, get_block_key(holidays.subdiv, category, holidays.observed)
+        )
+        if block is None:
+            return False
+
+        offsets, days, name_ids, weekends, workday_offsets, workdays = block
+        names = self._get_names(entity_path, tr)
+        year_idx = year - first_year
+        start_ordinal = date(year, 1, 1).toordinal()
+        for idx in range(offsets[year_idx], offsets[year_idx + 1]):
+            dt = date.fromordinal(start_ordinal + days[idx])
+            name = names[name_ids[idx]]
+            if dict.__contains__(holidays, dt):
+                name = join_names((dict.__getitem__(holidays, dt), name))
+            dict.__setitem__(holidays, dt, name)
+
+        weekend = {weekday for weekday in range(7) if weekends[year_idx] & 1 << weekday}
+        if weekend != holidays.weekend:
+            holidays.weekend = weekend
+        holidays.weekend_workdays.update(
+            date.fromordinal(start_ordinal + offset)
+            for offset in workdays[workday_offsets[year_idx] : workday_offsets[year_idx + 1]]
+        )
+        holidays._reset_cache()
+
+        return True
+
+
+PRECOMPUTED = Precomputed()
+
+
+def dump_entity(cls: type, years: range) -> Tuple[Dict[str, Any], List[Tuple[str, bytes]]]:
+    """Calculate the holidays of an entity for the bundle.
+
+    Each year is calculated separately in an empty object, the same way as
+    when the year is requested from an object that doesn't have any other
+    years calculated.
+
+    :param cls:
+        The entity class.
+
+    :param years:
+        The consecutive years to calculate.
+
+    :return:
+        The entity index (without the data locations) and a list of
+        (block key, block data) tuples, the first one being the names table.
+    """
+    entity = cls(expand=False)
+    names: Dict[str, int] = {}
+    dumped_names: List[Any] = []
+    neutral = True
+    blocks = []
+    for subdiv in (None, *entity.subdivisions):
+        for category in sorted(entity.supported_categories):
+            for observed in (True, False):
+                # Holidays spilling over into other years must not populate them.
+                kwargs = {"expand": False, "observed": observed, "subdiv": subdiv}
+                if len(entity.supported_categories) > 1 or category != entity.default_category:
+                    kwargs["categories"] = category
+                holidays = cls(**kwargs)
+
+                block_years = []
+                for year in years:
+                    dict.clear(holidays)
+                    holidays.weekend_workdays = set()
+                    holidays._populate(year)
+                    start_ordinal = date(year, 1, 1).toordinal()
+                    items = []
+                    for dt, name in sorted(dict.items(holidays)):
+                        dumped_name = dump_name(name)
+                        neutral = neutral and not _has_str(dumped_name)
+                        name_key = json.dumps(dumped_name, ensure_ascii=False)
+                        if name_key not in names:
+                            names[name_key] = len(dumped_names)
+                            dumped_names.append(dumped_name)
+                        items.append((dt.toordinal() - start_ordinal, names[name_key]))
+                    block_years.append(
+                        (
+                            items,
+                            sum(1 << weekday for weekday in holidays.weekend),
+                            sorted(
+                                dt.toordinal() - start_ordinal for dt in holidays.weekend_workdays
+                            ),
+                        )
+                    )
+                blocks.append(
+                    (get_block_key(subdiv, category, observed), encode_block(block_years))
+                )
+
+    names_data = zlib.compress(
+        json.dumps(dumped_names, ensure_ascii=False, separators=(",", ":")).encode(), 9
+    )
+    return {"neutral": neutral}, [("", names_data), *blocks]
+
+
+def _has_str(dumped_name: Any) -> bool:
+    if not isinstance(dumped_name, list):
+        return False
+    if dumped_name[0] == "str":
+        return True
+
+    return any(_has_str(part) for part in dumped_name[1:])
+
+
+def build_precomputed(classes: Iterable[type], years: range, map_func: Callable = map) -> bytes:
+    """Build the precomputed holidays bundle.
+
+    :param classes:
+        The entity classes to include.
+
+    :param years:
+        The consecutive years to include.
+
+    :param map_func:
+        The function used to call :py:func:`dump_entity` for all entities,
+        e.g. :py:meth:`concurrent.futures.Executor.map`.
+
+    :return:
+        The bundle data.
+    """
+    classes = list(classes)
+    index: PrecomputedIndex = {"years": [years[0], years[-1]], "entities": {}}
+    data = bytearray()
+    for cls, (entity, blocks) in zip(
+        classes, map_func(dump_entity, classes, [years] * len(classes))
+    ):
+        entity["blocks"] = {}
+        for block_key, block_data in blocks:
+            location = (len(data), len(block_data))
+            if block_key:
+                entity["blocks"][block_key] = location
+            else:
+                entity["names"] = location
+            data.extend(block_data)
+        index["entities"][get_entity_path(cls)] = entity
+
+    index_data = json.dumps(index, separators=(",", ":"), sort_keys=True).encode()
+    return PRECOMPUTED_HEADER.pack(PRECOMPUTED_MAGIC, len(index_data)) + index_data + data
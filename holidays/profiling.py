@@ -0,0 +1,239 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = ("disable", "enable", "get_stats", "is_enabled", "profile", "reset_stats")
+
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from holidays import holiday_base, l10n
+from holidays.holiday_base import HolidayBase
+from holidays.l10n import Catalogs
+from holidays.observed_holiday_base import ObservedHolidayBase
+
+# Event name -> event key -> [count, total time in seconds].
+_stats: Dict[str, Dict[Hashable, List[Any]]] = {}
+_stats_lock = Lock()
+_callback: Optional[Callable[[str, Hashable, float], None]] = None
+# (owner, attribute name, original value) of the instrumented attributes.
+_originals: List[Tuple[Any, str, Any]] = []
+
+EventStats = Dict[str, Dict[Hashable, Tuple[int, float]]]
+
+
+def _record(event: str, key: Hashable, elapsed: float) -> None:
+    with _stats_lock:
+        event_stats = _stats.setdefault(event, {})
+        if key in event_stats:
+            stat = event_stats[key]
+            stat[0] += 1
+            stat[1] += elapsed
+        else:
+            event_stats[key] = [1, elapsed]
+
+    if _callback is not None:
+        _callback(event, key, elapsed)
+
+
+def _get_entity_code(holidays: HolidayBase) -> Hashable:
+    entity_code = holidays._entity_code
+    # Holiday sums of multiple entities.
+    return tuple(entity_code) if isinstance(entity_code, list) else entity_code
+
+
+def _instrument(owner: Any, name: str, wrapper: Callable[[Callable], Callable]) -> None:
+    original = owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)
+    _originals.append((owner, name, original))
+    setattr(owner, name, wraps(original)(wrapper(original)))
+
+
+def _timed(event: str, get_key: Callable[..., Hashable]) -> Callable[[Callable], Callable]:
+    """Return a wrapper factory timing the calls as `event` events."""
+
+    def wrapper(func: Callable) -> Callable:
+        def timed_func(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(event, get_key(*args, **kwargs), perf_counter() - start)
+
+        return timed_func
+
+    return wrapper
+
+
+def _cached_catalogs_load(func: Callable) -> Callable:
+    def load(catalogs: Catalogs, domain: str, language: str):
+        if (domain, language) in catalogs._translations:
+            _record("cache_hit", "catalog", 0.0)
+            return func(catalogs, domain, language)
+
+        _record("cache_miss", "catalog", 0.0)
+        start = perf_counter()
+        try:
+            return func(catalogs, domain, language)
+        finally:
+            _record("translation_load", (domain, language), perf_counter() - start)
+
+    return load
+
+
+def _cached_get_cached(func: Callable) -> Callable:
+    def get_cached(holidays: HolidayBase, key: Tuple[Any, ...], factory: Callable) -> Any:
+        # The cache may be reset by another thread meanwhile.
+        cache = holidays._cache
+        if cache is not None and key in cache:
+            _record("cache_hit", key[0], 0.0)
+            return func(holidays, key, factory)
+
+        start = perf_counter()
+        try:
+            return func(holidays, key, factory)
+        finally:
+            _record("cache_miss", key[0], perf_counter() - start)
+
+    return get_cached
+
+
+def _cached_get_translator(func: Callable) -> Callable:
+    def get_translator(holidays: HolidayBase, language: Optional[str]):
+        translators_count = len(l10n._translators)
+        start = perf_counter()
+        try:
+            return func(holidays, language)
+        finally:
+            elapsed = perf_counter() - start
+            if len(l10n._translators) == translators_count:
+                _record("cache_hit", "translator", elapsed)
+            else:
+                _record("cache_miss", "translator", elapsed)
+
+    return get_translator
+
+
+def is_enabled() -> bool:
+    """Return whether profiling is enabled."""
+    return bool(_originals)
+
+
+def enable(callback: Optional[Callable[[str, Hashable, float], None]] = None) -> None:
+    """Enable profiling of the library hot paths in the current process.
+
+    The following events are counted and timed (their keys in parentheses):
+
+    * ``populate``: a year populated or loaded from the precomputed bundle
+      (entity code, year),
+    * ``keytransform``: a date key conversion, including the population of a
+      year it triggers (key type name),
+    * ``parse``: a date string parse (None),
+    * ``add_observed``: an observed holiday rule evaluation (entity code),
+    * ``translation_load``: a translations catalog read and parsed
+      (domain, language),
+    * ``cache_hit`` and ``cache_miss``: lookups in the translators, catalogs
+      and per-object derived data (e.g. ``busdaycalendar``) caches (cache
+      name), the miss time includes computing the value.
+
+    The instrumentation is only installed while profiling is enabled, so it
+    has no cost otherwise.
+
+    :param callback:
+        A function called with the event name, the event key and the elapsed
+        time in seconds for every event, e.g. to feed a metrics system. It's
+        called in the thread the event happened in.
+    """
+    global _callback
+
+    _callback = callback
+    if is_enabled():
+        return None
+
+    _instrument(
+        HolidayBase,
+        "_load_or_populate",
+        _timed("populate", lambda holidays, year: (_get_entity_code(holidays), year)),
+    )
+    _instrument(
+        HolidayBase,
+        "__keytransform__",
+        _timed("keytransform", lambda holidays, key: type(key).__name__),
+    )
+    _instrument(holiday_base, "parse", _timed("parse", lambda *args, **kwargs: None))
+    _instrument(
+        ObservedHolidayBase,
+        "_add_observed",
+        _timed("add_observed", lambda holidays, *args, **kwargs: _get_entity_code(holidays)),
+    )
+    _instrument(Catalogs, "load", _cached_catalogs_load)
+    _instrument(HolidayBase, "_get_cached", _cached_get_cached)
+    _instrument(HolidayBase, "_get_translator", _cached_get_translator)
+
+
+def disable() -> None:
+    """Disable profiling, the collected statistics are kept."""
+    global _callback
+
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+    _callback = None
+
+
+def get_stats() -> EventStats:
+    """Return the collected statistics.
+
+    :return:
+        A dict of event name -> {event key: (count, total time in seconds)}.
+    """
+    with _stats_lock:
+        return {
+            event: {key: (count, elapsed) for key, (count, elapsed) in event_stats.items()}
+            for event, event_stats in _stats.items()
+        }
+
+
+def reset_stats() -> None:
+    """Drop the collected statistics."""
+    with _stats_lock:
+        _stats.clear()
+
+
+@contextmanager
+def profile(
+    callback: Optional[Callable[[str, Hashable, float], None]] = None,
+) -> Iterator[EventStats]:
+    """Profile the library calls made in the context, the statistics
+    collected before are dropped.
+
+    >>> from holidays import country_holidays, profiling
+    >>> with profiling.profile() as stats:
+    ...     country_holidays("US").get("2024-07-04")
+    >>> count, elapsed = stats["populate"][("US", 2024)]
+
+    :param callback:
+        See :py:func:`enable`.
+
+    :return:
+        A dict filled with the statistics of the context (see
+        :py:func:`get_stats`) when it exits.
+    """
+    reset_stats()
+    enable(callback)
+    stats: EventStats = {}
+    try:
+        yield stats
+    finally:
+        disable()
+        stats.update(get_stats())
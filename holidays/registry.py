@@ -12,12 +12,25 @@
 
 import importlib
 from threading import RLock
-from typing import Any, Dict, Iterable, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Optional, Tuple, TypedDict, Union
 
 from holidays.holiday_base import HolidayBase
 
 RegistryDict = Dict[str, Tuple[str, ...]]
 
+
+class EntityMetadata(TypedDict):
+    """Static attributes of an entity, see `holidays.metadata`."""
+
+    codes: Tuple[str, ...]
+    default_language: Optional[str]
+    subdivisions: Tuple[str, ...]
+    subdivisions_aliases: Dict[str, str]
+    supported_categories: Tuple[str, ...]
+    supported_languages: Tuple[str, ...]
+    weekend: Tuple[int, ...]
+
+
 COUNTRIES: RegistryDict = {
     "albania": ("Albania", "AL", "ALB"),
     "algeria": ("Algeria", "DZ", "DZA"),
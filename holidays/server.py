@@ -0,0 +1,358 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = ("HolidayRequestHandler", "HolidayServer")
+
+import argparse
+import json
+import warnings
+from datetime import date
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from holidays.helpers import _normalize_arguments
+from holidays.holiday_base import HolidayBase, YearArg
+from holidays.utils import _entity_holidays
+
+# Entity code, subdivision, language, categories, observed.
+EntityKey = Tuple[str, Optional[str], Optional[str], Optional[Tuple[str, ...]], bool]
+
+
+class HolidayServer(ThreadingHTTPServer):
+    """
+    An HTTP server answering holiday queries with JSON, built on
+    :py:mod:`http.server` only.
+
+    The holidays objects are created once per entity configuration and shared
+    by all requests, so each year is calculated only once per process. Years
+    of frequently used entities can be calculated before serving the first
+    request. Connections are kept alive (HTTP/1.1) and each connection is
+    served by its own thread.
+
+    Endpoints (the query parameters ``subdiv``, ``language``, ``categories``
+    (comma separated) and ``observed`` (``0``/``1``) are accepted by all of
+    them):
+
+    * ``GET /{entity}/lookup?date=...`` (``date`` may be repeated) and
+      ``POST /{entity}/lookup`` with a JSON list of dates: the holiday name
+      and the working day flag of each date.
+    * ``GET /{entity}/holidays?start=...&end=...`` or ``?year=...``: the
+      holidays of a date range (both ends included) or of the years.
+    * ``GET /{entity}/working_days_count?start=...&end=...``: the number of
+      working days of a date range (both ends included).
+    * ``GET /{entity}/nth_working_day?date=...&n=...``: the n-th working day
+      after (or before, if n is negative) the date.
+
+    Requests spanning more than ``max_years`` years are rejected. Languages
+    the entity doesn't support fall back to its default language.
+
+    Example usage:
+
+    >>> from holidays.server import HolidayServer
+    >>> server = HolidayServer(("127.0.0.1", 8000), preload=(("US", None), ("NYSE", None)))
+    >>> server.serve_forever()
+
+    $ curl "http://127.0.0.1:8000/US/lookup?date=2024-07-04&subdiv=CA"
+    [{"date": "2024-07-04", "holiday": "Independence Day", "working_day": false}]
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        server_address: Tuple[str, int],
+        preload: Iterable[Tuple[str, Optional[str]]] = (),
+        preload_years: Optional[YearArg] = None,
+        max_batch_size: int = 10000,
+        max_years: int = 200,
+        max_entities: int = 1000,
+        verbose: bool = False,
+        bind_and_activate: bool = True,
+    ) -> None:
+        """
+        :param server_address:
+            The (host, port) address to listen on.
+
+        :param preload:
+            The (entity code, subdivision) pairs to calculate holidays for
+            before serving requests, using the default configuration.
+
+        :param preload_years:
+            The years to calculate for the preloaded entities.
+
+        :param max_batch_size:
+            The maximum number of dates of a single lookup request.
+
+        :param max_years:
+            The maximum number of years a single request may span.
+
+        :param max_entities:
+            The maximum number of entity configurations kept, the oldest one
+            is dropped when a new one is created.
+
+        :param verbose:
+            Whether to log the requests to stderr.
+
+        :param bind_and_activate:
+            See :py:class:`socketserver.TCPServer`.
+        """
+        super().__init__(server_address, HolidayRequestHandler, bind_and_activate)
+        self.max_batch_size = max_batch_size
+        self.max_entities = max_entities
+        self.max_years = max_years
+        self.verbose = verbose
+        self._holidays: Dict[EntityKey, HolidayBase] = {}
+        self._holidays_lock = Lock()
+        # Converts dates without calculating their years.
+        self._dates = HolidayBase(expand=False)
+
+        years = sorted(_normalize_arguments(int, preload_years))
+        for entity_code, subdiv in preload:
+            holidays = self.get_holidays((entity_code, subdiv, None, None, True))
+            for year in years:
+                holidays._populate_year(year)
+
+    def get_holidays(self, key: EntityKey) -> HolidayBase:
+        """Return the shared holidays object of an entity configuration."""
+        try:
+            return self._holidays[key]
+        except KeyError:
+            pass
+
+        entity_code, subdiv, language, categories, observed = key
+        if language is not None:
+            # Unsupported languages fall back to the default one, so they
+            # share its holidays object instead of adding new ones.
+            supported_languages = {
+                supported_language.lower(): supported_language
+                for supported_language in self.get_holidays(
+                    (entity_code, None, None, None, True)
+                ).supported_languages
+            }
+            supported_language = supported_languages.get(language.lower())
+            if supported_language != language:
+                return self.get_holidays(
+                    (entity_code, subdiv, supported_language, categories, observed)
+                )
+
+        # Created outside of the lock, an invalid configuration raises here.
+        holidays = _entity_holidays(
+            entity_code,
+            subdiv=subdiv,
+            language=language,
+            categories=categories,
+            observed=observed,
+        )
+        with self._holidays_lock:
+            if key not in self._holidays and len(self._holidays) >= self.max_entities:
+                del self._holidays[next(iter(self._holidays))]
+            return self._holidays.setdefault(key, holidays)
+
+
+class HolidayRequestHandler(BaseHTTPRequestHandler):
+    """Handles the :py:class:`HolidayServer` requests."""
+
+    # Responses are small, don't delay them on keep-alive connections.
+    disable_nagle_algorithm = True
+    protocol_version = "HTTP/1.1"  # Keep-alive connections.
+    server: HolidayServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._handle(None)
+
+    def do_POST(self) -> None:  # noqa: N802
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except ValueError:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Invalid JSON body."})
+            return None
+
+        self._handle(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _handle(self, body: Any) -> None:
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        path = url.path.strip("/").split("/")
+        if len(path) != 2 or path[1] not in self._actions:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path '{url.path}'."})
+            return None
+
+        entity_code, action = path
+        try:
+            holidays = self.server.get_holidays(self._get_entity_key(entity_code, params))
+            if body is not None and action != "lookup":
+                raise ValueError(f"Method POST is not supported by '{action}'.")
+            result = self._actions[action](self, holidays, params, body)
+        except (NotImplementedError, OSError, OverflowError, TypeError, ValueError) as e:
+            # Entities raise NotImplementedError without a message for the
+            # years they can't calculate holidays for.
+            error = str(e) or f"Cannot calculate holidays of '{entity_code}' for this request."
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": error})
+        else:
+            self._send_json(HTTPStatus.OK, result)
+
+    def _send_json(self, status: HTTPStatus, data: Any) -> None:
+        content = json.dumps(data, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    @staticmethod
+    def _get_entity_key(entity_code: str, params: Dict[str, List[str]]) -> EntityKey:
+        categories = params.get("categories")
+        observed = params.get("observed", ["1"])[-1]
+        if observed not in {"0", "1"}:
+            raise ValueError("Parameter 'observed' must be either 0 or 1.")
+
+        return (
+            entity_code,
+            params.get("subdiv", [None])[-1],
+            params.get("language", [None])[-1],
+            tuple(sorted(set(categories[-1].split(",")))) if categories else None,
+            observed == "1",
+        )
+
+    def _get_date_range(self, params: Dict[str, List[str]]) -> Tuple[date, date]:
+        """Return the start and end dates, the years aren't calculated if the
+        range is rejected."""
+        dates = self.server._dates
+        start = dates.__keytransform__(self._get_param(params, "start"))
+        end = dates.__keytransform__(self._get_param(params, "end"))
+        if abs(end.year - start.year) >= self.server.max_years:
+            raise ValueError(f"At most {self.server.max_years} years can be requested.")
+
+        return start, end
+
+    @staticmethod
+    def _get_param(params: Dict[str, List[str]], name: str) -> str:
+        try:
+            return params[name][-1]
+        except KeyError:
+            raise ValueError(f"Parameter '{name}' is required.")
+
+    def _lookup(
+        self, holidays: HolidayBase, params: Dict[str, List[str]], body: Any
+    ) -> List[Dict[str, Any]]:
+        values = params.get("date", []) if body is None else body
+        if not isinstance(values, list):
+            raise ValueError("The request body must be a JSON list of dates.")
+        if len(values) > self.server.max_batch_size:
+            raise ValueError(f"At most {self.server.max_batch_size} dates can be requested.")
+
+        # Converted without calculating their years, see `_get_date_range()`.
+        dates = [self.server._dates.__keytransform__(value) for value in values]
+        if len({dt.year for dt in dates}) > self.server.max_years:
+            raise ValueError(f"At most {self.server.max_years} years can be requested.")
+
+        results = []
+        for dt in dates:
+            results.append(
+                {
+                    "date": dt.isoformat(),
+                    "holiday": holidays.get(dt),
+                    "working_day": holidays.is_working_day(dt),
+                }
+            )
+
+        return results
+
+    def _holidays(
+        self, holidays: HolidayBase, params: Dict[str, List[str]], body: Any
+    ) -> List[Dict[str, str]]:
+        if "year" in params:
+            years = sorted(_normalize_arguments(int, params["year"]))
+            if len(years) > self.server.max_years:
+                raise ValueError(f"At most {self.server.max_years} years can be requested.")
+            ranges = [(date(year, 1, 1), date(year, 12, 31)) for year in years]
+        else:
+            ranges = [self._get_date_range(params)]
+
+        return [
+            {"date": dt.isoformat(), "name": name}
+            for start, end in ranges
+            for dt, name in holidays.holidays_between(start, end)
+        ]
+
+    def _working_days_count(
+        self, holidays: HolidayBase, params: Dict[str, List[str]], body: Any
+    ) -> int:
+        return holidays.get_working_days_count(*self._get_date_range(params))
+
+    def _nth_working_day(
+        self, holidays: HolidayBase, params: Dict[str, List[str]], body: Any
+    ) -> str:
+        n = int(self._get_param(params, "n"))
+        # The working days span at least as many years.
+        max_n = self.server.max_years * 365
+        if abs(n) > max_n:
+            raise ValueError(f"Parameter 'n' must be between -{max_n} and {max_n}.")
+
+        return holidays.get_nth_working_day(self._get_param(params, "date"), n).isoformat()
+
+    _actions = {
+        "holidays": _holidays,
+        "lookup": _lookup,
+        "nth_working_day": _nth_working_day,
+        "working_days_count": _working_days_count,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m holidays.server", description="Serve holiday queries over HTTP."
+    )
+    arg_parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    arg_parser.add_argument("--port", default=8000, help="Port to listen on", type=int)
+    arg_parser.add_argument(
+        "--preload",
+        default=[],
+        help="Entities to calculate holidays for on start, e.g. US US/CA NYSE",
+        nargs="+",
+    )
+    arg_parser.add_argument(
+        "--preload-years",
+        default=[],
+        help="Years to calculate for the preloaded entities, e.g. 2000-2030",
+        nargs="+",
+    )
+    arg_parser.add_argument("-v", "--verbose", action="store_true", help="Log the requests")
+    args = arg_parser.parse_args(argv)
+
+    preload_years: Set[int] = set()
+    for years in args.preload_years:
+        start, _, end = years.partition("-")
+        preload_years.update(range(int(start), int(end or start) + 1))
+
+    server = HolidayServer(
+        (args.host, args.port),
+        preload=[
+            (entity.partition("/")[0], entity.partition("/")[2] or None) for entity in args.preload
+        ],
+        preload_years=preload_years,
+        verbose=args.verbose,
+    )
+    with server:
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    main()
@@ -14,18 +14,21 @@ __all__ = (
     "country_holidays",
     "CountryHoliday",
     "financial_holidays",
+    "get_entity_metadata",
     "list_localized_countries",
     "list_localized_financial",
     "list_supported_countries",
     "list_supported_financial",
+    "populate_holidays",
 )
 
 import warnings
 from functools import lru_cache
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from holidays.holiday_base import CategoryArg, HolidayBase
-from holidays.registry import EntityLoader
+from holidays.helpers import _normalize_arguments
+from holidays.holiday_base import CategoryArg, HolidayBase, YearArg, YearsPayload
+from holidays.registry import EntityLoader, EntityMetadata
 
 
 def country_holidays(
@@ -38,6 +41,7 @@ def country_holidays(
     state: Optional[str] = None,
     language: Optional[str] = None,
     categories: Optional[CategoryArg] = None,
+    precomputed: bool = False,
 ) -> HolidayBase:
     """
     Returns a new dictionary-like :py:class:`HolidayBase` object for the public
@@ -77,6 +81,11 @@ def country_holidays(
     :param categories:
         Requested holiday categories.
 
+    :param precomputed:
+        Whether to load the holidays of the years covered by the precomputed
+        holidays bundle from it instead of calculating them (see
+        :py:mod:`holidays.precomputed`). Other years are calculated as usual.
+
     :return:
         A :py:class:`HolidayBase` object matching the **country**.
 
@@ -194,6 +203,7 @@ def country_holidays(
             state=state,
             language=language,
             categories=categories,
+            precomputed=precomputed,
         )
     except AttributeError:
         raise NotImplementedError(f"Country {country} not available")
@@ -206,6 +216,7 @@ def financial_holidays(
     expand: bool = True,
     observed: bool = True,
     language: Optional[str] = None,
+    precomputed: bool = False,
 ) -> HolidayBase:
     """
     Returns a new dictionary-like :py:class:`HolidayBase` object for the public
@@ -236,6 +247,11 @@ def financial_holidays(
         language translation is not supported the original holiday names
         will be used.
 
+    :param precomputed:
+        Whether to load the holidays of the years covered by the precomputed
+        holidays bundle from it instead of calculating them (see
+        :py:mod:`holidays.precomputed`). Other years are calculated as usual.
+
     :return:
         A :py:class:`HolidayBase` object matching the **market**.
 
@@ -256,6 +272,7 @@ def financial_holidays(
             expand=expand,
             observed=observed,
             language=language,
+            precomputed=precomputed,
         )
     except AttributeError:
         raise NotImplementedError(f"Financial market {market} not available")
@@ -282,6 +299,41 @@ def CountryHoliday(  # noqa: N802
     return country_holidays(country, subdiv, years, expand, observed, prov, state)
 
 
+@lru_cache
+def _get_metadata_index() -> Dict[str, EntityMetadata]:
+    """Map every entity code and alias to the entity metadata."""
+    from holidays.metadata import COUNTRIES_METADATA, FINANCIAL_METADATA
+
+    return {
+        code: entity_metadata
+        for metadata in (COUNTRIES_METADATA, FINANCIAL_METADATA)
+        for entity_metadata in metadata.values()
+        for code in entity_metadata["codes"]
+    }
+
+
+def get_entity_metadata(entity_code: str) -> EntityMetadata:
+    """
+    Get static attributes of a country or a financial market without
+    importing its module.
+
+    :param entity_code:
+        An ISO 3166-1 alpha-2 country code, a market code or their alias.
+
+    :return:
+        A dictionary with entity codes and aliases, default language,
+        subdivisions, subdivisions aliases, supported categories, supported
+        languages and weekend days.
+
+    :raise:
+        NotImplementedError if the entity is not supported.
+    """
+    try:
+        return _get_metadata_index()[entity_code]
+    except KeyError:
+        raise NotImplementedError(f"Entity {entity_code} not available")
+
+
 def _list_localized_entities(entity_codes: Iterable[str]) -> Dict[str, List[str]]:
     """
     Get all localized entities and languages they support.
@@ -294,14 +346,12 @@ def _list_localized_entities(entity_codes: Iterable[str]) -> Dict[str, List[str]
         value is a list of supported languages (either ISO 639-1 or a
         combination of ISO 639-1 and ISO 3166-1 codes joined with "_").
     """
-    import holidays
-
     localized_countries = {}
     for entity_code in entity_codes:
-        languages = getattr(holidays, entity_code).supported_languages
+        languages = get_entity_metadata(entity_code)["supported_languages"]
         if len(languages) == 0:
             continue
-        localized_countries[entity_code] = sorted(languages)
+        localized_countries[entity_code] = list(languages)
 
     return localized_countries
 
@@ -350,11 +400,9 @@ def _list_supported_entities(entity_codes: Iterable[str]) -> Dict[str, List[str]
         A dictionary where key is an entity code and value is a list
         of supported subdivision codes.
     """
-    import holidays
-
     return {
-        country_code: list(getattr(holidays, country_code).subdivisions)
-        for country_code in entity_codes
+        entity_code: list(get_entity_metadata(entity_code)["subdivisions"])
+        for entity_code in entity_codes
     }
 
 
@@ -386,3 +434,106 @@ def list_supported_financial(include_aliases=True) -> Dict[str, List[str]]:
         supported subdivision codes.
     """
     return _list_supported_entities(EntityLoader.get_financial_codes(include_aliases))
+
+
+def _entity_holidays(entity_code: str, **kwargs) -> HolidayBase:
+    """Return a new :py:class:`HolidayBase` object for either a country or a
+    financial market code."""
+    if entity_code in EntityLoader.get_financial_codes():
+        kwargs.pop("categories", None)
+        return financial_holidays(entity_code, **kwargs)
+
+    return country_holidays(entity_code, **kwargs)
+
+
+def _populate_years(entity_code: str, kwargs: Dict[str, Any], years: List[int]) -> YearsPayload:
+    """Calculate holidays for the years in a worker process."""
+    return _entity_holidays(entity_code, years=years, **kwargs)._dump_years(years)
+
+
+def populate_holidays(
+    jobs: Iterable[Tuple[str, Optional[str], Optional[YearArg]]],
+    observed: bool = True,
+    language: Optional[str] = None,
+    categories: Optional[CategoryArg] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 10,
+) -> List[HolidayBase]:
+    """
+    Returns new dictionary-like :py:class:`HolidayBase` objects for multiple
+    entities with their years calculated in parallel using a pool of worker
+    processes.
+
+    The years of each job are split into chunks of **chunk_size** years, which
+    are calculated by the worker processes and merged into the returned
+    objects.
+
+    :param jobs:
+        An iterable of (entity code, subdivision, years) tuples, where entity
+        code is either an ISO 3166-1 alpha-2 country code or a market code.
+
+    :param observed:
+        Whether to include the dates of when public holiday are observed.
+
+    :param language:
+        The language which the returned holiday names will be translated
+        into.
+
+    :param categories:
+        Requested holiday categories (ignored for financial markets).
+
+    :param max_workers:
+        The maximum number of worker processes (see
+        :py:class:`concurrent.futures.ProcessPoolExecutor`). If set to 1, the
+        years are calculated in the current process.
+
+    :param chunk_size:
+        The number of years calculated by a worker process at once.
+
+    :return:
+        A list of :py:class:`HolidayBase` objects in the order of **jobs**.
+
+    Example usage:
+
+    >>> from holidays import populate_holidays
+    >>> us_holidays, ca_on_holidays = populate_holidays(
+    ...     (("US", None, range(1950, 2051)), ("CA", "ON", range(1950, 2051)))
+    ... )
+
+    On platforms using the `spawn` start method (e.g. Windows or macOS) the
+    call must be guarded by ``if __name__ == "__main__":``.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be a positive integer.")
+
+    entities = []
+    tasks = []
+    for idx, (entity_code, subdiv, years) in enumerate(jobs):
+        kwargs: Dict[str, Any] = {
+            "categories": categories,
+            "language": language,
+            "observed": observed,
+            "subdiv": subdiv,
+        }
+        entities.append(_entity_holidays(entity_code, **kwargs))
+
+        sorted_years = sorted(_normalize_arguments(int, years))
+        for start in range(0, len(sorted_years), chunk_size):
+            tasks.append((idx, entity_code, kwargs, sorted_years[start : start + chunk_size]))
+
+    if max_workers == 1:
+        for idx, entity_code, kwargs, years in tasks:
+            entities[idx]._load_years(_populate_years(entity_code, kwargs, years))
+    elif tasks:
+        # Not imported at module level to keep `import holidays` light.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (idx, executor.submit(_populate_years, entity_code, kwargs, years))
+                for idx, entity_code, kwargs, years in tasks
+            ]
+            for idx, future in futures:
+                entities[idx]._load_years(future.result())
+
+    return entities
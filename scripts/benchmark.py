@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+import warnings
+from datetime import date, datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.append(f"{Path.cwd()}")  # Make holidays visible.
+
+import holidays  # noqa: E402
+from holidays import l10n  # noqa: E402
+from holidays import list_localized_countries, list_supported_countries  # noqa: E402
+
+# Runs in a fresh interpreter, prints JSON.
+IMPORT_CODE = """
+import json, sys, time
+modules = len(sys.modules)
+start = time.perf_counter()
+import holidays
+print(json.dumps({"time": time.perf_counter() - start, "modules": len(sys.modules) - modules}))
+"""
+
+# Runs in a fresh interpreter, prints JSON.
+MEMORY_CODE = """
+import json, os, sys, warnings
+warnings.simplefilter("ignore")
+
+def get_rss():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+
+import holidays
+import tracemalloc
+result = {"import": get_rss(), "countries": {}, "countries_compact": {}, "instance": {}}
+from holidays.compact import CompactHolidays
+instances = []
+tracemalloc.start()
+for country_code in sys.argv[1:]:
+    holidays.country_holidays(country_code)  # Import the module and load translations.
+    allocated = tracemalloc.get_traced_memory()[0]
+    empty_instances = [holidays.country_holidays(country_code) for _ in range(1000)]
+    result["instance"][country_code] = (tracemalloc.get_traced_memory()[0] - allocated) / 1000
+    del empty_instances
+
+    allocated = tracemalloc.get_traced_memory()[0]
+    instances.append(holidays.country_holidays(country_code, years=range(1950, 2050)))
+    result["countries"][country_code] = tracemalloc.get_traced_memory()[0] - allocated
+
+    allocated = tracemalloc.get_traced_memory()[0]
+    instances.append(
+        CompactHolidays(holidays.country_holidays(country_code, years=range(1950, 2050)))
+    )
+    result["countries_compact"][country_code] = tracemalloc.get_traced_memory()[0] - allocated
+tracemalloc.stop()
+result["total"] = get_rss()
+print(json.dumps(result))
+"""
+
+
+class Benchmark:
+    """Measures import time, memory usage, population, lookup and translation
+    performance and saves the results as JSON for comparison between commits."""
+
+    def __init__(self) -> None:
+        arg_parser = argparse.ArgumentParser()
+        arg_parser.add_argument(
+            "-c",
+            "--country",
+            action="extend",
+            nargs="+",
+            default=[],
+            help="Country codes to benchmark (all countries by default)",
+            type=str,
+        )
+        arg_parser.add_argument(
+            "-o",
+            "--output",
+            help="Path of the JSON results file (stdout by default)",
+            type=Path,
+        )
+        arg_parser.add_argument(
+            "-r",
+            "--repeat",
+            default=5,
+            help="Number of measurement repetitions, the best one is used",
+            type=int,
+        )
+        arg_parser.add_argument(
+            "--compare",
+            help="Compare the results with a previously saved results file",
+            type=Path,
+        )
+        arg_parser.add_argument(
+            "--threshold",
+            default=0.1,
+            help="Relative change reported as a regression/improvement by --compare",
+            type=float,
+        )
+        self.args = arg_parser.parse_args()
+        self.countries = self.args.country or list(list_supported_countries(include_aliases=False))
+
+    def measure(self, func: Callable[[], Any], number: int = 1) -> float:
+        """Return the best time of a single `func` call in seconds."""
+        return min(timeit.repeat(func, number=number, repeat=self.args.repeat)) / number
+
+    def run_python(self, code: str, *args: str) -> Dict[str, Any]:
+        result = subprocess.run(
+            (sys.executable, "-c", code, *args), capture_output=True, check=True, text=True
+        )
+        return json.loads(result.stdout)
+
+    def benchmark_import(self) -> Dict[str, Any]:
+        """Cold `import holidays` time and number of imported modules."""
+        results = [self.run_python(IMPORT_CODE) for _ in range(self.args.repeat)]
+        return {
+            "time": min(result["time"] for result in results),
+            "time_median": statistics.median(result["time"] for result in results),
+            "modules": results[0]["modules"],
+        }
+
+    def benchmark_memory(self) -> Dict[str, Any]:
+        """Resident memory after import and after instantiating all countries,
+        memory allocated by each country's holidays (1950-2049) stored as
+        HolidayBase and as CompactHolidays and by an empty country instance."""
+        return self.run_python(MEMORY_CODE, *self.countries)
+
+    def benchmark_populate(self) -> Dict[str, Dict[str, float]]:
+        """Population time of a single year and of 100 years per country."""
+        results = {}
+        for country_code in self.countries:
+            cls = getattr(holidays, country_code)
+            cls(years=2024)  # Warm up imports and translations.
+            results[country_code] = {
+                "1_year": self.measure(lambda: cls(years=2024)),
+                "100_years": self.measure(lambda: cls(years=range(1950, 2050))),
+            }
+
+        return results
+
+    def benchmark_lookup(self) -> Dict[str, float]:
+        """Lookup throughput (lookups per second) per supported key type."""
+        us_holidays = holidays.country_holidays("US", years=range(2000, 2030))
+        dates = [date.fromordinal(ordinal) for ordinal in range(730120, 740120, 10)]
+        keys: Dict[str, List[Any]] = {
+            "date": dates,
+            "datetime": [datetime(dt.year, dt.month, dt.day) for dt in dates],
+            "str": [dt.isoformat() for dt in dates],
+            "int": [
+                int(datetime(dt.year, dt.month, dt.day, tzinfo=timezone.utc).timestamp())
+                for dt in dates
+            ],
+            "float": [
+                datetime(dt.year, dt.month, dt.day, 12, tzinfo=timezone.utc).timestamp()
+                for dt in dates
+            ],
+        }
+
+        return {
+            key_type: len(key_list)
+            / self.measure(lambda: [key in us_holidays for key in key_list], number=10)
+            for key_type, key_list in keys.items()
+        }
+
+    def benchmark_names(self) -> Dict[str, int]:
+        """Holiday names memory usage of all countries (1950-2049) in all
+        supported languages compared to storing a separate string per
+        holiday."""
+        localized_countries = list_localized_countries(include_aliases=False)
+        names = []
+        for country_code in self.countries:
+            cls = getattr(holidays, country_code)
+            for language in localized_countries.get(country_code, (None,)):
+                names.extend(cls(years=range(1950, 2050), language=language).values())
+
+        unique_names = {id(name): name for name in names}.values()
+        return {
+            "names": len(names),
+            "unique_names": len(unique_names),
+            "unique_texts": len(set(names)),
+            "size": sum(
+                sys.getsizeof(name) + sys.getsizeof(vars(name))
+                if isinstance(name, l10n.HolidayName)
+                else sys.getsizeof(name)
+                for name in unique_names
+            ),
+            "size_unshared": sum(sys.getsizeof(str(name)) for name in names),
+        }
+
+    @staticmethod
+    def load_translation(cls, language: str) -> None:
+        # Drop the parsed catalogs and translators caches.
+        l10n.CATALOGS._translations.clear()
+        l10n._translators.clear()
+        cls(language=language)
+
+    def benchmark_translation(self) -> Dict[str, Dict[str, float]]:
+        """Translation load time per country and language."""
+        results = {}
+        localized_countries = list_localized_countries(include_aliases=False)
+        for country_code in self.countries:
+            cls = getattr(holidays, country_code)
+            results[country_code] = {
+                language: self.measure(partial(self.load_translation, cls, language))
+                for language in localized_countries.get(country_code, ())
+            }
+
+        return results
+
+    @staticmethod
+    def get_environment() -> Dict[str, Any]:
+        try:
+            commit = subprocess.run(
+                ("git", "rev-parse", "HEAD"), capture_output=True, check=True, text=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+
+        return {
+            "commit": commit,
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "holidays": holidays.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "python_implementation": platform.python_implementation(),
+        }
+
+    @staticmethod
+    def flatten(results: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+        flat = {}
+        for key, value in results.items():
+            if isinstance(value, dict):
+                flat.update(Benchmark.flatten(value, f"{prefix}{key}."))
+            elif isinstance(value, (float, int)):
+                flat[f"{prefix}{key}"] = value
+
+        return flat
+
+    def compare(self, results: Dict[str, Any]) -> None:
+        """Print metrics that changed more than the threshold."""
+        baseline = json.loads(self.args.compare.read_text())
+        old = self.flatten(baseline["results"])
+        new = self.flatten(results["results"])
+        for metric in sorted(old.keys() & new.keys()):
+            if not old[metric]:
+                continue
+            change = new[metric] / old[metric] - 1
+            if abs(change) < self.args.threshold:
+                continue
+            # Lookup throughput is the only metric where higher is better.
+            is_better = (change > 0) == metric.startswith("lookup.")
+            print(
+                f"{metric}: {old[metric]:.6g} -> {new[metric]:.6g} ({change:+.1%}, "
+                f"{'improvement' if is_better else 'regression'})",
+                file=sys.stderr,
+            )
+
+    def run(self):
+        """Runs the benchmarks."""
+        results = {
+            "environment": self.get_environment(),
+            "results": {
+                "import": self.benchmark_import(),
+                "memory": self.benchmark_memory(),
+                "populate": self.benchmark_populate(),
+                "lookup": self.benchmark_lookup(),
+                "names": self.benchmark_names(),
+                "translation": self.benchmark_translation(),
+            },
+        }
+
+        output = json.dumps(results, indent=4, sort_keys=True)
+        if self.args.output:
+            self.args.output.write_text(f"{output}\n")
+        else:
+            print(output)
+
+        if self.args.compare:
+            self.compare(results)
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    Benchmark().run()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+sys.path.append(f"{Path.cwd()}")  # Make holidays visible.
+
+import holidays  # noqa: E402
+from holidays.registry import COUNTRIES, FINANCIAL, RegistryDict  # noqa: E402
+
+HEADER = """#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+# This file is generated by scripts/generate_metadata.py, do not edit it manually.
+
+from typing import Dict
+
+from holidays.registry import EntityMetadata
+"""
+
+LINE_LENGTH = 99
+
+
+class MetadataGenerator:
+    """Creates the static metadata index of supported country/market entities."""
+
+    path = Path("holidays/metadata.py")
+
+    @staticmethod
+    def get_metadata(
+        container: RegistryDict, code_lengths: Iterable[int]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Collect metadata of each entity keyed by its primary code."""
+        metadata = {}
+        for entities in container.values():
+            code = next(entity for entity in entities if len(entity) in code_lengths)
+            cls = getattr(holidays, code).get_entity()
+            metadata[code] = {
+                "codes": entities,
+                "default_language": cls.default_language,
+                "subdivisions": tuple(cls.subdivisions),
+                "subdivisions_aliases": dict(sorted(cls.subdivisions_aliases.items())),
+                "supported_categories": tuple(cls.supported_categories),
+                "supported_languages": tuple(sorted(cls.supported_languages)),
+                "weekend": tuple(sorted(cls.weekend)),
+            }
+
+        return dict(sorted(metadata.items()))
+
+    @staticmethod
+    def format_literal(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False) if isinstance(value, str) else repr(value)
+
+    @staticmethod
+    def format_value(value: Any, indent: int, prefix: str) -> List[str]:
+        """Format a value the same way `ruff format` does."""
+        padding = " " * indent
+        if isinstance(value, dict):
+            items = [(f"{MetadataGenerator.format_literal(k)}: ", v) for k, v in value.items()]
+            brackets = "{}"
+        elif isinstance(value, tuple):
+            items = [("", v) for v in value]
+            brackets = "()"
+        else:
+            return [f"{padding}{prefix}{MetadataGenerator.format_literal(value)},"]
+
+        if not items:
+            return [f"{padding}{prefix}{brackets},"]
+
+        inline = ", ".join(
+            f"{k}{MetadataGenerator.format_literal(v)}"
+            for k, v in items
+            if not isinstance(v, (dict, tuple))
+        )
+        if len(items) == 1 and isinstance(value, tuple):
+            inline += ","
+        line = f"{padding}{prefix}{brackets[0]}{inline}{brackets[1]},"
+        if all(not isinstance(v, (dict, tuple)) for _, v in items) and len(line) <= LINE_LENGTH:
+            return [line]
+
+        lines = [f"{padding}{prefix}{brackets[0]}"]
+        for k, v in items:
+            lines.extend(MetadataGenerator.format_value(v, indent + 4, k))
+        lines.append(f"{padding}{brackets[1]},")
+
+        return lines
+
+    def render(self) -> str:
+        lines = [HEADER]
+        for name, container, code_lengths in (
+            ("COUNTRIES_METADATA", COUNTRIES, {2}),
+            ("FINANCIAL_METADATA", FINANCIAL, {3, 4}),
+        ):
+            metadata = self.get_metadata(container, code_lengths)
+            lines.append(f"{name}: Dict[str, EntityMetadata] = {{")
+            for code, entity_metadata in metadata.items():
+                lines.extend(self.format_value(entity_metadata, 4, f'"{code}": '))
+            lines.append("}")
+            lines.append("")
+
+        return "\n".join(lines)
+
+    def run(self):
+        """Runs the metadata index generation process."""
+        self.path.write_text(self.render(), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    MetadataGenerator().run()
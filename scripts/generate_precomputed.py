@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import os
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.append(f"{Path.cwd()}")  # Make holidays visible.
+
+import holidays  # noqa: E402
+from holidays.precomputed import PRECOMPUTED_FILE, build_precomputed  # noqa: E402
+from holidays.registry import EntityLoader  # noqa: E402
+
+
+class PrecomputedGenerator:
+    """Calculates holidays of all supported entities, subdivisions and
+    categories for the snapshot years and compiles them into the precomputed
+    holidays bundle."""
+
+    precomputed_path = Path("holidays") / PRECOMPUTED_FILE
+    years = range(1950, 2051)
+
+    def __init__(self) -> None:
+        arg_parser = argparse.ArgumentParser()
+        arg_parser.add_argument(
+            "-j",
+            "--jobs",
+            default=os.cpu_count(),
+            help="Number of worker processes (number of CPUs by default)",
+            type=int,
+        )
+        self.args = arg_parser.parse_args()
+
+    def run(self):
+        """Runs the precomputed holidays bundle generation process."""
+        classes = [
+            getattr(holidays, entity_code).get_entity()
+            for entity_code in (
+                *EntityLoader.get_country_codes(include_aliases=False),
+                *EntityLoader.get_financial_codes(include_aliases=False),
+            )
+        ]
+        with ProcessPoolExecutor(max_workers=self.args.jobs) as executor:
+            self.precomputed_path.write_bytes(
+                build_precomputed(classes, self.years, map_func=executor.map)
+            )
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    PrecomputedGenerator().run()
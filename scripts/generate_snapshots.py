@@ -10,23 +10,192 @@
 #           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
 #           ryanss <ryanssdev@icloud.com> (c) 2014-2017
 #  Website: https://github.com/vacanza/holidays
-#  License: MIT (see LICENSE file)
 
 import argparse
+import filecmp
+import hashlib
+import inspect
 import json
+import os
+import re
 import sys
 import warnings
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 sys.path.append(f"{Path.cwd()}")  # Make holidays visible.
 
 import holidays  # noqa: E402
 from holidays import list_supported_countries, list_supported_financial  # noqa: E402
 
+IMPORT_RE = re.compile(r"^from holidays\.(countries|financial)\.(\w+) import", re.MULTILINE)
+
+# (snapshot path, entity code, subdivision, categories)
+SnapshotTask = Tuple[str, str, Optional[str], Optional[Tuple[str, ...]]]
+# (checksum, holiday lines)
+YearSnapshot = Tuple[str, List[str]]
+# (snapshot path, whether the file was updated or the differences per year)
+SnapshotResult = Tuple[str, Union[bool, Dict[int, List[str]]]]
+
+
+def get_checksum(lines: Iterable[str]) -> str:
+    """Return the checksum of a year's holiday lines."""
+    checksum = 0
+    for line in lines:
+        checksum = zlib.crc32(line.encode(), checksum)
+
+    return f"{checksum:08x}"
+
+
+def render_years(snapshot: holidays.HolidayBase, years: range) -> Dict[int, YearSnapshot]:
+    """Render the snapshot holidays as `<date> <name>` lines grouped by year.
+
+    :return:
+        A dict of year -> (checksum, lines) tuples.
+    """
+    year_lines: Dict[int, List[str]] = {year: [] for year in years}
+    for dt, name in sorted(snapshot.items()):
+        if "\n" in name:
+            raise ValueError(f"Holiday name {name!r} is not a single line.")
+        # Holidays observed outside of the snapshot years are kept too.
+        year_lines.setdefault(dt.year, []).append(f"{dt} {name}\n")
+
+    return {year: (get_checksum(lines), lines) for year, lines in sorted(year_lines.items())}
+
+
+def render_snapshot(year_snapshots: Dict[int, YearSnapshot]) -> Iterator[str]:
+    """Render the snapshot file lines: a `# <year> <checksum>` line per year
+    followed by the year's holiday lines."""
+    for year, (checksum, lines) in year_snapshots.items():
+        yield f"# {year} {checksum}\n"
+        yield from lines
+
+
+def read_snapshot(path: Path) -> Dict[int, YearSnapshot]:
+    """Read a snapshot file without parsing its holiday lines."""
+    year_snapshots: Dict[int, YearSnapshot] = {}
+    lines: List[str] = []
+    with path.open(encoding="utf-8", newline="") as snapshot_file:
+        for line in snapshot_file:
+            if line.startswith("# "):
+                _, year, checksum = line.split()
+                lines = []
+                year_snapshots[int(year)] = (checksum, lines)
+            else:
+                lines.append(line)
+
+    return year_snapshots
+
+
+def compare_years(expected: List[str], actual: List[str]) -> List[str]:
+    """Describe the differences between the holiday lines of a year."""
+    expected_names = dict(line.rstrip("\n").split(" ", 1) for line in expected)
+    actual_names = dict(line.rstrip("\n").split(" ", 1) for line in actual)
+    differences = []
+    for dt in sorted(expected_names.keys() | actual_names.keys()):
+        expected_name = expected_names.get(dt)
+        actual_name = actual_names.get(dt)
+        if expected_name is None:
+            differences.append(f"+ {dt} {actual_name}")
+        elif actual_name is None:
+            differences.append(f"- {dt} {expected_name}")
+        elif expected_name != actual_name:
+            differences.append(f"~ {dt} {expected_name} -> {actual_name}")
+
+    return differences
+
+
+def get_year_snapshots(task: SnapshotTask, years: range) -> Dict[int, YearSnapshot]:
+    _, entity_code, subdiv, categories = task
+    return render_years(
+        holidays.country_holidays(
+            entity_code, subdiv=subdiv, years=years, categories=categories, language="en_US"
+        ),
+        years,
+    )
+
+
+def generate_snapshots(tasks: Iterable[SnapshotTask], years: range) -> List[Tuple[str, bool]]:
+    """Generate snapshot files of an entity, only the changed files are written.
+
+    The snapshot lines are streamed into a temporary file which replaces the
+    snapshot file if their contents differ.
+
+    :return:
+        A list of (snapshot path, whether the file was written) tuples.
+    """
+    warnings.simplefilter("ignore")
+    results = []
+    for task in tasks:
+        path = task[0]
+        file_path = Path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8", newline="") as tmp_file:
+            tmp_file.writelines(render_snapshot(get_year_snapshots(task, years)))
+
+        if file_path.exists() and filecmp.cmp(tmp_path, file_path, shallow=False):
+            tmp_path.unlink()
+            results.append((path, False))
+        else:
+            tmp_path.replace(file_path)
+            results.append((path, True))
+
+    return results
+
+
+def verify_snapshots(
+    tasks: Iterable[SnapshotTask], years: range
+) -> List[Tuple[str, Dict[int, List[str]]]]:
+    """Compare the snapshot files of an entity with the calculated holidays,
+    only the holiday lines of the years whose checksums differ (from the
+    calculated ones or from the checksums of the snapshot lines) are parsed
+    and compared.
+
+    :return:
+        A list of (snapshot path, {year: differences}) tuples.
+    """
+    warnings.simplefilter("ignore")
+    results = []
+    for task in tasks:
+        path = task[0]
+        file_path = Path(path)
+        expected = read_snapshot(file_path) if file_path.exists() else {}
+        actual = get_year_snapshots(task, years)
+        year_differences = {}
+        for year in sorted(expected.keys() | actual.keys()):
+            expected_checksum, expected_lines = expected.get(year, ("missing", []))
+            checksum, lines = actual.get(year, ("missing", []))
+            # The snapshot lines may have been edited without their checksum.
+            if checksum != expected_checksum or (
+                expected_lines and get_checksum(expected_lines) != expected_checksum
+            ):
+                year_differences[year] = compare_years(expected_lines, lines) or [
+                    f"checksum {expected_checksum} -> {checksum}"
+                ]
+        results.append((path, year_differences))
+
+    return results
+
 
 class SnapshotGenerator:
-    """Creates a snapshot of available holidays for supported entities."""
+    """Creates a snapshot of available holidays for supported entities.
+
+    A snapshot is a text file with a `# <year> <checksum>` line per year
+    followed by `<date> <name>` lines of the year's holidays. With `--verify`
+    the snapshots are compared with the calculated holidays instead, the
+    differences are reported per year for the years whose checksums differ.
+
+    Entities are processed in parallel by worker processes. The inputs of
+    each entity (its modules, translations and the library core files) are
+    hashed, entities whose inputs haven't changed since the last run are
+    skipped unless `--force` is used, and unchanged snapshot files are never
+    rewritten.
+    """
 
+    hashes_path = Path("snapshots/.hashes.json")
     years = range(1950, 2051)
 
     def __init__(self) -> None:
@@ -51,20 +220,77 @@ class SnapshotGenerator:
             required=False,
             type=str,
         )
+        arg_parser.add_argument(
+            "-f",
+            "--force",
+            action="store_true",
+            help="Generate snapshots even if the entity inputs haven't changed",
+        )
+        arg_parser.add_argument(
+            "-v",
+            "--verify",
+            action="store_true",
+            help="Compare the snapshots with the calculated holidays without updating them",
+        )
+        arg_parser.add_argument(
+            "-j",
+            "--jobs",
+            default=os.cpu_count(),
+            help="Number of worker processes (number of CPUs by default)",
+            type=int,
+        )
         self.args = arg_parser.parse_args()
+        self.file_hashes: Dict[Path, str] = {}
+
+    def hash_file(self, path: Path) -> str:
+        if path not in self.file_hashes:
+            self.file_hashes[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+
+        return self.file_hashes[path]
 
-    @staticmethod
-    def save(snapshot, file_path):
-        with open(file_path, "w") as output:
-            output.write(
-                json.dumps({str(dt): name for dt, name in sorted(snapshot.items())}, indent=4)
+    def get_core_hash(self) -> str:
+        """Hash of the library files all entities depend on."""
+        core_hash = hashlib.sha256(f"{self.years}".encode())
+        for path in sorted(Path("holidays").rglob("*.py")):
+            if path.parts[1] not in {"countries", "financial"}:
+                core_hash.update(f"{path}:{self.hash_file(path)}".encode())
+
+        return core_hash.hexdigest()
+
+    def get_entity_hash(self, entity_code: str, core_hash: str) -> str:
+        """Hash of the entity inputs: the modules of its classes (including
+        the modules they import from) and its translations."""
+        cls = getattr(holidays, entity_code).get_entity()
+        paths: Set[Path] = set()
+        modules = [
+            Path(inspect.getfile(base)).relative_to(Path.cwd())
+            for base in cls.__mro__
+            if base.__module__.startswith(("holidays.countries.", "holidays.financial."))
+        ]
+        while modules:
+            path = modules.pop()
+            if path in paths:
+                continue
+            paths.add(path)
+            modules.extend(
+                Path("holidays", package, f"{module}.py")
+                for package, module in IMPORT_RE.findall(path.read_text(encoding="utf-8"))
             )
-            output.write("\n")  # Get along with pre-commit.
 
-    def generate_country_snapshots(self):
-        """Generates country snapshots."""
+        for base in cls.__mro__:
+            if domain := getattr(base, "country", getattr(base, "market", None)):
+                paths.update(Path("holidays/locale").glob(f"*/LC_MESSAGES/{domain}.po"))
+
+        entity_hash = hashlib.sha256(core_hash.encode())
+        for path in sorted(paths):
+            entity_hash.update(f"{path}:{self.hash_file(path)}".encode())
+
+        return entity_hash.hexdigest()
+
+    def get_country_tasks(self) -> Dict[str, List[SnapshotTask]]:
+        """Snapshot tasks of countries."""
         if len(self.args.market) > 0:
-            return None
+            return {}
 
         country_list = self.args.country
         supported_countries = list_supported_countries()
@@ -75,26 +301,26 @@ class SnapshotGenerator:
         else:
             country_list = supported_countries
 
+        tasks = {}
         for country_code in country_list:
             country = getattr(holidays, country_code)
-
-            for subdiv in (None,) + country.subdivisions:
-                self.save(
-                    holidays.country_holidays(
-                        country_code,
-                        subdiv=subdiv,
-                        years=self.years,
-                        categories=country.supported_categories,
-                        language="en_US",
-                    ),
+            tasks[country_code] = [
+                (
                     "snapshots/countries/"
-                    f"{country_code}_{(subdiv or 'COMMON').replace(' ', '_').upper()}.json",
+                    f"{country_code}_{(subdiv or 'COMMON').replace(' ', '_').upper()}.txt",
+                    country_code,
+                    subdiv,
+                    country.supported_categories,
                 )
+                for subdiv in (None,) + country.subdivisions
+            ]
+
+        return tasks
 
-    def generate_financial_snapshots(self):
-        """Generates financial snapshots."""
+    def get_financial_tasks(self) -> Dict[str, List[SnapshotTask]]:
+        """Snapshot tasks of financial markets."""
         if len(self.args.country) > 0:
-            return None
+            return {}
 
         market_list = self.args.market
         supported_markets = list_supported_financial()
@@ -105,22 +331,85 @@ class SnapshotGenerator:
         else:
             market_list = supported_markets
 
-        for market_code in market_list:
-            self.save(
-                holidays.country_holidays(
-                    market_code,
-                    years=self.years,
-                    language="en_US",
-                ),
-                f"snapshots/financial/{market_code}.json",
+        return {
+            market_code: [(f"snapshots/financial/{market_code}.txt", market_code, None, None)]
+            for market_code in market_list
+        }
+
+    def get_state_hash(self, entity_hash: str, tasks: Iterable[SnapshotTask]) -> str:
+        """Hash of the entity inputs and of its current snapshot files."""
+        state_hash = hashlib.sha256(entity_hash.encode())
+        for path, *_ in tasks:
+            file_path = Path(path)
+            state_hash.update(
+                hashlib.sha256(file_path.read_bytes()).digest() if file_path.exists() else b"-"
             )
 
-    def run(self):
-        """Runs snapshot files generation process."""
-        self.generate_country_snapshots()
-        self.generate_financial_snapshots()
+        return state_hash.hexdigest()
+
+    def run(self) -> int:
+        """Runs snapshot files generation (or verification) process.
+
+        :return:
+            The exit status: 1 if verified snapshots differ, 0 otherwise.
+        """
+        tasks = {**self.get_country_tasks(), **self.get_financial_tasks()}
+
+        hashes: Dict[str, str] = {}
+        if self.hashes_path.exists():
+            hashes = json.loads(self.hashes_path.read_text())
+        core_hash = self.get_core_hash()
+        entity_hashes = {
+            entity_code: self.get_entity_hash(entity_code, core_hash) for entity_code in tasks
+        }
+        outdated = [
+            entity_code
+            for entity_code in tasks
+            if self.args.force
+            or hashes.get(entity_code)
+            != self.get_state_hash(entity_hashes[entity_code], tasks[entity_code])
+        ]
+
+        worker: Callable[[Iterable[SnapshotTask], range], Sequence[SnapshotResult]] = (
+            verify_snapshots if self.args.verify else generate_snapshots
+        )
+        differing_paths = 0
+        with ProcessPoolExecutor(max_workers=self.args.jobs) as executor:
+            futures: Dict[str, "Future[Sequence[SnapshotResult]]"] = {
+                entity_code: executor.submit(worker, tasks[entity_code], self.years)
+                for entity_code in outdated
+            }
+            for entity_code, future in futures.items():
+                is_up_to_date = True
+                for path, result in future.result():
+                    if isinstance(result, bool):
+                        if result:
+                            print(f"Updated {path}")
+                    elif result:
+                        is_up_to_date = False
+                        differing_paths += 1
+                        print(path)
+                        for year, differences in result.items():
+                            print(f"  {year}:")
+                            for difference in differences:
+                                print(f"    {difference}")
+
+                if is_up_to_date:
+                    hashes[entity_code] = self.get_state_hash(
+                        entity_hashes[entity_code], tasks[entity_code]
+                    )
+                else:
+                    hashes.pop(entity_code, None)
+
+        self.hashes_path.write_text(f"{json.dumps(hashes, indent=4, sort_keys=True)}\n")
+
+        if differing_paths:
+            print(f"{differing_paths} snapshot(s) differ from the calculated holidays")
+            return 1
+
+        return 0
 
 
 if __name__ == "__main__":
     warnings.simplefilter("ignore")
-    SnapshotGenerator().run()
+    sys.exit(SnapshotGenerator().run())
@@ -12,22 +12,40 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+
+import json
+import sys
 from pathlib import Path
 
 from polib import pofile
 
+sys.path.append(f"{Path.cwd()}")  # Make holidays visible.
+
+from holidays.l10n import CATALOGS_FILE, CATALOGS_HEADER, CATALOGS_MAGIC  # noqa: E402
+
 
 class MOGenerator:
-    """Creates .mo files for supported country/market entities."""
+    """Compiles translations of supported country/market entities into a single
+    bundle of .mo catalogs with an index of their offsets."""
+
+    locale_path = Path("holidays/locale")
 
     @staticmethod
     def run():
         """Runs the .mo files generation process."""
-        for po_path in Path("holidays/locale").rglob("*.po"):
-            mo_path = po_path.with_suffix(".mo")
-            if mo_path.exists():
-                mo_path.unlink()
-            pofile(po_path).save_as_mofile(mo_path)
+        index = {}
+        data = bytearray()
+        for po_path in sorted(MOGenerator.locale_path.rglob("*.po")):
+            # holidays/locale/<language>/LC_MESSAGES/<entity_code>.po
+            language = po_path.parts[-3]
+            mo_data = pofile(po_path).to_binary()
+            index.setdefault(po_path.stem, {})[language] = (len(data), len(mo_data))
+            data.extend(mo_data)
+
+        index_data = json.dumps(index, separators=(",", ":"), sort_keys=True).encode()
+        (MOGenerator.locale_path / CATALOGS_FILE).write_bytes(
+            CATALOGS_HEADER.pack(CATALOGS_MAGIC, len(index_data)) + index_data + data
+        )
 
 
 if __name__ == "__main__":